@@ -283,7 +283,7 @@ def import_from_github():
                 ))
                 imported_projects += 1
                 returned_projects.append(project)
-            except Exception as e:
+            except Exception:
                 # Skip duplicates
                 continue
         
@@ -304,7 +304,7 @@ def import_from_github():
                 ))
                 imported_skills += 1
                 returned_skills.append(skill)
-            except Exception as e:
+            except Exception:
                 # Skip duplicates
                 returned_skills.append(skill)
                 continue
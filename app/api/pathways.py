@@ -6,30 +6,16 @@ from typing import Any, Dict, List, Optional, Tuple
 from flask import Blueprint, jsonify, request
 
 from app.database import get_db_connection
-from app.services.readiness import compute_core_fit, compute_role_readiness
+from app.services.readiness import RoleSkillMatrix, compute_role_readiness, get_role_skill_matrix
+from app.services.resume_analysis.course_mapper import get_course_catalog
 from app.services.resume_analysis.roadmap import _load_roles
 from app.services.resume_analysis.utils import match_role
+from app.services.skill_matcher import SkillMatcher
 
 
 pathways_bp = Blueprint('pathways', __name__)
 
 
-def _find_matching_confidence(required_skill: str, user_skills_dict: Dict[str, float]) -> Optional[float]:
-    """Find a user's confidence for a required skill using exact or partial match."""
-    required_lower = (required_skill or '').strip().lower()
-    if not required_lower:
-        return None
-
-    if required_lower in user_skills_dict:
-        return user_skills_dict[required_lower]
-
-    for user_skill, confidence in user_skills_dict.items():
-        if required_lower in user_skill or user_skill in required_lower:
-            return confidence
-
-    return None
-
-
 def _safe_json_loads(value: Any, default: Any) -> Any:
     if value is None:
         return default
@@ -90,29 +76,9 @@ def _get_user_skill_map(user_id: str) -> Tuple[Dict[str, float], Dict[str, List[
         conn.close()
 
 
-def _get_courses_for_skill(skill: str, limit: int = 2) -> List[Dict[str, str]]:
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT platform, title, url
-            FROM courses
-            WHERE LOWER(skill) = LOWER(?)
-            LIMIT ?
-            """,
-            (skill, limit),
-        )
-        return [
-            {
-                'platform': row['platform'],
-                'title': row['title'],
-                'url': row['url'],
-            }
-            for row in cursor.fetchall()
-        ]
-    finally:
-        conn.close()
+def _get_courses_for_skill(skill: str, sector: Optional[str] = None, limit: int = 2) -> List[Dict[str, str]]:
+    """Courses for a required skill from the cached catalog (no query), sector matches first."""
+    return get_course_catalog().courses_for(skill, sector, limit)
 
 
 @pathways_bp.route('/pathways/tree', methods=['GET'])
@@ -156,6 +122,8 @@ def get_pathway_tree():
         role_requirements = roles_data[matched_role]
 
         skill_to_conf, skill_to_evidence = _get_user_skill_map(user_id)
+        # Built once and shared by the tree, readiness and every suggested role
+        skill_matcher = SkillMatcher(skill_to_conf)
 
         phases_out: List[Dict[str, Any]] = []
         complete = weak = missing = 0
@@ -166,7 +134,8 @@ def get_pathway_tree():
             skills_out: List[Dict[str, Any]] = []
 
             for skill in required_skills:
-                confidence = _find_matching_confidence(skill, skill_to_conf)
+                matched_key = skill_matcher.match(skill)
+                confidence = skill_to_conf[matched_key] if matched_key is not None else None
 
                 if confidence is None:
                     status = 'missing'
@@ -178,42 +147,35 @@ def get_pathway_tree():
                     status = 'complete'
                     complete += 1
 
-                skill_key = str(skill).strip().lower()
                 skills_out.append(
                     {
                         'name': skill,
                         'status': status,
                         'confidence': confidence,
-                        'evidence': skill_to_evidence.get(skill_key, []),
-                        'courses': _get_courses_for_skill(skill) if status != 'complete' else [],
+                        'evidence': skill_to_evidence.get(matched_key, []) if matched_key else [],
+                        'courses': _get_courses_for_skill(skill, target_sector) if status != 'complete' else [],
                     }
                 )
 
             phases_out.append({'phase': phase_name, 'skills': skills_out})
 
+        # Fit and readiness of every role (the target included) in one pass
+        role_scores = get_role_skill_matrix().score(skill_matcher)
+
         # Use a single shared definition of readiness across the app
-        readiness_stats = compute_role_readiness(role_requirements, skill_to_conf)
+        readiness_stats = role_scores.get(matched_role) or compute_role_readiness(role_requirements, skill_matcher)
 
         # "Which jobs can you get": score other roles (core-fit + projected readiness)
-        suggested_roles: List[Dict[str, Any]] = []
-        for role_name, reqs in roles_data.items():
-            core_fit = compute_core_fit(reqs, skill_to_conf)
-            if core_fit['total_required'] <= 0:
-                continue
-
-            projected = compute_role_readiness(reqs, skill_to_conf)
-            suggested_roles.append(
-                {
-                    'role': role_name,
-                    'fit_score': core_fit['fit_score'],
-                    'matched_required': core_fit['matched_required'],
-                    'total_required': core_fit['total_required'],
-                    'projected_readiness_score': projected['readiness_score'],
-                }
-            )
-
-        suggested_roles.sort(key=lambda r: r['fit_score'], reverse=True)
-        suggested_roles = suggested_roles[:5]
+        suggested_roles: List[Dict[str, Any]] = [
+            {
+                'role': role_name,
+                'fit_score': score['fit_score'],
+                'matched_required': score['matched_required'],
+                'total_required': score['total_required'],
+                'projected_readiness_score': score['readiness_score'],
+            }
+            for role_name, score in RoleSkillMatrix.top_roles(role_scores, 5)
+        ]
 
         return jsonify(
             {
@@ -4,6 +4,7 @@ from app.models.schemas import Skill
 from app.services.resume_analysis.roadmap import generate_roadmap
 from app.services.resume_analysis.course_mapper import map_courses_to_skills
 from app.services.readiness import build_skill_conf_map_from_request, compute_role_readiness
+from app.services.skill_matcher import SkillMatcher
 
 recommendations_bp = Blueprint("recommendations", __name__)
 
@@ -63,18 +64,14 @@ YOUTUBE_VIDEOS = {
     ]
 }
 
+_YOUTUBE_MATCHER = SkillMatcher(YOUTUBE_VIDEOS)
+
 def get_youtube_videos(skill: str) -> List[Dict]:
     """Get YouTube video recommendations for a skill"""
-    skill_lower = skill.lower()
-    
-    # Direct match
-    if skill_lower in YOUTUBE_VIDEOS:
-        return YOUTUBE_VIDEOS[skill_lower]
-    
-    # Partial match
-    for key, videos in YOUTUBE_VIDEOS.items():
-        if key in skill_lower or skill_lower in key:
-            return videos
+    # Direct or partial match
+    videos = _YOUTUBE_MATCHER.get(skill)
+    if videos is not None:
+        return videos
     
     # Default fallback
     return [
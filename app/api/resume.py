@@ -1,16 +1,44 @@
-from flask import Blueprint, request, jsonify
-from typing import Optional, List
+from flask import Blueprint, Response, request, jsonify, stream_with_context, url_for
+from contextlib import ExitStack
 import json
-from app.models.schemas import Skill
-from app.services.resume_analysis.extractor import extract_text
-from app.services.resume_analysis.normalizer import normalize_text
-from app.services.resume_analysis.skill_extractor import extract_skills
-from app.services.resume_analysis.scorer import score_skills
-from app.services.resume_analysis.roadmap import generate_roadmap
-from app.services.resume_analysis.course_mapper import map_courses_to_skills
+from app.services.resume_analysis.batch import BatchUploadError, collect_batch_files, stream_batch_results
+from app.services.resume_analysis.deadline import Deadline, default_time_budget
+from app.services.resume_analysis.jobs import get_job_runner
+from app.services.resume_analysis.pipeline import build_roadmap_payload
+from app.services.resume_analysis.profiles import PROFILES, UnknownProfileError, get_profile
+from app.services.resume_analysis.result_cache import cached_analyze_resume
+from app.services.resume_analysis.uploads import SpooledUpload, spool_upload
+from app.services.resume_analysis.worker_pool import JobTimeoutError, PoolBusyError
 
 bp = Blueprint("resume", __name__)
 
+def _is_async_request() -> bool:
+    value = request.args.get("async") or request.form.get("async") or ""
+    return value.strip().lower() in ("1", "true", "yes")
+
+def _requested_profile():
+    """The NLP profile named by the request (query string or form), or the deployment default."""
+    return get_profile(request.args.get("profile") or request.form.get("profile") or None).name
+
+def _request_deadline() -> Deadline:
+    """Deadline from the time_budget parameter (seconds), else RESUME_TIME_BUDGET_SECONDS."""
+    value = request.args.get("time_budget") or request.form.get("time_budget")
+    if value:
+        try:
+            return Deadline.after(float(value))
+        except ValueError:
+            pass
+    return Deadline.after(default_time_budget())
+
+def _run_pipeline(upload: SpooledUpload, profile: str, deadline: Deadline):
+    """Run (or reuse a cached run of) the resume pipeline; returns (result, error_response)."""
+    try:
+        return cached_analyze_resume(upload.path, upload.filename, profile, deadline, upload.sha256), None
+    except PoolBusyError:
+        return None, (jsonify({"error": "Resume analysis is busy, please retry shortly"}), 503)
+    except JobTimeoutError:
+        return None, (jsonify({"error": "Resume analysis timed out"}), 504)
+
 @bp.route("/extract", methods=["POST"])
 def extract_skills_only():
     if "file" not in request.files:
@@ -23,23 +51,86 @@ def extract_skills_only():
     if not file.filename.lower().endswith(('.pdf', '.docx')):
         return jsonify({"error": "File must be PDF or DOCX"}), 400
     
-    content = file.read()
+    deadline = _request_deadline()
+    try:
+        profile = _requested_profile()
+    except UnknownProfileError as e:
+        return jsonify({"error": str(e)}), 400
     
-    raw_text = extract_text(content, file.filename)
-    normalized_text = normalize_text(raw_text)
-    skills_list = extract_skills(normalized_text, raw_text)
+    # Spooled to disk: the pipeline reads the file by path instead of holding it in memory
+    with spool_upload(file) as upload:
+        result, error = _run_pipeline(upload, profile, deadline)
+    if error:
+        return error
     
     return jsonify({
-        "extracted_skills": skills_list
+        "extracted_skills": result["extracted_skills"],
+        "profile": profile,
+        "skipped_stages": result.get("skipped_stages", [])
     })
 
+@bp.route("/batch", methods=["POST"])
+def analyze_resume_batch():
+    """
+    Bulk resume analysis - upload several PDF/DOCX files and/or ZIP archives
+    under the "files" field. Streams one NDJSON line per resume
+    ({index, filename, status, skills, timings} or {..., status: "error", error})
+    as each finishes, so results arrive in completion order, not upload order.
+    """
+    files = [f for f in request.files.getlist("files") if f.filename]
+    if not files:
+        return jsonify({"error": "No files provided"}), 400
+    
+    try:
+        profile = _requested_profile()
+    except UnknownProfileError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Everything spooled here (uploads and unpacked ZIP members) is removed
+    # once the last line is streamed, or when the response is closed early
+    spooled = ExitStack()
+    try:
+        uploads = [spooled.enter_context(spool_upload(f)) for f in files]
+        entries = collect_batch_files(uploads)
+        for _, upload, _ in entries:
+            if upload is not None:
+                spooled.callback(upload.close)
+    except BatchUploadError as e:
+        spooled.close()
+        return jsonify({"error": str(e)}), 413
+    except BaseException:
+        spooled.close()
+        raise
+    
+    def generate():
+        with spooled:
+            for line in stream_batch_results(entries, profile):
+                yield json.dumps(line) + "\n"
+    
+    response = Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    response.call_on_close(spooled.close)
+    return response
+
 @bp.route("/analyze", methods=["POST"])
 def analyze_resume():
     """
     Complete resume analysis - upload file and get analysis
     Supports both file upload and pre-extracted skills
+    
+    Pass async=true (query string or form field) with a file to get a job id
+    back immediately and poll GET /jobs/<job_id> for the result, and
+    profile=fast|balanced|accurate to pick the NLP profile. time_budget (seconds)
+    bounds a synchronous analysis: optional stages are skipped to meet it and
+    listed in "skipped_stages".
     """
     
+    deadline = _request_deadline()
+    skipped_stages = []
+    try:
+        profile = _requested_profile()
+    except UnknownProfileError as e:
+        return jsonify({"error": str(e)}), 400
+    
     # Check if file is uploaded
     if "file" in request.files and request.files["file"].filename:
         file = request.files["file"]
@@ -48,18 +139,25 @@ def analyze_resume():
             return jsonify({"error": "File must be PDF or DOCX"}), 400
         
         # Extract and score skills from resume
-        content = file.read()
-        raw_text = extract_text(content, file.filename)
-        normalized_text = normalize_text(raw_text)
-        skills_list = extract_skills(normalized_text, raw_text)
-        
-        # Auto-score the extracted skills
-        scored_skills = score_skills(skills_list, raw_text)
+        with spool_upload(file) as upload:
+            if _is_async_request():
+                # The job keeps its own copy in SQLite; bind it from the mapping
+                with upload.mapped() as content:
+                    job_id = get_job_runner().submit(
+                        content, file.filename, request.form.get("target_role", "general"), profile
+                    )
+                return jsonify({
+                    "job_id": job_id,
+                    "status": "queued",
+                    "status_url": url_for("resume.get_resume_job", job_id=job_id)
+                }), 202
+            
+            result, error = _run_pipeline(upload, profile, deadline)
+        if error:
+            return error
         
-        final_skills = [
-            {"name": skill.name, "confidence": skill.confidence}
-            for skill in scored_skills
-        ]
+        final_skills = result["skills"]
+        skipped_stages = result.get("skipped_stages", [])
     
     # Or use pre-provided skills with scores
     elif request.form.get("skills_with_scores"):
@@ -97,33 +195,36 @@ def analyze_resume():
     target_role = request.form.get("target_role", "general")
     
     # Generate roadmap
-    roadmap_phases = generate_roadmap(
-        [Skill(name=s["name"], confidence=s["confidence"]) for s in final_skills],
-        target_role
-    )
-    roadmap_with_courses = map_courses_to_skills(roadmap_phases)
-    
-    roadmap_response = []
-    for phase in roadmap_with_courses:
-        roadmap_response.append({
-            "phase": phase.phase,
-            "skills": [
-                {
-                    "name": skill.name,
-                    "courses": [
-                        {
-                            "platform": course.platform,
-                            "title": course.title,
-                            "url": course.url
-                        }
-                        for course in skill.courses
-                    ]
-                }
-                for skill in phase.skills
-            ]
-        })
+    roadmap_response = build_roadmap_payload(final_skills, target_role)
     
     return jsonify({
         "skills": final_skills,
-        "roadmap": roadmap_response
+        "roadmap": roadmap_response,
+        "skipped_stages": skipped_stages
     })
+
+
+@bp.route("/profiles", methods=["GET"])
+def list_profiles():
+    """Available NLP profiles and the deployment default"""
+    return jsonify({
+        "default": get_profile().name,
+        "profiles": [
+            {
+                "name": p.name,
+                "description": p.description,
+                "spacy": p.use_spacy,
+                "keybert": p.use_keybert
+            }
+            for p in PROFILES.values()
+        ]
+    }), 200
+
+
+@bp.route("/jobs/<job_id>", methods=["GET"])
+def get_resume_job(job_id):
+    """Status, per-stage timings and (once completed) skills + roadmap of an async analysis"""
+    job = get_job_runner().get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
@@ -178,38 +178,43 @@ def bulk_add_skills(user_id):
             conn.close()
             return jsonify({"error": "User not found"}), 404
         
-        for skill in skills:
-            skill_name = skill.get('skill_name')
-            sector_context = skill.get('sector_context')
-            confidence = skill.get('confidence', 0.5)
-            source = skill.get('source', 'manual')
-            acquired_date = skill.get('acquired_date')
-            evidence = json.dumps(skill.get('evidence', []))
-
-            # 1. Try to update existing skill
-            cursor.execute("""
-                UPDATE user_skills 
-                SET confidence = ?, source = ?, evidence = ?
-                WHERE user_id = ? AND skill_name = ? AND (sector_context = ? OR (sector_context IS NULL AND ? IS NULL))
-            """, (confidence, source, evidence, user_id, skill_name, sector_context, sector_context))
-            
-            # 2. If no row was updated, insert new one
-            if cursor.rowcount == 0:
-                cursor.execute("""
-                    INSERT INTO user_skills 
-                    (user_id, skill_name, sector_context, confidence, source, acquired_date, evidence)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    user_id, skill_name, sector_context, confidence, 
-                    source, acquired_date, evidence
-                ))
-            
+        rows = [
+            (
+                user_id,
+                skill.get('skill_name'),
+                skill.get('sector_context'),
+                skill.get('confidence', 0.5),
+                skill.get('source', 'manual'),
+                skill.get('acquired_date'),
+                json.dumps(skill.get('evidence', []))
+            )
+            for skill in skills
+        ]
+        
+        # One upsert for the whole batch; the conflict target is the
+        # NULL-aware unique index (migration 4), so skills without a sector
+        # context are updated instead of duplicated
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("SELECT COUNT(*) FROM user_skills WHERE user_id = ?", (user_id,))
+        before = cursor.fetchone()[0]
+        cursor.executemany("""
+            INSERT INTO user_skills 
+            (user_id, skill_name, sector_context, confidence, source, acquired_date, evidence)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, skill_name, IFNULL(sector_context, '')) DO UPDATE SET
+                confidence = excluded.confidence, source = excluded.source, evidence = excluded.evidence
+        """, rows)
+        cursor.execute("SELECT COUNT(*) FROM user_skills WHERE user_id = ?", (user_id,))
+        inserted = cursor.fetchone()[0] - before
+        
         conn.commit()
         conn.close()
         
         return jsonify({
             "status": "success",
-            "message": f"Added {len(skills)} skills successfully"
+            "message": f"Added {inserted} and updated {len(rows) - inserted} skills successfully",
+            "inserted": inserted,
+            "updated": len(rows) - inserted
         }), 201
         
     except Exception as e:
@@ -1,13 +1,230 @@
-import sqlite3
+"""SQLite connections: a bounded pool, bound to the Flask request.
+
+Inside an app context ``get_db_connection()`` hands every caller of the same
+request one pooled connection; ``close()`` on it is a no-op and the teardown
+handler rolls back anything left uncommitted and returns it to the pool.
+Outside a request (job and batch workers) each call checks a connection out
+and ``close()`` checks it back in. Pooled connections keep their PRAGMAs and
+prepared-statement cache across requests.
+
+Configuration (environment):
+    DB_POOL_SIZE          max open pooled connections (default 8)
+    DB_POOL_TIMEOUT       seconds to wait for a free connection (default 30)
+    DB_CACHE_SIZE_KB      page cache per connection, in KiB (default 8192)
+    DB_MMAP_SIZE          bytes of the file to memory-map (default 64 MiB, 0 disables)
+    DB_BUSY_TIMEOUT_MS    how long a locked database is retried (default 30000)
+    DB_STATEMENT_CACHE    prepared statements kept per connection (default 256)
+
+The database file comes from ``Config.SQLALCHEMY_DATABASE_URI`` (env
+DATABASE_URI, default ``sqlite:///skillgenome.db``); relative paths are
+resolved from the project root.
+
+Each response carries ``Server-Timing: db-wait;dur=<ms>, db-calls;desc="<n>"``:
+the time spent waiting for the pool and how many times the request asked for
+a connection.
+"""
 import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
 
-def get_db_connection():
-    """Get database connection with proper configuration"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    db_path = os.path.join(base_dir, 'skillgenome.db')
-    
-    conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False)
+from flask import current_app, g, has_app_context
+
+from app.config import Config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def database_path(uri: str = Config.SQLALCHEMY_DATABASE_URI) -> str:
+    """File path named by a ``sqlite:///`` URI."""
+    prefix = 'sqlite:///'
+    path = uri[len(prefix):].split('?', 1)[0] if uri.startswith(prefix) else ''
+    # Pooled connections must share one database, so no :memory:
+    if not path or path == ':memory:':
+        raise ValueError(f"DATABASE_URI must name an SQLite file (sqlite:///path), got {uri!r}")
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+DB_PATH = database_path()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+class PooledConnection(sqlite3.Connection):
+    """A connection whose ``close()`` returns it to its pool."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional['ConnectionPool'] = None
+        self._checked_out = False
+        self._request_bound = False
+
+    def close(self) -> None:
+        if self._request_bound:
+            return
+        if self._pool is not None:
+            self._pool.release(self)
+        else:
+            super().close()
+
+    def discard(self) -> None:
+        self._pool = None
+        super().close()
+
+
+def connect_db(path: str = DB_PATH, factory: type = sqlite3.Connection) -> sqlite3.Connection:
+    """Open a new connection with the tuned PRAGMAs (not pooled)."""
+    conn = sqlite3.connect(
+        path,
+        timeout=_env_int('DB_BUSY_TIMEOUT_MS', 30000) / 1000.0,
+        check_same_thread=False,
+        cached_statements=_env_int('DB_STATEMENT_CACHE', 256),
+        factory=factory,
+    )
     conn.row_factory = sqlite3.Row
-    # Enable WAL mode for better concurrency
+    # WAL lets readers run while a writer commits; with it NORMAL only
+    # risks the last transactions on power loss, never corruption
     conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(f"PRAGMA busy_timeout={_env_int('DB_BUSY_TIMEOUT_MS', 30000)}")
+    conn.execute(f"PRAGMA cache_size=-{_env_int('DB_CACHE_SIZE_KB', 8192)}")
+    conn.execute(f"PRAGMA mmap_size={_env_int('DB_MMAP_SIZE', 64 * 1024 * 1024)}")
     return conn
+
+
+class ConnectionPool:
+    def __init__(self, path: str = DB_PATH, max_size: int = 8, timeout: float = 30.0):
+        self.path = path
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self._idle: Deque[PooledConnection] = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def acquire(self) -> PooledConnection:
+        started = time.perf_counter()
+        with self._cond:
+            if not self._idle and self._open >= self.max_size:
+                self.waits += 1
+                if not self._cond.wait_for(lambda: self._idle or self._open < self.max_size, self.timeout):
+                    raise sqlite3.OperationalError(f"No free database connection after {self.timeout}s")
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._open += 1
+        if conn is None:
+            try:
+                conn = connect_db(self.path, factory=PooledConnection)
+            except BaseException:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            conn._pool = self
+        conn._checked_out = True
+        waited = time.perf_counter() - started
+        with self._cond:
+            self.checkouts += 1
+            self.wait_seconds += waited
+        return conn
+
+    def release(self, conn: PooledConnection) -> None:
+        if not conn._checked_out:
+            return
+        conn._checked_out = False
+        conn._request_bound = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn.discard()
+            conn = None
+        with self._cond:
+            if conn is None:
+                self._open -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Close the idle connections; checked-out ones close on release."""
+        with self._cond:
+            while self._idle:
+                self._idle.pop().discard()
+                self._open -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'max_size': self.max_size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_ms': round(self.wait_seconds * 1000, 2),
+            }
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    max_size=_env_int('DB_POOL_SIZE', 8),
+                    timeout=_env_int('DB_POOL_TIMEOUT', 30),
+                )
+    return _pool
+
+
+def get_db_connection():
+    """Get database connection with proper configuration"""
+    # Apps that did not call init_app() have no teardown to return it
+    if not has_app_context() or 'db_pool' not in current_app.extensions:
+        return get_pool().acquire()
+
+    g.db_calls = g.get('db_calls', 0) + 1
+    conn = g.get('db_conn')
+    if conn is None:
+        started = time.perf_counter()
+        conn = get_pool().acquire()
+        g.db_wait_ms = (time.perf_counter() - started) * 1000
+        conn._request_bound = True
+        g.db_conn = conn
+    return conn
+
+
+def release_request_connection(exception: Optional[BaseException] = None) -> None:
+    conn = g.pop('db_conn', None)
+    if conn is not None:
+        conn._request_bound = False
+        conn.close()
+
+
+def _report_request_connections(response):
+    if g.get('db_calls'):
+        response.headers.add(
+            'Server-Timing', f"db-wait;dur={g.get('db_wait_ms', 0.0):.2f}, db-calls;desc=\"{g.db_calls}\""
+        )
+    return response
+
+
+def init_app(app) -> None:
+    """Bind connections to the request and report their use per response."""
+    app.extensions['db_pool'] = get_pool()
+    app.after_request(_report_request_connections)
+    app.teardown_appcontext(release_request_connection)
@@ -1,10 +1,16 @@
-import sqlite3
 import os
+import sys
+
+# Allow running as a script (python app/init_db.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import DB_PATH, connect_db
+from app.migrations import run_migrations
 
 def init_database():
     """Initialize SQLite database with schema"""
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(base_dir, '..', 'skillgenome.db')
+    db_path = DB_PATH
     schema_path = os.path.join(base_dir, 'schema.sql')
     
     print("=" * 60)
@@ -13,15 +19,11 @@ def init_database():
     print(f" Database location: {os.path.abspath(db_path)}")
     print(f" Schema file: {schema_path}")
     
-    # Read schema file
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = f.read()
-    
-    # Create database and execute schema
-    conn = sqlite3.connect(db_path)
+    # Create database and apply the schema (schema.sql is migration 1)
+    conn = connect_db(db_path)
     cursor = conn.cursor()
-    cursor.executescript(schema)
-    conn.commit()
+    applied = run_migrations(conn)
+    print(f" Migrations applied: {applied or 'none'}")
     
     # Verify tables created
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -6,17 +6,21 @@ from app.api.recommendations import recommendations_bp
 from app.api.pathways import pathways_bp
 from app.routes.gap_analysis import gap_analysis_bp
 from app.routes import auth_bp
-from app.models.database import db
+from app.config import Config
+from app.database import get_pool, init_app as init_db_pool
+from app.migrations import run_migrations, schema_status
+from app.services.model_manager import model_manager
+from app.services.reference_data import reference_data_stats
+from app.services.resume_analysis.result_cache import get_resume_cache
 import os
 
 app = Flask(__name__, template_folder='../templates')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///skillgenome.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config.from_object(Config)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-db.init_app(app)
+# The schema is migrated by an explicit startup step (start_server.py,
+# app/init_db.py or `flask --app app.main migrate`), never on import
+init_db_pool(app)
 
 # Configure CORS properly for preflight requests
 from flask_cors import CORS
@@ -53,10 +57,6 @@ app.register_blueprint(pathways_bp, url_prefix="/api")
 app.register_blueprint(gap_analysis_bp, url_prefix="/api")
 app.register_blueprint(auth_bp, url_prefix="/auth")
 
-# Initialize database tables with SQLAlchemy
-with app.app_context():
-    db.create_all()
-
 @app.route("/", methods=["GET"])
 def root():
     """Serve the test interface"""
@@ -75,6 +75,7 @@ def api_info():
             "gap_analysis": "/api/gap-analysis/<user_id>",
             "linkedin_import": "/api/import/linkedin",
             "health": "/health",
+            "readiness": "/ready",
             "test_interface": "/"
         }
     }), 200
@@ -84,7 +85,30 @@ def health():
     """Health check endpoint"""
     return jsonify({"status": "healthy"}), 200
 
+@app.cli.command("migrate")
+def migrate_command():
+    """Apply pending schema migrations to the configured database."""
+    applied = run_migrations()
+    print(f"Applied migrations: {applied or 'none'}")
+
+@app.route("/ready", methods=["GET"])
+def ready():
+    """Readiness check: NLP model load state and load times, and the schema
+    version (503 while loading or while migrations are pending)"""
+    schema = schema_status()
+    is_ready = model_manager.is_ready() and not schema["pending"]
+    status = "ready" if is_ready else ("unmigrated" if schema["pending"] else "loading")
+    return jsonify({
+        "status": status,
+        "schema": schema,
+        "models": model_manager.status(),
+        "reference_data": reference_data_stats(),
+        "resume_cache": get_resume_cache().stats(),
+        "db_pool": get_pool().stats(),
+    }), 200 if is_ready else 503
+
 if __name__ == "__main__":
+    run_migrations()
     print("=" * 60)
     print(" SkillGenome Backend Server Starting...")
     print("=" * 60)
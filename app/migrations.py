@@ -0,0 +1,257 @@
+"""Versioned schema migrations, applied at startup.
+
+Each migration runs once, inside its own ``BEGIN IMMEDIATE`` transaction (so
+several workers starting together apply it exactly once), and is recorded in
+``schema_migrations``. Statements use IF [NOT] EXISTS, so a database created
+by an older schema.sql, by a populate script or by hand converges to the same
+schema. Migration 1 is the original ``schema.sql``; add new migrations at the
+end of MIGRATIONS and never edit one that has shipped.
+
+The reference tables (roles, ontology, courses) are dropped and recreated by
+populate_comprehensive_db.py, which drops their indexes and triggers too, so
+the reference schema (the roles index, plus the ``reference_data_version``
+row and the triggers that bump it for app.services.reference_data) is
+re-ensured on every run rather than versioned; the populate script calls
+``ensure_reference_schema`` itself when it is done.
+
+Migrations run from the startup scripts (start_server.py, app/init_db.py),
+never on import; ``/ready`` reports a database with pending migrations. Run
+``python -m app.migrations`` or ``flask --app app.main migrate`` to migrate
+the configured database by hand.
+"""
+import os
+import sqlite3
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence
+
+from app.database import get_db_connection
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.sql')
+
+_MIGRATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    # Given the connection, returns the statements to run
+    statements: Callable[[sqlite3.Connection], Sequence[str]]
+
+
+def split_sql(script: str) -> List[str]:
+    """Split a SQL script into complete statements."""
+    statements: List[str] = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            buffer = ''
+            # Skip chunks that hold nothing but comments
+            if any(l.strip() and not l.strip().startswith('--') for l in statement.splitlines()):
+                statements.append(statement)
+    return statements
+
+
+def _baseline(conn: sqlite3.Connection) -> List[str]:
+    with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+        return split_sql(f.read())
+
+
+def _statements(*sql: str) -> Callable[[sqlite3.Connection], Sequence[str]]:
+    return lambda conn: sql
+
+
+def _add_columns(table: str, *columns: str) -> Callable[[sqlite3.Connection], Sequence[str]]:
+    """ALTER TABLE ... ADD COLUMN for each ``'name TYPE'`` the table lacks."""
+    def statements(conn: sqlite3.Connection) -> List[str]:
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table})').fetchall()}
+        return [f'ALTER TABLE {table} ADD COLUMN {column}' for column in columns
+                if column.split()[0] not in existing]
+    return statements
+
+
+MIGRATIONS = (
+    Migration(1, 'baseline schema.sql', _baseline),
+    Migration(2, 'reference tables', _statements(
+        """
+        CREATE TABLE IF NOT EXISTS roles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            role_name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            skill TEXT NOT NULL,
+            sector TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS ontology (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            skill TEXT NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS courses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            skill TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            sector TEXT
+        )
+        """,
+    )),
+    Migration(3, 'per-user composite indexes', _statements(
+        # "Latest analyses of a user" reads the index in order, no sort; the
+        # separate user_id and analysis_date indexes it replaces are dropped
+        'CREATE INDEX IF NOT EXISTS idx_gap_analysis_user_date ON skill_gap_analysis(user_id, analysis_date DESC)',
+        'DROP INDEX IF EXISTS idx_gap_analysis_user',
+        'DROP INDEX IF EXISTS idx_gap_analysis_date',
+        'CREATE INDEX IF NOT EXISTS idx_user_skills_user_confidence ON user_skills(user_id, confidence DESC, created_at DESC)',
+        'DROP INDEX IF EXISTS idx_user_skills_user',
+        'CREATE INDEX IF NOT EXISTS idx_user_courses_user_completed ON user_courses(user_id, completion_date DESC)',
+        'DROP INDEX IF EXISTS idx_user_courses_user',
+        'CREATE INDEX IF NOT EXISTS idx_user_projects_user_completed ON user_projects(user_id, date_completed DESC)',
+        'DROP INDEX IF EXISTS idx_user_projects_user',
+        'CREATE INDEX IF NOT EXISTS idx_users_created ON users(created_at DESC)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_cache_created ON resume_analysis_cache(created_at DESC)',
+    )),
+    Migration(4, 'NULL-aware unique user skills', _statements(
+        # UNIQUE(user_id, skill_name, sector_context) never fires for a NULL
+        # sector, so duplicates could pile up; keep the newest of each and
+        # make the bulk upsert's conflict target treat NULL as ''
+        """
+        DELETE FROM user_skills WHERE EXISTS (
+            SELECT 1 FROM user_skills AS newer
+            WHERE newer.user_id = user_skills.user_id
+              AND newer.skill_name = user_skills.skill_name
+              AND IFNULL(newer.sector_context, '') = IFNULL(user_skills.sector_context, '')
+              AND newer.id > user_skills.id
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_user_skills_unique_sector"
+        " ON user_skills(user_id, skill_name, IFNULL(sector_context, ''))",
+    )),
+    # resume_jobs tables created before NLP profiles lack ``profile``; owner
+    # and heartbeat (epoch seconds) form the lease a worker holds on a job
+    Migration(5, 'resume job leases', _add_columns(
+        'resume_jobs', 'profile VARCHAR(20)', 'owner VARCHAR(100)', 'heartbeat REAL',
+    )),
+)
+
+REFERENCE_TABLES = ('ontology', 'roles', 'courses')
+REFERENCE_TRIGGERS = tuple(
+    f'trg_{table}_{event}_refversion'
+    for table in REFERENCE_TABLES
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS trg_{table}_{event}_refversion
+AFTER {event} ON {table}
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END
+"""
+
+
+def _reference_schema() -> List[str]:
+    statements = [
+        'CREATE INDEX IF NOT EXISTS idx_roles_role_name ON roles(role_name)',
+        """
+        CREATE TABLE IF NOT EXISTS reference_data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        'INSERT OR IGNORE INTO reference_data_version (id, version) VALUES (1, 0)',
+    ]
+    for table in REFERENCE_TABLES:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            statements.append(_TRIGGER_SQL.format(table=table, event=event))
+    return statements
+
+
+def ensure_reference_schema(conn: sqlite3.Connection) -> None:
+    """(Re)create the reference index, version row and triggers; the caller commits."""
+    for statement in _reference_schema():
+        conn.execute(statement)
+
+
+def applied_versions(conn: sqlite3.Connection) -> List[int]:
+    conn.execute(_MIGRATIONS_TABLE_SQL)
+    return [row[0] for row in conn.execute('SELECT version FROM schema_migrations ORDER BY version').fetchall()]
+
+
+def schema_status(conn: sqlite3.Connection = None) -> Dict[str, Any]:
+    """Applied schema version and pending migration versions, without writing."""
+    own_conn = conn is None
+    conn = conn or get_db_connection()
+    try:
+        tracked = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"
+        ).fetchone()
+        applied = [row[0] for row in conn.execute('SELECT version FROM schema_migrations').fetchall()] if tracked else []
+    finally:
+        if own_conn:
+            conn.close()
+    return {
+        'version': max(applied, default=0),
+        'pending': sorted(m.version for m in MIGRATIONS if m.version not in applied),
+    }
+
+
+def run_migrations(conn: sqlite3.Connection = None,
+                   migrations: Sequence[Migration] = MIGRATIONS) -> List[int]:
+    """Apply pending migrations; returns the versions applied by this call."""
+    own_conn = conn is None
+    conn = conn or get_db_connection()
+    isolation_level = conn.isolation_level
+    # Transactions are managed explicitly below
+    conn.isolation_level = None
+    applied: List[int] = []
+    try:
+        conn.execute(_MIGRATIONS_TABLE_SQL)
+        for migration in sorted(migrations, key=lambda m: m.version):
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                done = conn.execute(
+                    'SELECT 1 FROM schema_migrations WHERE version = ?', (migration.version,)
+                ).fetchone()
+                if not done:
+                    for statement in migration.statements(conn):
+                        conn.execute(statement)
+                    conn.execute(
+                        'INSERT INTO schema_migrations (version, name) VALUES (?, ?)',
+                        (migration.version, migration.name),
+                    )
+                    applied.append(migration.version)
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            ensure_reference_schema(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.isolation_level = isolation_level
+        if own_conn:
+            conn.close()
+    return applied
+
+
+if __name__ == '__main__':
+    connection = get_db_connection()
+    try:
+        newly_applied = run_migrations(connection)
+        print(f"Applied migrations: {newly_applied or 'none'}; schema at version {max(applied_versions(connection))}")
+    finally:
+        connection.close()
@@ -1,5 +1,12 @@
 import json
+import os
 import sqlite3
+import sys
+
+# Allow running as a script (python app/populate_db.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import DB_PATH
 
 def create_tables(conn):
     cursor = conn.cursor()
@@ -72,7 +79,7 @@ def populate_courses(conn, courses_file):
     conn.commit()
 
 def main():
-    conn = sqlite3.connect('skillgenome.db')
+    conn = sqlite3.connect(DB_PATH)
 
     create_tables(conn)
 
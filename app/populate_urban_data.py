@@ -1,4 +1,11 @@
+import os
 import sqlite3
+import sys
+
+# Allow running as a script (python app/populate_urban_data.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import DB_PATH
 
 def populate_urban_data(conn):
     cursor = conn.cursor()
@@ -35,7 +42,7 @@ def populate_urban_data(conn):
     conn.commit()
 
 def main():
-    conn = sqlite3.connect('skillgenome.db')
+    conn = sqlite3.connect(DB_PATH)
 
     populate_urban_data(conn)
 
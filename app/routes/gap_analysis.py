@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
 from app.database import get_db_connection
+from app.services.resume_analysis.course_mapper import get_course_catalog
+from app.services.skill_matcher import SkillMatcher
 import json
 import os
 from datetime import datetime
@@ -70,26 +72,13 @@ def analyze_gaps(user_id):
         
         # 4. Calculate gaps using scorer
         # Extract required skills from role
-        required_skills = role_requirements.get('foundation', []) + role_requirements.get('core', [])
-        preferred_skills = role_requirements.get('advanced', []) + role_requirements.get('projects', [])
+        required_skills = list(role_requirements.get('foundation', [])) + list(role_requirements.get('core', []))
+        preferred_skills = list(role_requirements.get('advanced', [])) + list(role_requirements.get('projects', []))
         
         # Map user skills to skill names with fuzzy matching
         user_skill_names = {skill['skill_name'].lower(): skill['confidence'] for skill in user_skills}
         
-        def find_matching_skill(required_skill, user_skills_dict):
-            """Check if user has skill with exact or partial match"""
-            required_lower = required_skill.lower()
-            
-            # Exact match
-            if required_lower in user_skills_dict:
-                return user_skills_dict[required_lower]
-            
-            # Partial match - check if required skill is contained in any user skill
-            for user_skill, confidence in user_skills_dict.items():
-                if required_lower in user_skill or user_skill in required_lower:
-                    return confidence
-            
-            return None
+        user_skill_matcher = SkillMatcher(user_skill_names)
         
         # Calculate gaps
         missing_required = []
@@ -97,7 +86,7 @@ def analyze_gaps(user_id):
         weak_skills = []
         
         for skill in required_skills:
-            confidence = find_matching_skill(skill, user_skill_names)
+            confidence = user_skill_matcher.get(skill)
             
             if confidence is None:
                 missing_required.append({
@@ -113,7 +102,7 @@ def analyze_gaps(user_id):
                 })
         
         for skill in preferred_skills:
-            confidence = find_matching_skill(skill, user_skill_names)
+            confidence = user_skill_matcher.get(skill)
             
             if confidence is None:
                 missing_preferred.append({
@@ -125,7 +114,7 @@ def analyze_gaps(user_id):
         # Calculate readiness score (shared definition used across the app)
         from app.services.readiness import compute_role_readiness
 
-        readiness_score = compute_role_readiness(role_requirements, user_skill_names)['readiness_score']
+        readiness_score = compute_role_readiness(role_requirements, user_skill_matcher)['readiness_score']
         
         # 5. Generate recommendations
         recommendations = generate_recommendations(
@@ -213,38 +202,27 @@ def get_analysis_history(user_id):
         return jsonify({"error": str(e)}), 500
 
 
-def generate_recommendations(missing_required, missing_preferred, weak_skills, sector, role):
-    """Generate actionable recommendations based on gaps"""
+def generate_recommendations(missing_required, missing_preferred, weak_skills, sector, role, catalog=None):
+    """Generate actionable recommendations based on gaps
+    
+    Courses come from the cached course catalog, so this runs no queries
+    whatever the size of the gap.
+    """
     
     recommendations = []
     
-    # Load course recommendations from database
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    # Courses for the sector (or general ones) first, else any course for the skill
+    catalog = catalog or get_course_catalog()
     
     # Recommend courses for missing required skills (HIGH PRIORITY)
     for skill_obj in missing_required[:3]:  # Top 3 missing
         skill = skill_obj['skill']
         
-        # Find relevant courses from database, filtered by sector if possible
-        cursor.execute("""
-            SELECT platform, title, url FROM courses 
-            WHERE LOWER(skill) = LOWER(?) AND (LOWER(sector) = LOWER(?) OR sector IS NULL OR sector = 'Technology')
-            LIMIT 1
-        """, (skill, sector))
+        # Find relevant courses, preferring the sector
+        courses = catalog.courses_for(skill, sector, limit=1)
         
-        course = cursor.fetchone()
-        
-        if not course:
-            # Fallback to any course for this skill
-            cursor.execute("""
-                SELECT platform, title, url FROM courses 
-                WHERE LOWER(skill) = LOWER(?)
-                LIMIT 1
-            """, (skill,))
-            course = cursor.fetchone()
-        
-        if course:
+        if courses:
+            course = courses[0]
             recommendations.append({
                 "type": "course",
                 "priority": "high",
@@ -274,24 +252,11 @@ def generate_recommendations(missing_required, missing_preferred, weak_skills, s
     for skill_obj in missing_preferred[:2]:
         skill = skill_obj['skill']
         
-        # Find course from database
-        cursor.execute("""
-            SELECT platform, title, url FROM courses 
-            WHERE LOWER(skill) = LOWER(?) AND (LOWER(sector) = LOWER(?) OR sector IS NULL OR sector = 'Technology')
-            LIMIT 1
-        """, (skill, sector))
-        
-        course = cursor.fetchone()
-        
-        if not course:
-            cursor.execute("""
-                SELECT platform, title, url FROM courses 
-                WHERE LOWER(skill) = LOWER(?)
-                LIMIT 1
-            """, (skill,))
-            course = cursor.fetchone()
+        # Find course, preferring the sector
+        courses = catalog.courses_for(skill, sector, limit=1)
         
-        if course:
+        if courses:
+            course = courses[0]
             recommendations.append({
                 "type": "course",
                 "priority": "low",
@@ -305,7 +270,6 @@ def generate_recommendations(missing_required, missing_preferred, weak_skills, s
                 "reason": f"Preferred skill for {role} advancement in {sector}"
             })
     
-    conn.close()
     return recommendations
 
 
@@ -1,5 +1,7 @@
 -- SkillGenome Database Schema
 -- SQLite database for user profiles, skills, courses, projects, and gap analysis
+-- This file is migration 1 (the baseline); later schema changes and indexes
+-- live in app/migrations.py. Do not edit it to change an existing database.
 
 -- Users table: Core user information
 CREATE TABLE IF NOT EXISTS users (
@@ -84,9 +86,32 @@ CREATE TABLE IF NOT EXISTS user_achievements (
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
 );
 
+-- Resume Analysis Cache: pipeline results keyed by SHA-256 of the upload + ontology version
+CREATE TABLE IF NOT EXISTS resume_analysis_cache (
+    cache_key VARCHAR(128) PRIMARY KEY,
+    result TEXT NOT NULL,  -- JSON {extracted_skills, skills}
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Asynchronous resume analysis jobs (content is dropped once the job finishes)
+CREATE TABLE IF NOT EXISTS resume_jobs (
+    job_id VARCHAR(50) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL,  -- queued, running, completed, failed
+    filename VARCHAR(255),
+    target_role VARCHAR(100),
+    profile VARCHAR(20),  -- NLP profile (fast, balanced, accurate); NULL = deployment default
+    content BLOB,
+    timings TEXT,  -- JSON {stage: seconds}
+    result TEXT,  -- JSON {skills, roadmap}
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_user_skills_user ON user_skills(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_courses_user ON user_courses(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_projects_user ON user_projects(user_id);
 CREATE INDEX IF NOT EXISTS idx_gap_analysis_user ON skill_gap_analysis(user_id);
 CREATE INDEX IF NOT EXISTS idx_gap_analysis_date ON skill_gap_analysis(analysis_date DESC);
+CREATE INDEX IF NOT EXISTS idx_resume_jobs_status ON resume_jobs(status);
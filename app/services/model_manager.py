@@ -0,0 +1,104 @@
+"""Thread-safe, load-once registry for heavyweight models (spaCy, KeyBERT).
+
+Each registered model is loaded at most once per process, under its own lock,
+so concurrent first requests wait for a single load instead of racing to load
+the model twice. Models can also be preloaded (and warmed up with a small
+inference) at server start, and their state is reported by ``/ready``.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+NOT_LOADED = 'not_loaded'
+LOADING = 'loading'
+READY = 'ready'
+UNAVAILABLE = 'unavailable'  # dependency not installed
+FAILED = 'failed'
+
+
+class _ModelSlot:
+    __slots__ = (
+        'loader', 'warm_up', 'lock', 'state', 'model',
+        'load_seconds', 'warm_up_seconds', 'error',
+    )
+
+    def __init__(self, loader: Callable[[], Any], warm_up: Optional[Callable[[Any], Any]]):
+        self.loader = loader
+        self.warm_up = warm_up
+        self.lock = threading.Lock()
+        self.state = NOT_LOADED
+        self.model = None
+        self.load_seconds: Optional[float] = None
+        self.warm_up_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ModelManager:
+    def __init__(self):
+        self._slots: Dict[str, _ModelSlot] = {}
+        self._required: set = set()
+
+    def register(self, name: str, loader: Callable[[], Any], warm_up: Optional[Callable[[Any], Any]] = None) -> None:
+        if name not in self._slots:
+            self._slots[name] = _ModelSlot(loader, warm_up)
+
+    def get(self, name: str) -> Any:
+        """Return the model, loading it on first use. Returns None if it cannot be loaded."""
+        slot = self._slots[name]
+        if slot.state in (READY, UNAVAILABLE, FAILED):
+            return slot.model
+
+        with slot.lock:
+            if slot.state == NOT_LOADED:
+                slot.state = LOADING
+                started = time.perf_counter()
+                try:
+                    slot.model = slot.loader()
+                    slot.state = READY
+                except ImportError as e:
+                    slot.state = UNAVAILABLE
+                    slot.error = str(e)
+                except Exception as e:
+                    slot.state = FAILED
+                    slot.error = str(e)
+                slot.load_seconds = round(time.perf_counter() - started, 3)
+        return slot.model
+
+    def preload(self, names: Optional[Iterable[str]] = None, warm_up: bool = True) -> Dict[str, Any]:
+        """Load (and optionally warm up) models before serving traffic."""
+        names = list(names) if names is not None else list(self._slots)
+        self._required.update(names)
+        for name in names:
+            model = self.get(name)
+            slot = self._slots[name]
+            if warm_up and model is not None and slot.warm_up and slot.warm_up_seconds is None:
+                started = time.perf_counter()
+                try:
+                    slot.warm_up(model)
+                except Exception as e:
+                    slot.error = f"warm-up failed: {e}"
+                slot.warm_up_seconds = round(time.perf_counter() - started, 3)
+        return self.status()
+
+    def is_ready(self) -> bool:
+        """True once no model is mid-load and every preloaded model finished loading."""
+        for name, slot in self._slots.items():
+            if slot.state == LOADING:
+                return False
+            if name in self._required and slot.state == NOT_LOADED:
+                return False
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            name: {
+                'state': slot.state,
+                'load_seconds': slot.load_seconds,
+                'warm_up_seconds': slot.warm_up_seconds,
+                'error': slot.error,
+            }
+            for name, slot in self._slots.items()
+        }
+
+
+model_manager = ModelManager()
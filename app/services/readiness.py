@@ -1,21 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional, Tuple
+import heapq
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
 
+from app.services.reference_data import get_reference_data
+from app.services.skill_matcher import SkillMatcher
 
-def _find_matching_confidence(required_skill: str, user_skills_dict: Dict[str, float]) -> Optional[float]:
-    required_lower = (required_skill or '').strip().lower()
-    if not required_lower:
-        return None
-
-    if required_lower in user_skills_dict:
-        return user_skills_dict[required_lower]
-
-    for user_skill, confidence in user_skills_dict.items():
-        if required_lower in user_skill or user_skill in required_lower:
-            return confidence
-
-    return None
+READINESS_PHASES = ('foundation', 'core', 'advanced', 'projects')
+FIT_PHASES = ('foundation', 'core')
 
 
 def build_skill_conf_map_from_rows(rows: Iterable[dict]) -> Dict[str, float]:
@@ -56,9 +48,9 @@ def build_skill_conf_map_from_request(skills: Iterable[dict]) -> Dict[str, float
 
 def compute_role_readiness(
     role_requirements: dict,
-    user_skill_conf: Dict[str, float],
+    user_skill_conf: Union[Dict[str, float], SkillMatcher[float]],
     *,
-    phases: Tuple[str, ...] = ('foundation', 'core', 'advanced', 'projects'),
+    phases: Tuple[str, ...] = READINESS_PHASES,
     complete_threshold: float = 0.5,
 ) -> Dict[str, float]:
     """Compute readiness as % of role skills with confidence >= threshold.
@@ -67,15 +59,17 @@ def compute_role_readiness(
     - weak: 0 < confidence < threshold
     - missing: confidence is None
 
-    Returns counts + readiness_score in [0, 100].
+    Returns counts + readiness_score in [0, 100]. Pass a SkillMatcher when
+    scoring several roles against the same user.
     """
 
+    matcher = SkillMatcher.of(user_skill_conf)
     complete = weak = missing = 0
 
     for phase in phases:
         skills = role_requirements.get(phase, []) or []
         for required_skill in skills:
-            c = _find_matching_confidence(str(required_skill), user_skill_conf)
+            c = matcher.get(required_skill)
             if c is None:
                 missing += 1
             elif c < complete_threshold:
@@ -97,19 +91,20 @@ def compute_role_readiness(
 
 def compute_core_fit(
     role_requirements: dict,
-    user_skill_conf: Dict[str, float],
+    user_skill_conf: Union[Dict[str, float], SkillMatcher[float]],
     *,
-    phases: Tuple[str, ...] = ('foundation', 'core'),
+    phases: Tuple[str, ...] = FIT_PHASES,
     complete_threshold: float = 0.5,
 ) -> Dict[str, float]:
     """Compute fit as % of core skills satisfied (confidence >= threshold)."""
 
+    matcher = SkillMatcher.of(user_skill_conf)
     matched = total = 0
     for phase in phases:
         skills = role_requirements.get(phase, []) or []
         for required_skill in skills:
             total += 1
-            c = _find_matching_confidence(str(required_skill), user_skill_conf)
+            c = matcher.get(required_skill)
             if c is not None and c >= complete_threshold:
                 matched += 1
 
@@ -119,3 +114,98 @@ def compute_core_fit(
         'matched_required': matched,
         'total_required': total,
     }
+
+
+def _percent(part: int, total: int) -> float:
+    return round((part / total) * 100, 2) if total > 0 else 0.0
+
+
+class RoleSkillMatrix:
+    """Sparse role x skill incidence matrix for scoring every role at once.
+
+    Rows are roles and columns the distinct skills any role requires. Each
+    entry counts how often the role lists the skill in the readiness phases
+    and in the core-fit phases (stored CSR-style: row offsets, column indices,
+    two count arrays). Scoring a user resolves each column once against their
+    skills, then multiplies the matrix by the complete/weak indicator vectors,
+    giving exactly what compute_core_fit and compute_role_readiness return for
+    each role, without repeating the skill matching per role.
+    """
+
+    def __init__(self, roles: Mapping[str, Mapping[str, Any]],
+                 readiness_phases: Sequence[str] = READINESS_PHASES,
+                 fit_phases: Sequence[str] = FIT_PHASES):
+        self.roles: Tuple[str, ...] = tuple(roles)
+        columns: Dict[str, int] = {}
+        self.indptr: List[int] = [0]
+        self.indices: List[int] = []
+        self.readiness_counts: List[int] = []
+        self.fit_counts: List[int] = []
+
+        for role in self.roles:
+            requirements = roles[role]
+            counts: Dict[int, List[int]] = {}
+            for phase in dict.fromkeys((*readiness_phases, *fit_phases)):
+                for skill in requirements.get(phase, []) or []:
+                    column = columns.setdefault(str(skill), len(columns))
+                    entry = counts.setdefault(column, [0, 0])
+                    entry[0] += phase in readiness_phases
+                    entry[1] += phase in fit_phases
+            for column in sorted(counts):
+                self.indices.append(column)
+                self.readiness_counts.append(counts[column][0])
+                self.fit_counts.append(counts[column][1])
+            self.indptr.append(len(self.indices))
+
+        self.skills: Tuple[str, ...] = tuple(columns)
+
+    def _matvec(self, data: List[int], vector: List[int]) -> List[int]:
+        indptr, indices = self.indptr, self.indices
+        return [
+            sum(data[i] * vector[indices[i]] for i in range(indptr[row], indptr[row + 1]))
+            for row in range(len(self.roles))
+        ]
+
+    def score(self, user_skill_conf: Union[Dict[str, float], SkillMatcher[float]], *,
+              complete_threshold: float = 0.5) -> Dict[str, Dict[str, float]]:
+        """Core fit and readiness of every role: role -> compute_core_fit + compute_role_readiness fields."""
+        matcher = SkillMatcher.of(user_skill_conf)
+        complete: List[int] = []
+        weak: List[int] = []
+        for skill in self.skills:
+            c = matcher.get(skill)
+            complete.append(int(c is not None and c >= complete_threshold))
+            weak.append(int(c is not None and c < complete_threshold))
+
+        ones = [1] * len(self.skills)
+        readiness_total = self._matvec(self.readiness_counts, ones)
+        readiness_complete = self._matvec(self.readiness_counts, complete)
+        readiness_weak = self._matvec(self.readiness_counts, weak)
+        fit_total = self._matvec(self.fit_counts, ones)
+        fit_matched = self._matvec(self.fit_counts, complete)
+
+        scores: Dict[str, Dict[str, float]] = {}
+        for row, role in enumerate(self.roles):
+            total = readiness_total[row]
+            scores[role] = {
+                'fit_score': _percent(fit_matched[row], fit_total[row]),
+                'matched_required': fit_matched[row],
+                'total_required': fit_total[row],
+                'skills_total': total,
+                'skills_complete': readiness_complete[row],
+                'skills_weak': readiness_weak[row],
+                'skills_missing': total - readiness_complete[row] - readiness_weak[row],
+                'readiness_score': _percent(readiness_complete[row], total),
+            }
+        return scores
+
+    @staticmethod
+    def top_roles(scores: Dict[str, Dict[str, float]], k: int = 5) -> List[Tuple[str, Dict[str, float]]]:
+        """The k roles with the highest core fit (ties keep role order); roles without core skills are skipped."""
+        candidates = ((role, score) for role, score in scores.items() if score['total_required'] > 0)
+        return heapq.nlargest(k, candidates, key=lambda item: item[1]['fit_score'])
+
+
+def get_role_skill_matrix() -> RoleSkillMatrix:
+    """The matrix for the current reference snapshot (rebuilt when roles change)."""
+    return get_reference_data().derived('role_skill_matrix', lambda ref: RoleSkillMatrix(ref.roles))
@@ -0,0 +1,197 @@
+"""Process-wide snapshot of the reference tables (ontology, roles, courses).
+
+These tables change rarely (only when a populate script runs), but almost
+every endpoint needs them. Instead of opening a connection and rebuilding the
+dicts on every request, a single immutable snapshot is built once and shared.
+
+Change detection is cheap: ``PRAGMA data_version`` on a long-lived watcher
+connection tells us whether *any* other connection committed since the last
+check. Only then do we look at the reference version row (bumped by triggers
+on the three tables) and ``PRAGMA schema_version`` (bumped when a populate
+script drops and recreates the tables) to decide whether to rebuild.
+
+The version row and triggers belong to app.migrations; this module only
+reads. Without them (an unmigrated database) every committed change forces
+a rebuild.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from app.database import connect_db
+from app.migrations import REFERENCE_TRIGGERS
+
+
+class ReferenceSnapshot:
+    """Immutable view of the ontology, roles and courses tables.
+
+    - ontology: tuple of skill names
+    - roles: role -> {'sector': str, category -> tuple of skills}
+    - courses: skill -> tuple of {platform, title, url, sector}
+
+    Derived structures (matchers, indexes) can be attached with ``derived``;
+    they are built at most once per snapshot and dropped with it.
+    """
+
+    __slots__ = ('version', 'ontology', 'roles', 'courses', 'built_at', '_derived', '_derived_lock')
+
+    def __init__(self, version: Tuple[int, int], ontology, roles, courses):
+        self.version = version
+        self.ontology: Tuple[str, ...] = ontology
+        self.roles: Mapping[str, Mapping[str, Any]] = roles
+        self.courses: Mapping[str, Tuple[Mapping[str, Optional[str]], ...]] = courses
+        self.built_at = time.time()
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def derived(self, name: str, factory: Callable[['ReferenceSnapshot'], Any]) -> Any:
+        value = self._derived.get(name)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(name)
+                if value is None:
+                    value = factory(self)
+                    self._derived[name] = value
+        return value
+
+
+def _column_names(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f'PRAGMA table_info({table})').fetchall()}
+
+
+def _read_snapshot(conn: sqlite3.Connection, version: Tuple[int, int]) -> ReferenceSnapshot:
+    ontology = tuple(row[0] for row in conn.execute('SELECT skill FROM ontology').fetchall())
+
+    has_role_sector = 'sector' in _column_names(conn, 'roles')
+    role_sql = (
+        'SELECT role_name, category, skill, sector FROM roles'
+        if has_role_sector
+        else "SELECT role_name, category, skill, 'Technology' FROM roles"
+    )
+    roles: Dict[str, Dict[str, Any]] = {}
+    for role, category, skill, sector in conn.execute(role_sql).fetchall():
+        if role not in roles:
+            roles[role] = {'sector': sector}
+        roles[role].setdefault(category, []).append(skill)
+
+    has_course_sector = 'sector' in _column_names(conn, 'courses')
+    course_sql = (
+        'SELECT skill, platform, title, url, sector FROM courses'
+        if has_course_sector
+        else 'SELECT skill, platform, title, url, NULL FROM courses'
+    )
+    courses: Dict[str, list] = {}
+    for skill, platform, title, url, sector in conn.execute(course_sql).fetchall():
+        courses.setdefault(skill, []).append(
+            MappingProxyType({'platform': platform, 'title': title, 'url': url, 'sector': sector})
+        )
+
+    frozen_roles = MappingProxyType({
+        role: MappingProxyType({
+            key: (tuple(value) if isinstance(value, list) else value)
+            for key, value in reqs.items()
+        })
+        for role, reqs in roles.items()
+    })
+    frozen_courses = MappingProxyType({skill: tuple(items) for skill, items in courses.items()})
+
+    return ReferenceSnapshot(version, ontology, frozen_roles, frozen_courses)
+
+
+class ReferenceDataCache:
+    """Builds and hands out ``ReferenceSnapshot``s, rebuilding only on change."""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection] = connect_db):
+        self._connect = connect
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._data_version: Optional[int] = None
+        self._schema_version: Optional[int] = None
+        self._has_triggers = False
+        self.hits = 0
+        self.misses = 0
+
+    def _watcher(self) -> sqlite3.Connection:
+        # A dedicated connection, not a pooled one: data_version is only
+        # meaningful when asked of the same connection every time
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    @staticmethod
+    def _has_version_triggers(conn: sqlite3.Connection) -> bool:
+        names = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+        ).fetchall()}
+        return 'reference_data_version' in names and set(REFERENCE_TRIGGERS) <= names
+
+    def _content_version(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        schema_version = conn.execute('PRAGMA schema_version').fetchone()[0]
+        if not self._has_triggers:
+            # Without the version row every committed change forces a rebuild.
+            return schema_version, conn.execute('PRAGMA data_version').fetchone()[0]
+        row = conn.execute('SELECT version FROM reference_data_version WHERE id = 1').fetchone()
+        return schema_version, (row[0] if row else 0)
+
+    def get(self) -> ReferenceSnapshot:
+        with self._lock:
+            conn = self._watcher()
+            data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+            if self._snapshot is not None and data_version == self._data_version:
+                self.hits += 1
+                return self._snapshot
+
+            # Dropping a table drops its triggers too, so look again whenever
+            # the schema changed, e.g. after a populate script ran.
+            schema_version = conn.execute('PRAGMA schema_version').fetchone()[0]
+            if schema_version != self._schema_version:
+                self._has_triggers = self._has_version_triggers(conn)
+                self._schema_version = schema_version
+
+            conn.execute('BEGIN')
+            try:
+                version = self._content_version(conn)
+                if self._snapshot is not None and version == self._snapshot.version:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    self._snapshot = _read_snapshot(conn, version)
+            finally:
+                conn.commit()
+
+            # The value read before BEGIN: a commit that lands after the
+            # snapshot was read must still look new on the next call
+            self._data_version = data_version
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._data_version = None
+            self._schema_version = None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'version': list(snapshot.version) if snapshot else None,
+            'built_at': snapshot.built_at if snapshot else None,
+        }
+
+
+_cache = ReferenceDataCache()
+
+
+def get_reference_data() -> ReferenceSnapshot:
+    """Return the current process-wide reference snapshot."""
+    return _cache.get()
+
+
+def reference_data_stats() -> Dict[str, Any]:
+    return _cache.stats()
@@ -0,0 +1,230 @@
+"""Bulk resume analysis for recruiter intake.
+
+Uploads (individual files and/or ZIP archives) arrive spooled to disk (see
+uploads.py); ZIP members are spooled out of them one by one. The files are
+split into chunks that are
+analyzed in the resume worker pool with analyze_resume_batch, so each child
+runs spaCy and KeyBERT over a whole chunk at once. Results are yielded per
+file as chunks complete, for streaming back as NDJSON.
+
+Configuration (environment):
+  - RESUME_BATCH_MAX_FILES: most resumes accepted in one request
+  - RESUME_BATCH_CHUNK_SIZE: resumes sent to a worker process per job
+  - RESUME_BATCH_MAX_FILE_MB: largest resume accepted (also caps ZIP members)
+  - RESUME_BATCH_MAX_TOTAL_MB: most bytes one request may upload and unpack,
+    counting each ZIP member's uncompressed size (default 200)
+"""
+import os
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.services.resume_analysis.pipeline import analyze_resume_batch
+from app.services.resume_analysis.profiles import get_profile
+from app.services.resume_analysis.result_cache import get_resume_cache, resume_cache_key
+from app.services.resume_analysis.uploads import SpooledUpload
+from app.services.resume_analysis.worker_pool import PoolBusyError, get_resume_pool
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# How often queued chunks are checked for having started
+START_POLL_SECONDS = 0.1
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+# (filename, spooled upload or None, error or None)
+BatchEntry = Tuple[str, Optional[SpooledUpload], Optional[str]]
+
+
+class BatchUploadError(Exception):
+    """Raised when a batch upload cannot be accepted at all."""
+
+
+def collect_batch_files(uploads: Iterable[SpooledUpload],
+                        max_files: Optional[int] = None,
+                        max_file_bytes: Optional[int] = None,
+                        max_total_bytes: Optional[int] = None) -> List[BatchEntry]:
+    """Expand spooled uploads into (filename, upload, error) entries, unpacking ZIPs.
+
+    ZIP members are streamed out of the spooled archive into spooled files of
+    their own, chunk by chunk, so no resume is ever held in memory. Files that
+    cannot be analyzed keep their place with upload None and an error
+    message, so every upload gets a result line. The caller closes the
+    uploads in the returned entries (and its own) once they are analyzed.
+
+    Raises BatchUploadError, having removed the members it spooled, when the
+    batch has too many files or would unpack to more than max_total_bytes.
+    """
+    if max_files is None:
+        max_files = _env_int('RESUME_BATCH_MAX_FILES', 500)
+    if max_file_bytes is None:
+        max_file_bytes = _env_int('RESUME_BATCH_MAX_FILE_MB', 10) * 1024 * 1024
+    if max_total_bytes is None:
+        max_total_bytes = _env_int('RESUME_BATCH_MAX_TOTAL_MB', 200) * 1024 * 1024
+
+    entries: List[BatchEntry] = []
+    members: List[SpooledUpload] = []
+    total = 0
+
+    def add(filename: str, upload: Optional[SpooledUpload], size: int) -> None:
+        if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            entries.append((filename, None, "Unsupported file format"))
+        elif size > max_file_bytes:
+            entries.append((filename, None, "File too large"))
+        else:
+            entries.append((filename, upload, None))
+
+    def reserve(size: int) -> None:
+        nonlocal total
+        total += size
+        if total > max_total_bytes:
+            raise BatchUploadError(f"Batch too large (max {max_total_bytes // (1024 * 1024)} MB uncompressed)")
+
+    try:
+        for upload in uploads:
+            if not upload.filename.lower().endswith('.zip'):
+                reserve(upload.size)
+                add(upload.filename, upload, upload.size)
+                continue
+            try:
+                with zipfile.ZipFile(upload.path) as archive:
+                    for info in archive.infolist():
+                        name = info.filename
+                        if info.is_dir() or name.startswith('__MACOSX/') or os.path.basename(name).startswith('.'):
+                            continue
+                        # Check the declared size before inflating anything; a
+                        # member's stream never yields more than it declares
+                        if info.file_size > max_file_bytes or not name.lower().endswith(SUPPORTED_EXTENSIONS):
+                            add(name, None, info.file_size)
+                        else:
+                            reserve(info.file_size)
+                            with archive.open(info) as stream:
+                                members.append(SpooledUpload(stream, name))
+                            add(name, members[-1], members[-1].size)
+                        if len(entries) > max_files:
+                            break
+            except zipfile.BadZipFile:
+                entries.append((upload.filename, None, "Invalid ZIP archive"))
+
+            if len(entries) > max_files:
+                raise BatchUploadError(f"Too many files in batch (max {max_files})")
+    except BaseException:
+        for member in members:
+            member.close()
+        raise
+    return entries
+
+
+def _line(index: int, filename: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    if 'error' in result:
+        return {"index": index, "filename": filename, "status": "error", "error": result['error']}
+    return {
+        "index": index,
+        "filename": filename,
+        "status": "ok",
+        "skills": result['skills'],
+        "timings": result.get('timings', {}),
+    }
+
+
+def stream_batch_results(entries: List[BatchEntry],
+                         profile: Optional[str] = None,
+                         chunk_size: Optional[int] = None,
+                         busy_timeout: float = 60.0) -> Iterator[Dict[str, Any]]:
+    """Analyze collected entries and yield one result dict per file as it completes.
+
+    Cached uploads are answered immediately. The rest are submitted in chunks;
+    when the shared pool is full, submission waits for this batch's own jobs
+    (or, if none are pending, for other requests' jobs) rather than failing.
+    Each chunk gets RESUME_JOB_TIMEOUT_SECONDS per file it contains, counted
+    from when the pool starts it, so a slow chunk only times out itself.
+    """
+    if chunk_size is None:
+        chunk_size = max(1, _env_int('RESUME_BATCH_CHUNK_SIZE', 8))
+
+    profile_name = get_profile(profile).name
+    cache = get_resume_cache()
+    pool = get_resume_pool()
+    # Workers read the spooled files by path
+    pending: List[Tuple[int, str, str, str]] = []
+
+    for index, (filename, upload, error) in enumerate(entries):
+        if error is not None:
+            yield _line(index, filename, {'error': error})
+            continue
+        key = resume_cache_key(upload.path, filename, profile_name, upload.sha256)
+        cached = cache.get(key)
+        if cached is not None:
+            yield _line(index, filename, cached)
+        else:
+            pending.append((index, filename, upload.path, key))
+
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    inflight: Dict[Future, List[Tuple[int, str, str, str]]] = {}
+    # Chunk -> when it was first seen running; queued chunks are not timed
+    started: Dict[Future, float] = {}
+
+    def expires(future: Future) -> float:
+        return started[future] + pool.timeout * len(inflight[future])
+
+    def finished() -> Iterator[Dict[str, Any]]:
+        """Wait until a chunk finishes or runs out of time, and yield its lines."""
+        now = time.monotonic()
+        for future in inflight:
+            if future not in started and (future.running() or future.done()):
+                started[future] = now
+        timeout = min((expires(f) for f in started), default=now + START_POLL_SECONDS) - now
+        if len(started) < len(inflight):
+            timeout = min(timeout, START_POLL_SECONDS)
+        done, _ = wait(list(inflight), timeout=max(0.0, timeout), return_when=FIRST_COMPLETED)
+
+        now = time.monotonic()
+        for future in [f for f in started if f not in done and expires(f) <= now]:
+            future.cancel()
+            started.pop(future)
+            for index, filename, _, _ in inflight.pop(future):
+                yield _line(index, filename, {'error': "Resume analysis timed out"})
+        for future in done:
+            started.pop(future, None)
+            done_chunk = inflight.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [{"error": str(e) or type(e).__name__} for _ in done_chunk]
+            for (index, filename, _, key), result in zip(done_chunk, results):
+                if 'error' not in result:
+                    cache.put(key, result)
+                yield _line(index, filename, result)
+
+    for chunk in chunks:
+        waited_since = None
+        while True:
+            try:
+                future = pool.submit(
+                    analyze_resume_batch, [(path, filename) for _, filename, path, _ in chunk], profile_name
+                )
+                break
+            except PoolBusyError:
+                if inflight:
+                    yield from finished()
+                    continue
+                waited_since = waited_since or time.monotonic()
+                if time.monotonic() - waited_since > busy_timeout:
+                    future = None
+                    break
+                time.sleep(0.1)
+        if future is None:
+            for index, filename, _, _ in chunk:
+                yield _line(index, filename, {'error': "Resume analysis is busy, please retry shortly"})
+            continue
+        inflight[future] = chunk
+
+    while inflight:
+        yield from finished()
@@ -1,52 +1,80 @@
 import json
 import os
-from typing import List, Dict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from app.models.schemas import RoadmapPhase, RoadmapSkill, Course
 
-from app.database import get_db_connection
-
-def _load_courses() -> Dict:
-    conn = get_db_connection()
-    courses_data = {}
-    try:
-        # Structure: skill -> list of course dicts
-        rows = conn.execute('SELECT skill, platform, title, url FROM courses').fetchall()
-        
-        for row in rows:
-            skill = row['skill']
-            course = {
-                "platform": row['platform'],
-                "title": row['title'],
-                "url": row['url']
-            }
-            
-            if skill not in courses_data:
-                courses_data[skill] = []
-            courses_data[skill].append(course)
-            
-    finally:
-        conn.close()
-    return courses_data
+from app.services.reference_data import get_reference_data
+from app.services.skill_matcher import SkillMatcher
+
+# Courses tagged with one of these sectors (or none) suit every sector
+GENERAL_SECTORS = ('technology',)
+
+class CourseCatalog:
+    """Skill -> courses index over the reference snapshot's courses table.
+
+    Skills are keyed case-insensitively (like ``LOWER(skill) = LOWER(?)``),
+    with courses kept in table order. ``courses_for`` answers an exact or,
+    with ``partial=True``, a partial match (see SkillMatcher); given a sector,
+    courses for that sector or a general one come first. Both answers are
+    memoized, so repeated lookups cost a dict access and no SQL.
+    """
+
+    def __init__(self, courses: Mapping[str, Sequence[Mapping[str, Optional[str]]]]):
+        by_skill: Dict[str, List[Mapping[str, Optional[str]]]] = {}
+        for skill, course_list in courses.items():
+            by_skill.setdefault(str(skill).strip().lower(), []).extend(course_list)
+        self._by_skill: Dict[str, Tuple[Mapping[str, Optional[str]], ...]] = {
+            skill: tuple(course_list) for skill, course_list in by_skill.items()
+        }
+        self._matcher = SkillMatcher(self._by_skill)
+        self._ordered: Dict[Tuple[str, str], Tuple[Mapping[str, Optional[str]], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_skill)
+
+    def resolve(self, skill: str, partial: bool = False) -> Optional[str]:
+        """The catalog skill that ``skill`` maps to, or None."""
+        if partial:
+            return self._matcher.match(skill)
+        key = str(skill or '').strip().lower()
+        return key if key in self._by_skill else None
+
+    def courses_for(self, skill: str, sector: Optional[str] = None, limit: Optional[int] = None,
+                    partial: bool = False) -> List[Dict[str, Optional[str]]]:
+        """Courses for a skill as {platform, title, url} dicts, best sector fit first."""
+        key = self.resolve(skill, partial)
+        if key is None:
+            return []
+        sector_key = (sector or '').strip().lower()
+        ordered = self._ordered.get((key, sector_key))
+        if ordered is None:
+            ordered = self._by_skill[key]
+            if sector_key:
+                # Stable: table order is kept within each group
+                ordered = tuple(sorted(ordered, key=lambda c: not _suits_sector(c, sector_key)))
+            self._ordered[(key, sector_key)] = ordered
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [{'platform': c['platform'], 'title': c['title'], 'url': c['url']} for c in ordered]
+
+def _suits_sector(course: Mapping[str, Optional[str]], sector_key: str) -> bool:
+    course_sector = (course.get('sector') or '').strip().lower()
+    return not course_sector or course_sector == sector_key or course_sector in GENERAL_SECTORS
+
+def get_course_catalog() -> CourseCatalog:
+    """The catalog for the current reference snapshot (rebuilt when courses change)."""
+    return get_reference_data().derived('course_catalog', lambda ref: CourseCatalog(ref.courses))
 
 def map_courses_to_skills(roadmap_phases: List[RoadmapPhase]) -> List[RoadmapPhase]:
-    courses_data = _load_courses()
+    catalog = get_course_catalog()
     
     for phase in roadmap_phases:
         for skill in phase.skills:
-            skill_lower = skill.name.lower()
-            if skill_lower in courses_data:
-                course_list = courses_data[skill_lower]
+            course_list = catalog.courses_for(skill.name, partial=True)
+            if course_list:
                 skill.courses = [
                     Course(platform=course["platform"], title=course["title"], url=course["url"])
                     for course in course_list
                 ]
-            else:
-                for key, course_list in courses_data.items():
-                    if key in skill_lower or skill_lower in key:
-                        skill.courses = [
-                            Course(platform=course["platform"], title=course["title"], url=course["url"])
-                            for course in course_list
-                        ]
-                        break
     
     return roadmap_phases
@@ -0,0 +1,97 @@
+"""Per-request time budget for the resume pipeline.
+
+A Deadline is created when the request arrives (so queueing in the worker pool
+counts against it) and passed down as a wall-clock timestamp, which survives
+the hop into a worker process. Stages consult it to degrade instead of
+overrunning: PDF extraction stops adding pages, and extract_skills skips
+KeyBERT and then spaCy when their estimated cost no longer fits. Every skip
+is recorded so the response can say what was left out.
+
+Configuration (environment):
+  - RESUME_TIME_BUDGET_SECONDS: default budget per request (unset/0 = unlimited)
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Share of the budget PDF extraction may use before it stops adding pages,
+# leaving the rest for skill extraction and scoring.
+EXTRACTION_BUDGET_SHARE = 0.5
+
+# Initial seconds per 1,000 characters for the optional stages, refined by
+# measurement (see StageCosts.record).
+DEFAULT_STAGE_COSTS = {
+    'spacy': 0.01,
+    'keybert': 0.05,
+}
+
+
+def default_time_budget() -> Optional[float]:
+    try:
+        budget = float(os.getenv('RESUME_TIME_BUDGET_SECONDS', '0'))
+    except Exception:
+        return None
+    return budget if budget > 0 else None
+
+
+class StageCosts:
+    """Moving average of observed seconds per 1,000 characters, per stage."""
+
+    def __init__(self, defaults: Optional[Dict[str, float]] = None, smoothing: float = 0.3):
+        self._rates = dict(defaults or DEFAULT_STAGE_COSTS)
+        self._smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def estimate(self, stage: str, chars: int) -> float:
+        return self._rates.get(stage, 0.0) * max(chars, 1) / 1000.0
+
+    def record(self, stage: str, chars: int, seconds: float) -> None:
+        if chars <= 0:
+            return
+        rate = seconds * 1000.0 / chars
+        with self._lock:
+            previous = self._rates.get(stage)
+            self._rates[stage] = rate if previous is None else previous + self._smoothing * (rate - previous)
+
+
+stage_costs = StageCosts()
+
+
+class Deadline:
+    def __init__(self, expires_at: Optional[float] = None, budget: Optional[float] = None):
+        self.expires_at = expires_at
+        self.budget = budget
+        self.skipped: List[Dict[str, str]] = []
+        # True once something was skipped for lack of time (rather than a
+        # configured cap), i.e. the same upload could yield more next time
+        self.degraded = False
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> 'Deadline':
+        """A deadline `seconds` from now; None or <= 0 means unlimited."""
+        if not seconds or seconds <= 0:
+            return cls()
+        return cls(time.time() + seconds, seconds)
+
+    @property
+    def unlimited(self) -> bool:
+        return self.expires_at is None
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float('inf')
+        return self.expires_at - time.time()
+
+    def share_used(self) -> float:
+        """Fraction of the budget already spent (0.0 when unlimited)."""
+        if self.expires_at is None or not self.budget:
+            return 0.0
+        return 1.0 - self.remaining() / self.budget
+
+    def allows(self, estimated_seconds: float) -> bool:
+        return self.remaining() >= estimated_seconds
+
+    def skip(self, stage: str, reason: str, transient: bool = True) -> None:
+        self.skipped.append({'stage': stage, 'reason': reason})
+        self.degraded = self.degraded or transient
@@ -0,0 +1,75 @@
+"""The resume text shared by every pipeline stage.
+
+ResumeDocument lower-cases and normalizes the extracted text once and keeps
+the offsets that map ``normalized`` back to ``lower``. The extractor matches
+the ontology against ``normalized``, spaCy and KeyBERT read ``raw_text``, and
+the scorer finds every scored skill in ``lower`` in one automaton pass, so no
+stage copies or re-scans the full text per skill.
+"""
+import re
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+
+# Characters normalize_text keeps besides whitespace
+_KEPT_RUN = re.compile(r'[\w+#.]+')
+_SPACE = re.compile(r'\s')
+
+
+class ResumeDocument:
+    def __init__(self, raw_text: str):
+        self.raw_text = raw_text
+        self.lower = raw_text.lower()
+        self.normalized, self._runs = self._normalize(self.lower)
+        self._run_starts = [normalized_start for normalized_start, _ in self._runs]
+        self._sections: Optional['ResumeSections'] = None
+
+    @staticmethod
+    def _normalize(lower: str):
+        """Single pass equivalent of normalize_text that keeps source offsets.
+
+        normalize_text drops everything outside [\\w\\s+#.], collapses
+        whitespace and strips, so the result is the runs of kept characters,
+        joined directly when only dropped characters separate them and by one
+        space when any whitespace does.
+        """
+        parts: List[str] = []
+        runs: List[Tuple[int, int]] = []  # (normalized start, source start) per kept run
+        length = 0
+        previous_end: Optional[int] = None
+
+        for match in _KEPT_RUN.finditer(lower):
+            start, end = match.span()
+            if previous_end is not None and _SPACE.search(lower, previous_end, start):
+                parts.append(' ')
+                length += 1
+            runs.append((length, start))
+            parts.append(match.group())
+            length += end - start
+            previous_end = end
+
+        return ''.join(parts), runs
+
+    def source_offset(self, normalized_pos: int) -> int:
+        """Map an offset in ``normalized`` back to ``lower``."""
+        i = bisect_right(self._run_starts, normalized_pos) - 1
+        if i < 0:
+            return 0
+        normalized_start, source_start = self._runs[i]
+        return source_start + (normalized_pos - normalized_start)
+
+    def source_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Map a [start, end) span of ``normalized`` back to ``lower``."""
+        if end <= start:
+            position = self.source_offset(start)
+            return position, position
+        return self.source_offset(start), self.source_offset(end - 1) + 1
+
+    @property
+    def sections(self) -> 'ResumeSections':
+        if self._sections is None:
+            # Imported here: the scorer itself takes a ResumeDocument
+            from app.services.resume_analysis.scorer import ResumeSections
+
+            self._sections = ResumeSections(self.raw_text, self.lower)
+        return self._sections
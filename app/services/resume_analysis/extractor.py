@@ -1,28 +1,302 @@
-import pdfplumber
-from docx import Document
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
 from io import BytesIO
+from typing import Iterator, List, Optional, Union
+from xml.etree.ElementTree import ParseError, iterparse
 
-def extract_text(content: bytes, filename: str) -> str:
+from app.services.resume_analysis.deadline import EXTRACTION_BUDGET_SHARE, Deadline
+
+# pdfplumber and pypdfium2 are imported on first use so that
+# processes that never parse a resume (auth workers, populate scripts, tests)
+# skip their cost.
+#
+# PDF configuration (environment):
+#   - PDF_TEXT_MODE: "layout" (pdfplumber, default) or "text" (PDFium text
+#     layer only, much faster, no character-level layout analysis)
+#   - PDF_MAX_PAGES / PDF_MAX_CHARS: stop reading after this many pages or
+#     characters (0 = no cap)
+#   - PDF_PAGE_WORKERS: processes used to split long PDFs (0 = read serially;
+#     always serial inside resume worker processes)
+#   - PDF_PAGES_PER_TASK: pages per process-pool task
+#
+# Every extractor takes the upload either as bytes or as the path of a spooled
+# copy (see uploads.py); with a path, only the pages/parts read are loaded.
+
+LAYOUT_MODE = 'layout'
+TEXT_MODE = 'text'
+
+ResumeSource = Union[bytes, str]
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+def pdf_text_mode() -> str:
+    mode = os.getenv('PDF_TEXT_MODE', LAYOUT_MODE).strip().lower()
+    return mode if mode in (LAYOUT_MODE, TEXT_MODE) else LAYOUT_MODE
+
+def _open_source(content: ResumeSource):
+    """A path as-is (opened by the parser), bytes wrapped in a file object."""
+    return content if isinstance(content, str) else BytesIO(content)
+
+def extract_text(content: ResumeSource, filename: str, deadline: Optional[Deadline] = None) -> str:
     if filename.lower().endswith('.pdf'):
-        return extract_pdf(content)
+        return extract_pdf(content, deadline)
     elif filename.lower().endswith('.docx'):
         return extract_docx(content)
     else:
         raise ValueError("Unsupported file format")
 
-def extract_pdf(content: bytes) -> str:
+# PDFium is not thread-safe; serialize its use within a process.
+_pdfium_lock = threading.Lock()
+
+def _pdfium():
+    try:
+        import pypdfium2
+        return pypdfium2
+    except ImportError:
+        return None
+
+def pdf_page_count(content: ResumeSource) -> int:
+    pdfium = _pdfium()
+    if pdfium is not None:
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(content)
+            try:
+                return len(document)
+            finally:
+                document.close()
+    import pdfplumber
+
+    with pdfplumber.open(_open_source(content)) as pdf:
+        return len(pdf.pages)
+
+def iter_page_texts(content: ResumeSource, mode: str = LAYOUT_MODE, start: int = 0,
+                    stop: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of pages[start:stop] one page at a time."""
+    pdfium = _pdfium() if mode == TEXT_MODE else None
+    if pdfium is not None:
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(content)
+            stop = len(document) if stop is None else min(stop, len(document))
+        try:
+            for index in range(start, stop):
+                # Hold the lock per page, not across the yield
+                with _pdfium_lock:
+                    page = document[index]
+                    textpage = page.get_textpage()
+                    try:
+                        text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+                yield text.replace('\r\n', '\n').strip()
+        finally:
+            with _pdfium_lock:
+                document.close()
+        return
+
+    import pdfplumber
+
+    with pdfplumber.open(_open_source(content)) as pdf:
+        for page in pdf.pages[start:stop]:
+            # Without PDFium, text mode still skips pdfplumber's line clustering
+            text = page.extract_text_simple() if mode == TEXT_MODE else page.extract_text()
+            # Release the parsed page objects as we go
+            page.flush_cache()
+            yield text or ''
+
+def _page_range_texts(content: ResumeSource, mode: str, start: int, stop: int) -> List[str]:
+    """Process-pool task: the texts of pages[start:stop]."""
+    return list(iter_page_texts(content, mode, start, stop))
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool():
+    global _page_pool
+    workers = _env_int('PDF_PAGE_WORKERS', 0)
+    # Not inside a pool worker: those already read one resume per process, and
+    # multiprocessing children skip atexit, so a pool created there would never
+    # be shut down and the worker could never exit
+    if workers <= 0 or multiprocessing.parent_process() is not None:
+        return None
+    if _page_pool is None:
+        with _page_pool_lock:
+            if _page_pool is None:
+                from app.services.resume_analysis.worker_pool import ResumeWorkerPool
+
+                _page_pool = ResumeWorkerPool(
+                    workers=workers,
+                    max_pending=workers * 2,
+                    timeout=_env_int('RESUME_JOB_TIMEOUT_SECONDS', 60),
+                    initializer=None,
+                )
+    return _page_pool
+
+def _iter_pages_parallel(content: ResumeSource, mode: str, page_count: int, pages_per_task: int,
+                         pool) -> Iterator[str]:
+    """Yield page texts in order while later page ranges are read in the pool."""
+    from app.services.resume_analysis.worker_pool import PoolBusyError
+
+    ranges = [(start, min(start + pages_per_task, page_count)) for start in range(0, page_count, pages_per_task)]
+    futures = []
+    try:
+        for start, stop in ranges:
+            try:
+                futures.append(pool.submit(_page_range_texts, content, mode, start, stop))
+            except PoolBusyError:
+                # Pool saturated: read this range here when its turn comes
+                futures.append((start, stop))
+        for task in futures:
+            if isinstance(task, tuple):
+                yield from iter_page_texts(content, mode, *task)
+            else:
+                yield from task.result(timeout=pool.timeout)
+    finally:
+        # Stopping early (page/char cap, deadline) drops the remaining work
+        for task in futures:
+            if not isinstance(task, tuple):
+                task.cancel()
+
+def extract_pdf(content: ResumeSource, deadline: Optional[Deadline] = None, mode: Optional[str] = None,
+                max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    mode = mode or pdf_text_mode()
+    max_pages = _env_int('PDF_MAX_PAGES', 0) if max_pages is None else max_pages
+    max_chars = _env_int('PDF_MAX_CHARS', 0) if max_chars is None else max_chars
+
+    page_count = pdf_page_count(content)
+    pages_to_read = min(page_count, max_pages) if max_pages > 0 else page_count
+    if pages_to_read < page_count and deadline is not None:
+        deadline.skip('pdf_pages', f"page cap: read {pages_to_read} of {page_count} pages", transient=False)
+
+    pages_per_task = max(1, _env_int('PDF_PAGES_PER_TASK', 8))
+    pool = _get_page_pool() if pages_to_read > pages_per_task else None
+    if pool is not None:
+        pages = _iter_pages_parallel(content, mode, pages_to_read, pages_per_task, pool)
+    else:
+        pages = iter_page_texts(content, mode, 0, pages_to_read)
+
     text_parts = []
-    with pdfplumber.open(BytesIO(content)) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
+    chars = 0
+    try:
+        for number, page_text in enumerate(pages):
+            # Always read the first page; stop early once extraction has used
+            # its share of the request's time budget.
+            if number > 0 and deadline is not None and deadline.share_used() >= EXTRACTION_BUDGET_SHARE:
+                deadline.skip('pdf_pages', f"extracted {number} of {page_count} pages")
+                break
             if page_text:
                 text_parts.append(page_text)
-    return "\n".join(text_parts)
+                chars += len(page_text) + 1
+            if max_chars > 0 and chars >= max_chars:
+                if deadline is not None and number + 1 < pages_to_read:
+                    deadline.skip('pdf_pages', f"character cap: read {number + 1} of {page_count} pages",
+                                  transient=False)
+                break
+    finally:
+        pages.close()
+    text = "\n".join(text_parts)
+    return text[:max_chars] if max_chars > 0 else text
 
-def extract_docx(content: bytes) -> str:
-    doc = Document(BytesIO(content))
-    text_parts = []
-    for paragraph in doc.paragraphs:
-        if paragraph.text.strip():
-            text_parts.append(paragraph.text)
+# WordprocessingML namespaces used by the streaming DOCX reader
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+def _docx_parts(names: List[str]) -> List[str]:
+    """Document parts to read, in order: headers, body, footers."""
+    headers = sorted(n for n in names if re.fullmatch(r'word/header\d*\.xml', n))
+    footers = sorted(n for n in names if re.fullmatch(r'word/footer\d*\.xml', n))
+    return headers + ['word/document.xml'] + footers
+
+def iter_docx_blocks(stream) -> Iterator[str]:
+    """Yield the text of one WordprocessingML part block by block, in document order.
+
+    A block is a paragraph, or a whole table cell (its paragraphs joined by
+    newlines). Paragraphs inside text boxes are yielded as their own blocks.
+    Elements are discarded as soon as they are read, so memory stays constant
+    regardless of document length.
+    """
+    paragraphs: List[List[str]] = []  # open paragraphs (text boxes nest them)
+    cells: List[List[str]] = []       # open table cells (tables nest too)
+    fallback_depth = 0                # inside mc:Fallback, a duplicate of mc:Choice
+    parents = []
+
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            parents.append(elem)
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _W + 'p':
+                paragraphs.append([])
+            elif tag == _W + 'tc':
+                cells.append([])
+            continue
+
+        parents.pop()
+        if tag == _MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == _W + 't':
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _W + 'tab':
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in (_W + 'br', _W + 'cr'):
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == _W + 'p':
+            text = ''.join(paragraphs.pop())
+            if text.strip():
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+        elif tag == _W + 'tc':
+            text = '\n'.join(cells.pop())
+            if text.strip():
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+
+        # Drop finished subtrees from their parent so the tree never grows
+        if parents and not paragraphs and not cells:
+            parents[-1].clear()
+
+def extract_docx(content: ResumeSource) -> str:
+    """Text of a DOCX read straight from its XML parts.
+
+    Unlike python-docx's ``Document.paragraphs`` this includes tables, text
+    boxes, headers and footers, and never builds the object model. Identical
+    headers/footers (first page, even pages) are kept once.
+    """
+    try:
+        with zipfile.ZipFile(_open_source(content)) as package:
+            names = package.namelist()
+            if 'word/document.xml' not in names:
+                raise ValueError("Invalid DOCX file: word/document.xml not found")
+            text_parts = []
+            seen_margins = set()
+            for name in _docx_parts(names):
+                with package.open(name) as stream:
+                    if name == 'word/document.xml':
+                        text_parts.extend(iter_docx_blocks(stream))
+                        continue
+                    blocks = tuple(iter_docx_blocks(stream))
+                if blocks and blocks not in seen_margins:
+                    seen_margins.add(blocks)
+                    text_parts.extend(blocks)
+    except (zipfile.BadZipFile, ParseError) as e:
+        raise ValueError(f"Invalid DOCX file: {e}")
     return "\n".join(text_parts)
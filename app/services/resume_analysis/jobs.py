@@ -0,0 +1,254 @@
+"""Asynchronous resume analysis jobs, persisted in SQLite.
+
+``POST /api/resume/analyze?async=true`` stores the upload as a queued job and
+returns its id straight away; a small local thread pool then runs the pipeline
+(which itself executes in the resume process pool) and records per-stage
+timings and the final skills + roadmap payload. Because the upload is kept in
+the ``resume_jobs`` row until the job finishes, jobs that were queued or
+running when the server stopped are picked up again on the next start.
+
+Several processes (workers, the debug reloader) may share the table, so a job
+is only run by the runner that claims it: a single UPDATE moves it from
+queued to running and records the runner as ``owner``. While a job runs its
+owner refreshes ``heartbeat``; ``recover()`` re-queues only running jobs whose
+heartbeat is older than the lease (RESUME_JOB_LEASE_SECONDS, default 300).
+The table and its columns are created by app.migrations.
+"""
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from app.database import get_db_connection
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+AnalyzeFn = Callable[[bytes, str, Optional[str]], Dict[str, Any]]
+PayloadFn = Callable[[List[Dict[str, Any]], str], List[Dict[str, Any]]]
+
+
+def _default_analyze(content: bytes, filename: str, profile: Optional[str]) -> Dict[str, Any]:
+    from app.services.resume_analysis.result_cache import cached_analyze_resume
+
+    return cached_analyze_resume(content, filename, profile)
+
+
+def _default_payload(final_skills: List[Dict[str, Any]], target_role: str) -> List[Dict[str, Any]]:
+    from app.services.resume_analysis.pipeline import build_roadmap_payload
+
+    return build_roadmap_payload(final_skills, target_role)
+
+
+class ResumeJobRunner:
+    def __init__(self, analyze: AnalyzeFn = _default_analyze, build_payload: PayloadFn = _default_payload,
+                 connect: Callable = get_db_connection, max_workers: int = 2, lease_seconds: float = 300.0):
+        self._analyze = analyze
+        self._build_payload = build_payload
+        self._connect = connect
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='resume-job')
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        """Update a job this runner owns; a no-op if another runner took it over."""
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        conn = self._connect()
+        try:
+            conn.execute(
+                f"UPDATE resume_jobs SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE job_id = ? AND owner = ?",
+                (*fields.values(), job_id, self.owner),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _claim(self, job_id: str) -> bool:
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """
+                UPDATE resume_jobs SET status = ?, owner = ?, heartbeat = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = ? AND status = ?
+                """,
+                (RUNNING, self.owner, time.time(), job_id, QUEUED),
+            )
+            conn.commit()
+            claimed = cursor.rowcount == 1
+        finally:
+            conn.close()
+        if claimed:
+            with self._lock:
+                self._running.add(job_id)
+                if self._heartbeat_thread is None:
+                    self._heartbeat_thread = threading.Thread(
+                        target=self._heartbeat, name='resume-job-heartbeat', daemon=True
+                    )
+                    self._heartbeat_thread.start()
+        return claimed
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock:
+                if not self._running:
+                    continue
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "UPDATE resume_jobs SET heartbeat = ? WHERE owner = ? AND status = ?",
+                    (time.time(), self.owner, RUNNING),
+                )
+                conn.commit()
+            except Exception:
+                pass
+            finally:
+                conn.close()
+
+    def submit(self, content: bytes, filename: str, target_role: str, profile: Optional[str] = None) -> str:
+        """Queue an analysis; ``content`` may be any bytes-like object (e.g. a SpooledUpload mapping)."""
+        job_id = str(uuid.uuid4())
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO resume_jobs (job_id, status, filename, target_role, profile, content)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, QUEUED, filename, target_role, profile, content),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._executor.submit(self._run, job_id, time.time())
+        return job_id
+
+    def recover(self) -> int:
+        """Re-queue running jobs whose lease expired and pick up queued ones.
+
+        Queued jobs may still be in another live runner's queue; whichever
+        runner claims a job first runs it, the other skips it.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                UPDATE resume_jobs SET status = ?, owner = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE status = ? AND content IS NOT NULL AND (heartbeat IS NULL OR heartbeat < ?)
+                """,
+                (QUEUED, RUNNING, now - self.lease_seconds),
+            )
+            conn.commit()
+            rows = conn.execute(
+                "SELECT job_id FROM resume_jobs WHERE status = ? AND content IS NOT NULL", (QUEUED,)
+            ).fetchall()
+        finally:
+            conn.close()
+        for row in rows:
+            self._executor.submit(self._run, row[0], now)
+        return len(rows)
+
+    def _run(self, job_id: str, queued_at: float) -> None:
+        if not self._claim(job_id):
+            return
+        try:
+            self._execute(job_id, queued_at)
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+
+    def _execute(self, job_id: str, queued_at: float) -> None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT filename, target_role, profile, content FROM resume_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return
+
+        filename, target_role, profile, content = row[0], row[1], row[2], row[3]
+        timings: Dict[str, float] = {'queue_wait': round(time.time() - queued_at, 4)}
+        self._update(job_id, timings=json.dumps(timings))
+
+        try:
+            analysis = self._analyze(bytes(content), filename, profile)
+            timings.update(analysis.get('timings', {}))
+
+            started = time.perf_counter()
+            roadmap = self._build_payload(analysis['skills'], target_role or 'general')
+            timings['roadmap'] = round(time.perf_counter() - started, 4)
+
+            self._update(
+                job_id,
+                status=COMPLETED,
+                timings=json.dumps(timings),
+                result=json.dumps({'skills': analysis['skills'], 'roadmap': roadmap}),
+                content=None,
+            )
+        except Exception as e:
+            self._update(job_id, status=FAILED, timings=json.dumps(timings), error=str(e), content=None)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT job_id, status, filename, target_role, profile, timings, result, error, created_at, updated_at
+                FROM resume_jobs WHERE job_id = ?
+                """,
+                (job_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+
+        job = dict(zip(
+            ('job_id', 'status', 'filename', 'target_role', 'profile', 'timings', 'result', 'error', 'created_at', 'updated_at'),
+            row,
+        ))
+        job['timings'] = json.loads(job['timings']) if job['timings'] else {}
+        result = json.loads(job.pop('result')) if job['result'] else None
+        job['skills'] = result['skills'] if result else None
+        job['roadmap'] = result['roadmap'] if result else None
+        return job
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._executor.shutdown(wait=False)
+
+
+_runner: Optional[ResumeJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> ResumeJobRunner:
+    """Return the process-wide job runner, resuming unfinished jobs on first use."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                try:
+                    workers = int(os.getenv('RESUME_JOB_THREADS', '2'))
+                except Exception:
+                    workers = 2
+                try:
+                    lease_seconds = float(os.getenv('RESUME_JOB_LEASE_SECONDS', '300'))
+                except Exception:
+                    lease_seconds = 300.0
+                runner = ResumeJobRunner(max_workers=workers, lease_seconds=lease_seconds)
+                runner.recover()
+                _runner = runner
+    return _runner
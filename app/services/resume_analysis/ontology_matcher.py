@@ -0,0 +1,237 @@
+"""Compiled multi-pattern matcher for the skill ontology.
+
+The ontology is compiled once into an Aho-Corasick automaton so that every
+skill occurrence in a resume is found in a single linear pass over the text,
+instead of one substring scan per ontology entry.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    # '+' and '#' are part of skill names such as "c++" and "c#", so they must
+    # not act as boundaries (otherwise "c" would match inside "c++").
+    return ch.isalnum() or ch in '_+#'
+
+
+class _Automaton:
+    """Plain Aho-Corasick automaton reporting (pattern_id, end) for every occurrence."""
+
+    def __init__(self, patterns: Sequence[str]):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+
+        for pid, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pid)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                yield pid, i + 1
+
+
+def substring_occurrences(needles: Iterable[str], text: str) -> Dict[str, Tuple[int, List[int]]]:
+    """``(text.count(n), every text.find(n) start)`` for each needle, in one pass.
+
+    Unlike OntologyMatcher there are no word boundaries: "java" occurs inside
+    "javascript". Starts may overlap; the count, like str.count, does not.
+    """
+    needles = tuple(dict.fromkeys(n for n in needles if n))
+    starts: List[List[int]] = [[] for _ in needles]
+    for pid, end in _Automaton(needles).iter_matches(text):
+        starts[pid].append(end - len(needles[pid]))
+
+    occurrences: Dict[str, Tuple[int, List[int]]] = {}
+    for needle, positions in zip(needles, starts):
+        count, free_from = 0, 0
+        for start in positions:
+            if start >= free_from:
+                count += 1
+                free_from = start + len(needle)
+        occurrences[needle] = (count, positions)
+    return occurrences
+
+
+class OntologyHit(NamedTuple):
+    skill: str
+    start: int
+    end: int
+
+
+class OntologyMatch(NamedTuple):
+    hits: List[OntologyHit]
+    skills: Set[str]
+
+
+class OntologyMatcher:
+    """Aho-Corasick automaton over lowercase ontology skills.
+
+    Besides whole-skill hits, the words of multi-word skills are compiled as
+    auxiliary patterns so a skill like "machine learning" is still reported
+    when all of its words occur in the text, as the old extractor did.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: Tuple[str, ...] = tuple(
+            dict.fromkeys(s.strip().lower() for s in skills if s and s.strip())
+        )
+
+        self._patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+        self._is_skill: List[bool] = []
+        # pattern id -> multi-word skills that contain the pattern as a word
+        self._word_of: List[List[str]] = []
+        self._multi_word: Dict[str, Tuple[int, ...]] = {}
+
+        for skill in self.skills:
+            self._is_skill[self._add_pattern(skill)] = True
+            words = skill.split()
+            if len(words) > 1:
+                word_ids = []
+                for word in dict.fromkeys(words):
+                    pid = self._add_pattern(word)
+                    self._word_of[pid].append(skill)
+                    word_ids.append(pid)
+                self._multi_word[skill] = tuple(word_ids)
+
+        self._bounds = [
+            (_is_word_char(p[0]), _is_word_char(p[-1])) for p in self._patterns
+        ]
+        self._automaton = _Automaton(self._patterns)
+
+    def _add_pattern(self, pattern: str) -> int:
+        pid = self._pattern_ids.get(pattern)
+        if pid is None:
+            pid = len(self._patterns)
+            self._pattern_ids[pattern] = pid
+            self._patterns.append(pattern)
+            self._is_skill.append(False)
+            self._word_of.append([])
+        return pid
+
+    def _scan(self, text: str) -> List[Tuple[int, int, int]]:
+        """Return (pattern_id, start, end) for every word-bounded occurrence."""
+        patterns, bounds = self._patterns, self._bounds
+        n = len(text)
+        found = []
+        for pid, end in self._automaton.iter_matches(text):
+            start = end - len(patterns[pid])
+            need_left, need_right = bounds[pid]
+            if need_left and start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if need_right and end < n and _is_word_char(text[end]):
+                continue
+            found.append((pid, start, end))
+        return found
+
+    def find_all(self, text: str) -> List[OntologyHit]:
+        """Return every whole-skill occurrence in ``text`` with its offsets.
+
+        ``text`` is expected to be lowercase (e.g. the output of
+        ``normalize_text``); offsets index into that string.
+        """
+        return self.match(text).hits
+
+    def match(self, text: str) -> OntologyMatch:
+        """Scan ``text`` once and return the skill hits and matched skill set."""
+        hits: List[OntologyHit] = []
+        skills: Set[str] = set()
+        seen_words: Set[int] = set()
+
+        for pid, start, end in self._scan(text):
+            if self._is_skill[pid]:
+                skill = self._patterns[pid]
+                hits.append(OntologyHit(skill, start, end))
+                skills.add(skill)
+            if self._word_of[pid]:
+                seen_words.add(pid)
+
+        for pid in seen_words:
+            for skill in self._word_of[pid]:
+                if skill not in skills and all(w in seen_words for w in self._multi_word[skill]):
+                    skills.add(skill)
+
+        hits.sort(key=lambda h: (h.start, h.end))
+        return OntologyMatch(hits=hits, skills=skills)
+
+
+class SkillContainmentIndex:
+    """Finds skills that contain, or are contained in, a short phrase.
+
+    This is the bidirectional substring test used to map spaCy noun chunks and
+    KeyBERT keywords back onto the ontology (``skill in phrase or phrase in
+    skill``), answered without looping over the whole ontology:
+
+    - skills inside the phrase come from one automaton pass over the phrase;
+    - skills containing the phrase are looked up through a character-trigram
+      index (every skill containing the phrase contains all its trigrams),
+      then verified. Phrases shorter than a trigram use a direct map of all
+      one- and two-character substrings.
+    """
+
+    GRAM = 3
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: Tuple[str, ...] = tuple(dict.fromkeys(s for s in skills if s))
+        self._automaton = _Automaton(self.skills)
+
+        grams: Dict[str, List[int]] = {}
+        short: Dict[str, List[int]] = {}
+        for sid, skill in enumerate(self.skills):
+            for size, index in ((self.GRAM, grams), (1, short), (2, short)):
+                for sub in {skill[i:i + size] for i in range(len(skill) - size + 1)}:
+                    index.setdefault(sub, []).append(sid)
+        self._grams = grams
+        self._short = short
+
+    def related(self, phrase: str) -> Set[str]:
+        skills = self.skills
+        if not phrase:
+            return set(skills)
+
+        found = {skills[sid] for sid, _ in self._automaton.iter_matches(phrase)}
+
+        if len(phrase) < self.GRAM:
+            found.update(skills[sid] for sid in self._short.get(phrase, ()))
+            return found
+
+        best: Sequence[int] = ()
+        for i in range(len(phrase) - self.GRAM + 1):
+            postings = self._grams.get(phrase[i:i + self.GRAM])
+            if not postings:
+                return found
+            if not best or len(postings) < len(best):
+                best = postings
+        found.update(skills[sid] for sid in best if phrase in skills[sid])
+        return found
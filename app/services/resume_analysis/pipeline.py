@@ -0,0 +1,144 @@
+"""The resume analysis pipeline: extract_text -> ResumeDocument -> extract_skills -> score_skills.
+
+Kept as a plain top-level function over bytes (or the path of a spooled
+upload) so it can run either on the request thread or inside a worker process.
+"""
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.models.schemas import Skill
+from app.services.resume_analysis.course_mapper import map_courses_to_skills
+from app.services.resume_analysis.extractor import ResumeSource, extract_text
+from app.services.resume_analysis.deadline import Deadline
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.roadmap import generate_roadmap
+from app.services.resume_analysis.profiles import get_profile
+from app.services.resume_analysis.scorer import score_skills
+from app.services.resume_analysis.skill_extractor import extract_skills, extract_skills_batch
+
+
+def analyze_resume_bytes(content: ResumeSource, filename: str, score: bool = True,
+                         profile: Optional[str] = None, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """Run the pipeline on an uploaded file with the given NLP profile.
+
+    Returns {"extracted_skills": [...], "skills": [{name, confidence}, ...],
+    "profile": name, "timings": {stage: seconds}, "skipped_stages": [...],
+    "degraded": bool}; "skills" is empty when score is False, "skipped_stages"
+    lists what the deadline or page/character caps cut, and "degraded" is
+    True when the deadline did.
+    """
+    profile_name = get_profile(profile).name
+    deadline = deadline or Deadline()
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    raw_text = extract_text(content, filename, deadline)
+    timings["extract_text"] = round(time.perf_counter() - started, 4)
+
+    started = time.perf_counter()
+    document = ResumeDocument(raw_text)
+    timings["normalize_text"] = round(time.perf_counter() - started, 4)
+
+    started = time.perf_counter()
+    skills_list = extract_skills(document, profile_name, deadline)
+    timings["extract_skills"] = round(time.perf_counter() - started, 4)
+
+    scored = []
+    if score:
+        started = time.perf_counter()
+        scored = [
+            {"name": skill.name, "confidence": skill.confidence}
+            for skill in score_skills(skills_list, document)
+        ]
+        timings["score_skills"] = round(time.perf_counter() - started, 4)
+
+    return {
+        "extracted_skills": skills_list,
+        "skills": scored,
+        "profile": profile_name,
+        "timings": timings,
+        "skipped_stages": deadline.skipped,
+        "degraded": deadline.degraded,
+    }
+
+
+def analyze_resume_batch(files: List[Tuple[ResumeSource, str]], profile: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Run the scored pipeline on several uploads, batching the NLP stage.
+
+    ``files`` holds (bytes or spooled file path, filename) pairs. Text
+    extraction and scoring stay per file; spaCy and KeyBERT see all
+    readable files in one extract_skills_batch call. Returns one dict per
+    input, in order: the analyze_resume_bytes result, or {"error": message}
+    for a file that could not be read.
+    """
+    profile_name = get_profile(profile).name
+    results: List[Dict[str, Any]] = [{"profile": profile_name} for _ in files]
+    documents: List[Tuple[int, ResumeDocument]] = []
+
+    for index, (content, filename) in enumerate(files):
+        try:
+            started = time.perf_counter()
+            raw_text = extract_text(content, filename)
+            extract_seconds = round(time.perf_counter() - started, 4)
+
+            started = time.perf_counter()
+            document = ResumeDocument(raw_text)
+            results[index]["timings"] = {
+                "extract_text": extract_seconds,
+                "normalize_text": round(time.perf_counter() - started, 4),
+            }
+            documents.append((index, document))
+        except Exception as e:
+            results[index] = {"error": str(e)}
+
+    started = time.perf_counter()
+    skills_lists = extract_skills_batch([document for _, document in documents], profile_name)
+    # The NLP stage is shared, so each file is charged an equal share of it
+    shared_seconds = round((time.perf_counter() - started) / max(1, len(documents)), 4)
+
+    for (index, document), skills_list in zip(documents, skills_lists):
+        result = results[index]
+        result["timings"]["extract_skills"] = shared_seconds
+        started = time.perf_counter()
+        try:
+            result["skills"] = [
+                {"name": skill.name, "confidence": skill.confidence}
+                for skill in score_skills(skills_list, document)
+            ]
+        except Exception as e:
+            results[index] = {"error": str(e)}
+            continue
+        result["timings"]["score_skills"] = round(time.perf_counter() - started, 4)
+        result["extracted_skills"] = skills_list
+
+    return results
+
+
+def build_roadmap_payload(final_skills: List[Dict[str, Any]], target_role: str) -> List[Dict[str, Any]]:
+    """Generate the course-mapped roadmap for scored skills, as JSON-ready dicts."""
+    roadmap_phases = generate_roadmap(
+        [Skill(name=s["name"], confidence=s["confidence"]) for s in final_skills],
+        target_role
+    )
+    roadmap_with_courses = map_courses_to_skills(roadmap_phases)
+
+    roadmap_response = []
+    for phase in roadmap_with_courses:
+        roadmap_response.append({
+            "phase": phase.phase,
+            "skills": [
+                {
+                    "name": skill.name,
+                    "courses": [
+                        {
+                            "platform": course.platform,
+                            "title": course.title,
+                            "url": course.url
+                        }
+                        for course in skill.courses
+                    ]
+                }
+                for skill in phase.skills
+            ]
+        })
+    return roadmap_response
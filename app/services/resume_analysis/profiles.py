@@ -0,0 +1,111 @@
+"""Named NLP profiles for resume skill extraction.
+
+  - fast: ontology automaton only (no models)
+  - balanced: + spaCy noun chunks (the model is loaded without NER and lemmatizer)
+  - accurate: + KeyBERT keywords and semantic ontology matching
+
+The deployment default comes from NLP_PROFILE (default "accurate", the
+original behaviour); requests can pick another with a ``profile`` parameter.
+``python -m app.services.resume_analysis.profiles`` measures each profile's
+latency and recall against profile_fixtures.json.
+"""
+import json
+import os
+import statistics
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+DEFAULT_PROFILE = 'accurate'
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profile_fixtures.json')
+
+
+class NLPProfile(NamedTuple):
+    name: str
+    use_spacy: bool
+    use_keybert: bool
+    keybert_top_n: int
+    description: str
+
+
+PROFILES: Dict[str, NLPProfile] = {
+    'fast': NLPProfile('fast', False, False, 0, 'Ontology automaton only'),
+    'balanced': NLPProfile('balanced', True, False, 0, 'Ontology + spaCy noun chunks'),
+    'accurate': NLPProfile('accurate', True, True, 30, 'Ontology + spaCy + KeyBERT semantic matching'),
+}
+
+
+class UnknownProfileError(ValueError):
+    """Raised for a profile name that is not in PROFILES."""
+
+
+def get_profile(name: Optional[str] = None) -> NLPProfile:
+    """Resolve a profile name, falling back to NLP_PROFILE and then DEFAULT_PROFILE."""
+    key = (name or os.getenv('NLP_PROFILE') or DEFAULT_PROFILE).strip().lower()
+    if key not in PROFILES:
+        raise UnknownProfileError(f"Unknown NLP profile '{key}' (expected one of: {', '.join(PROFILES)})")
+    return PROFILES[key]
+
+
+def required_models(profile: NLPProfile) -> List[str]:
+    models = []
+    if profile.use_spacy:
+        models.append('spacy')
+    if profile.use_keybert:
+        models.append('keybert')
+    return models
+
+
+def load_fixtures(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    with open(path or FIXTURES_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def benchmark_profiles(fixtures: Optional[List[Dict[str, Any]]] = None,
+                       names: Optional[Iterable[str]] = None,
+                       repeat: int = 3) -> Dict[str, Dict[str, Any]]:
+    """Measure median latency per resume and skill recall for each profile.
+
+    Recall is micro-averaged over the fixtures' expected skills. Models are
+    loaded (and warmed up) before timing, and their load state is reported,
+    since a profile whose model is unavailable degrades to the one below it.
+    """
+    from app.services.model_manager import model_manager
+    from app.services.resume_analysis.document import ResumeDocument
+    from app.services.resume_analysis.skill_extractor import extract_skills, warm_up_resume_pipeline
+
+    fixtures = fixtures if fixtures is not None else load_fixtures()
+    report: Dict[str, Dict[str, Any]] = {}
+
+    for name in names or PROFILES:
+        profile = get_profile(name)
+        warm_up_resume_pipeline(profile.name)
+
+        latencies: List[float] = []
+        expected_total = found_total = 0
+        for fixture in fixtures:
+            document = ResumeDocument(fixture['text'])
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                skills = extract_skills(document, profile.name)
+                latencies.append(time.perf_counter() - started)
+            expected = {s.lower() for s in fixture['skills']}
+            expected_total += len(expected)
+            found_total += len(expected & {s.lower() for s in skills})
+
+        status = model_manager.status()
+        report[profile.name] = {
+            'description': profile.description,
+            'latency_ms': round(statistics.median(latencies) * 1000, 2) if latencies else 0.0,
+            'recall': round(found_total / expected_total, 3) if expected_total else 1.0,
+            'models': {model: status[model]['state'] for model in required_models(profile)},
+        }
+    return report
+
+
+if __name__ == '__main__':
+    results = benchmark_profiles()
+    print(f"{'profile':<10} {'latency_ms':>11} {'recall':>7}  models")
+    for name, row in results.items():
+        models = ', '.join(f"{m}={s}" for m, s in row['models'].items()) or '-'
+        print(f"{name:<10} {row['latency_ms']:>11} {row['recall']:>7}  {models}")
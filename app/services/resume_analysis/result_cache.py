@@ -0,0 +1,203 @@
+"""Content-addressed cache for resume analysis results.
+
+Users often re-upload the same file (retrying, switching target role). Results
+are keyed by the SHA-256 of the uploaded bytes, the NLP profile and the
+reference-data version, so a changed ontology never serves stale skills. Entries live in a bounded
+in-memory LRU and, optionally, in the ``resume_analysis_cache`` table (created
+by app.migrations) shared by all workers.
+Concurrent identical uploads are coalesced: only the first runs the pipeline,
+the others wait for its result.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Union
+
+from app.database import get_db_connection
+from app.services.reference_data import get_reference_data
+from app.services.resume_analysis.deadline import Deadline
+from app.services.resume_analysis.pipeline import analyze_resume_bytes
+from app.services.resume_analysis.profiles import get_profile
+from app.services.resume_analysis.uploads import file_sha256
+from app.services.resume_analysis.worker_pool import get_resume_pool
+
+
+def resume_cache_key(content: Union[bytes, str], filename: str, profile: Optional[str] = None,
+                     digest: Optional[str] = None) -> str:
+    """SHA-256 of the upload + file type + NLP profile + reference-data version.
+
+    ``content`` is the upload's bytes or the path of its spooled copy; pass
+    ``digest`` when the SHA-256 is already known (SpooledUpload.sha256).
+    """
+    if digest is None:
+        digest = file_sha256(content) if isinstance(content, str) else hashlib.sha256(content).hexdigest()
+    extension = os.path.splitext(filename or '')[1].lower()
+    version = '.'.join(str(v) for v in get_reference_data().version)
+    return f"{digest}:{extension}:{get_profile(profile).name}:{version}"
+
+
+class ResumeResultCache:
+    def __init__(self, max_entries: int = 256, use_sqlite: bool = False, max_sqlite_rows: int = 5000,
+                 connect: Callable = get_db_connection):
+        self.max_entries = max(0, max_entries)
+        self.use_sqlite = use_sqlite
+        self.max_sqlite_rows = max_sqlite_rows
+        self._connect = connect
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _sqlite_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.use_sqlite:
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT result FROM resume_analysis_cache WHERE cache_key = ?', (key,)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception:
+            return None
+        finally:
+            conn.close()
+
+    def _sqlite_put(self, key: str, result: Dict[str, Any]) -> None:
+        if not self.use_sqlite:
+            return
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO resume_analysis_cache (cache_key, result) VALUES (?, ?)',
+                (key, json.dumps(result)),
+            )
+            conn.execute(
+                """
+                DELETE FROM resume_analysis_cache WHERE cache_key NOT IN (
+                    SELECT cache_key FROM resume_analysis_cache ORDER BY created_at DESC LIMIT ?
+                )
+                """,
+                (self.max_sqlite_rows,),
+            )
+            conn.commit()
+        except Exception:
+            pass
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result without computing it (used by batch analysis)."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        result = self._sqlite_get(key)
+        with self._lock:
+            if result is not None:
+                self.hits += 1
+                self._remember(key, result)
+            else:
+                self.misses += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self._sqlite_put(key, result)
+        with self._lock:
+            self._remember(key, result)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        owner = False
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                owner = True
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._sqlite_get(key)
+            if result is not None:
+                with self._lock:
+                    self.hits += 1
+                    self._remember(key, result)
+            else:
+                with self._lock:
+                    self.misses += 1
+                result = compute()
+                # Results degraded by a deadline must not stand in for full ones
+                if not result.get('degraded'):
+                    self._sqlite_put(key, result)
+                    with self._lock:
+                        self._remember(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'sqlite': self.use_sqlite,
+        }
+
+
+_cache: Optional[ResumeResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> ResumeResultCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    max_entries = int(os.getenv('RESUME_CACHE_SIZE', '256'))
+                except Exception:
+                    max_entries = 256
+                use_sqlite = os.getenv('RESUME_CACHE_SQLITE', '0').strip().lower() in ('1', 'true', 'yes')
+                _cache = ResumeResultCache(max_entries=max_entries, use_sqlite=use_sqlite)
+    return _cache
+
+
+def cached_analyze_resume(content: Union[bytes, str], filename: str, profile: Optional[str] = None,
+                          deadline: Optional[Deadline] = None, digest: Optional[str] = None) -> Dict[str, Any]:
+    """Run the scored pipeline in the worker pool, reusing cached results.
+
+    ``content`` may be the path of a spooled upload, which must exist until
+    this returns; only the path is sent to the worker process.
+    """
+    # Resolved here so workers use this process's NLP_PROFILE default
+    profile_name = get_profile(profile).name
+    return get_resume_cache().get_or_compute(
+        resume_cache_key(content, filename, profile_name, digest),
+        lambda: get_resume_pool().run(analyze_resume_bytes, content, filename, True, profile_name, deadline),
+    )
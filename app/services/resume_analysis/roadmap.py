@@ -3,36 +3,12 @@ import os
 from typing import List, Dict, Set
 from app.models.schemas import Skill, RoadmapPhase, RoadmapSkill
 
-from app.database import get_db_connection
+from app.services.reference_data import get_reference_data
 from typing import Dict, List
 
 def _load_roles() -> Dict:
-    conn = get_db_connection()
-    roles_data = {}
-    try:
-        # Structure: role -> {sector: sector_name, category -> list of skills}
-        rows = conn.execute('SELECT role_name, category, skill, sector FROM roles').fetchall()
-        
-        for row in rows:
-            role = row['role_name']
-            category = row['category']
-            skill = row['skill']
-            # sqlite3.Row doesn't have .get(), use dictionary access
-            try:
-                sector = row['sector']
-            except (IndexError, KeyError, TypeError):
-                sector = 'Technology'
-            
-            if role not in roles_data:
-                roles_data[role] = {'sector': sector}
-            if category not in roles_data[role]:
-                roles_data[role][category] = []
-                
-            roles_data[role][category].append(skill)
-            
-    finally:
-        conn.close()
-    return roles_data
+    """Return role -> {sector, category -> skills} from the shared reference snapshot."""
+    return get_reference_data().roles
 
 from app.services.resume_analysis.utils import match_role
 
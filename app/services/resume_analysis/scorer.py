@@ -1,39 +1,18 @@
 import re
-from typing import List, Dict
+from bisect import bisect_left
+from typing import List, Dict, Optional, Tuple
 from app.models.schemas import Skill
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.ontology_matcher import substring_occurrences
 
 ACTION_VERBS = {"built", "developed", "implemented", "designed", "created", "architected"}
 
-def _detect_section(text: str, section_name: str) -> bool:
-    patterns = [
-        rf"\b{section_name}\b",
-        rf"{section_name}:",
-        rf"{section_name}\s*:",
-    ]
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
-
-def _get_section_weight(text: str, skill: str, skill_pos: int) -> float:
-    text_lower = text.lower()
-    skill_lower = skill.lower()
-    
-    start_pos = max(0, skill_pos - 200)
-    end_pos = min(len(text), skill_pos + 200)
-    context = text_lower[start_pos:end_pos]
-    
-    if _detect_section(context, "experience") or _detect_section(context, "work"):
-        return 3.0
-    elif _detect_section(context, "project"):
-        return 2.0
-    elif _detect_section(context, "skill"):
-        return 1.0
-    return 1.0
+SECTION_WINDOW = 200
+ACTION_VERB_WINDOW = 50
 
 def _has_action_verb_nearby(text: str, skill: str, skill_pos: int) -> bool:
-    start_pos = max(0, skill_pos - 50)
-    end_pos = min(len(text), skill_pos + 50)
+    start_pos = max(0, skill_pos - ACTION_VERB_WINDOW)
+    end_pos = min(len(text), skill_pos + ACTION_VERB_WINDOW)
     context = text[start_pos:end_pos].lower()
     
     for verb in ACTION_VERBS:
@@ -41,32 +20,133 @@ def _has_action_verb_nearby(text: str, skill: str, skill_pos: int) -> bool:
             return True
     return False
 
-def score_skills(skills_list: List[str], raw_text: str) -> List[Skill]:
-    text_lower = raw_text.lower()
+_INF = float("inf")
+
+def _is_word_char(text: str, pos: int) -> bool:
+    return re.match(r"\w", text[pos]) is not None
+
+class _SpanIndex:
+    """Sorted (start, end) spans answering "is any span inside [a, b)?" with one bisect."""
+
+    def __init__(self, spans: List[Tuple[int, float]]):
+        spans.sort()
+        self.starts = [start for start, _ in spans]
+        # suffix_min[i] = smallest end among spans[i:]
+        self.suffix_min = [_INF] * (len(spans) + 1)
+        for i in range(len(spans) - 1, -1, -1):
+            self.suffix_min[i] = min(spans[i][1], self.suffix_min[i + 1])
+
+    def any_within(self, a: int, b: int) -> bool:
+        return self.suffix_min[bisect_left(self.starts, a)] <= b
+
+class _SectionKeyword:
+    """Windows text_lower[a:b] that mention a section name, precomputed once.
+
+    An occurrence of the name counts inside a window if it ends with "\\s*:"
+    inside the window, or if it has word boundaries on both sides, where the
+    window edges themselves count as boundaries (as they do for re.search on
+    the sliced context).
+    """
+
+    def __init__(self, text_lower: str, name: str):
+        colon = re.compile(r"\s*:")
+        spans: List[Tuple[int, float]] = []
+        self.by_start: Dict[int, Tuple[int, bool]] = {}
+        self.by_end: Dict[int, int] = {}
+        n = len(text_lower)
+
+        for match in re.finditer(rf"(?=({name}))", text_lower, re.IGNORECASE):
+            start, end = match.start(1), match.end(1)
+            left_ok = start == 0 or not _is_word_char(text_lower, start - 1)
+            right_ok = end == n or not _is_word_char(text_lower, end)
+            colon_match = colon.match(text_lower, end)
+
+            required_end = _INF
+            if left_ok and right_ok:
+                required_end = end
+            if colon_match:
+                required_end = min(required_end, colon_match.end())
+            spans.append((start, required_end))
+
+            # Occurrences touching a window edge get a free boundary on that side
+            self.by_start[start] = (end, right_ok)
+            if left_ok:
+                self.by_end[end] = start
+
+        self.spans = _SpanIndex(spans)
+
+    def in_window(self, a: int, b: int) -> bool:
+        if self.spans.any_within(a, b):
+            return True
+        at_start = self.by_start.get(a)
+        if at_start is not None and at_start[0] <= b and (at_start[1] or at_start[0] == b):
+            return True
+        at_end = self.by_end.get(b)
+        return at_end is not None and at_end >= a
+
+class ResumeSections:
+    """One-pass map of section keywords and action verbs for score_skills.
+
+    For any position it answers which section keyword (experience or work,
+    then project) occurs within SECTION_WINDOW characters, and whether an
+    action verb occurs within ACTION_VERB_WINDOW, via bisect lookups instead
+    of re-lowercasing and regex-scanning a window per skill occurrence.
+    """
+
+    def __init__(self, raw_text: str, text_lower: Optional[str] = None):
+        self.length = len(raw_text)
+        if text_lower is None:
+            text_lower = raw_text.lower()
+        # Lowercasing can change the length of a few characters (e.g. "İ"); keep
+        # the per-window checks for those texts so scores stay identical.
+        self._fallback_text: Optional[str] = raw_text if len(text_lower) != len(raw_text) else None
+
+        self.experience = _SectionKeyword(text_lower, "experience")
+        self.work = _SectionKeyword(text_lower, "work")
+        self.project = _SectionKeyword(text_lower, "project")
+
+        verb_spans: List[Tuple[int, float]] = []
+        for verb in ACTION_VERBS:
+            start = text_lower.find(verb)
+            while start != -1:
+                verb_spans.append((start, start + len(verb)))
+                start = text_lower.find(verb, start + 1)
+        self.verbs = _SpanIndex(verb_spans)
+
+    def section_weight(self, pos: int) -> float:
+        a = max(0, pos - SECTION_WINDOW)
+        b = min(self.length, pos + SECTION_WINDOW)
+        if self.experience.in_window(a, b) or self.work.in_window(a, b):
+            return 3.0
+        if self.project.in_window(a, b):
+            return 2.0
+        return 1.0
+
+    def has_action_verb_nearby(self, pos: int) -> bool:
+        if self._fallback_text is not None:
+            return _has_action_verb_nearby(self._fallback_text, "", pos)
+        a = max(0, pos - ACTION_VERB_WINDOW)
+        b = min(self.length, pos + ACTION_VERB_WINDOW)
+        return self.verbs.any_within(a, b)
+
+def score_skills(skills_list: List[str], document: ResumeDocument) -> List[Skill]:
+    sections = document.sections
     skill_scores: Dict[str, float] = {}
+    # Every skill's occurrences in one automaton pass over the text
+    occurrences = substring_occurrences((skill.lower() for skill in skills_list), document.lower)
     
     for skill in skills_list:
-        skill_lower = skill.lower()
-        count = text_lower.count(skill_lower)
+        count, positions = occurrences.get(skill.lower(), (0, []))
         
         if count == 0:
             continue
         
         base_score = count * 0.1
         
-        positions = []
-        start = 0
-        while True:
-            pos = text_lower.find(skill_lower, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
-        
         total_weighted_score = 0.0
         for pos in positions:
-            section_weight = _get_section_weight(raw_text, skill, pos)
-            action_bonus = 0.2 if _has_action_verb_nearby(raw_text, skill, pos) else 0.0
+            section_weight = sections.section_weight(pos)
+            action_bonus = 0.2 if sections.has_action_verb_nearby(pos) else 0.0
             total_weighted_score += (base_score * section_weight) + action_bonus
         
         skill_scores[skill] = total_weighted_score
@@ -0,0 +1,123 @@
+"""Semantic matching of resume phrases against the skill ontology.
+
+The ontology is embedded once with the sentence-transformers model KeyBERT
+already uses and cached on disk as a NumPy matrix. Resume phrases are then
+matched with a single cosine-similarity matmul, which also catches synonyms
+and abbreviations ("ml" vs "machine learning") that substring tests miss.
+"""
+import os
+from typing import Callable, Iterable, Optional, Sequence, Set, Tuple
+
+# KeyBERT's default sentence-transformers model
+KEYBERT_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+DEFAULT_EMBEDDINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ontology_embeddings.npz')
+
+EmbedFn = Callable[[Sequence[str]], 'numpy.ndarray']
+
+
+def embeddings_path() -> str:
+    return os.getenv('ONTOLOGY_EMBEDDINGS_PATH', DEFAULT_EMBEDDINGS_PATH)
+
+
+def semantic_match_threshold() -> float:
+    try:
+        return float(os.getenv('SEMANTIC_MATCH_THRESHOLD', '0.7'))
+    except Exception:
+        return 0.7
+
+
+def _numpy():
+    # Imported lazily so that importing the API does not pull in NumPy.
+    try:
+        import numpy
+        return numpy
+    except Exception:
+        return None
+
+
+def _normalize_rows(matrix):
+    np = _numpy()
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class OntologyEmbeddings:
+    """Row-normalized embedding matrix aligned with a tuple of ontology skills."""
+
+    def __init__(self, skills: Iterable[str], matrix, model_name: str = KEYBERT_MODEL_NAME):
+        self.skills: Tuple[str, ...] = tuple(skills)
+        self.matrix = _normalize_rows(matrix)
+        self.model_name = model_name
+        if self.matrix.shape[0] != len(self.skills):
+            raise ValueError("Embedding matrix does not match the number of skills")
+
+    @classmethod
+    def build(cls, skills: Iterable[str], embed: EmbedFn, model_name: str = KEYBERT_MODEL_NAME) -> 'OntologyEmbeddings':
+        skills = tuple(skills)
+        return cls(skills, embed(list(skills)), model_name)
+
+    @classmethod
+    def load(cls, path: str, skills: Iterable[str], model_name: str = KEYBERT_MODEL_NAME) -> Optional['OntologyEmbeddings']:
+        """Load a cached matrix, or return None if it is missing or stale."""
+        if not os.path.exists(path):
+            return None
+        np = _numpy()
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                cached_skills = tuple(str(s) for s in data['skills'])
+                cached_model = str(data['model_name'])
+                matrix = data['matrix']
+        except Exception:
+            return None
+        if cached_skills != tuple(skills) or cached_model != model_name:
+            return None
+        return cls(cached_skills, matrix, cached_model)
+
+    def save(self, path: str) -> None:
+        np = _numpy()
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            skills=np.array(self.skills, dtype=str),
+            model_name=np.array(self.model_name),
+            matrix=self.matrix,
+        )
+        os.replace(tmp_path, path)
+
+    def match(self, phrase_vectors, threshold: Optional[float] = None) -> Set[str]:
+        """Return skills whose cosine similarity to any phrase is >= threshold."""
+        np = _numpy()
+        if threshold is None:
+            threshold = semantic_match_threshold()
+        vectors = _normalize_rows(phrase_vectors)
+        if vectors.shape[0] == 0 or not self.skills:
+            return set()
+        similarities = vectors @ self.matrix.T
+        matched = np.flatnonzero((similarities >= threshold).any(axis=0))
+        return {self.skills[i] for i in matched}
+
+
+def load_or_build_ontology_embeddings(
+    skills: Iterable[str],
+    embed: EmbedFn,
+    model_name: str = KEYBERT_MODEL_NAME,
+    path: Optional[str] = None,
+) -> Optional[OntologyEmbeddings]:
+    """Return ontology embeddings from disk, embedding and caching them if stale."""
+    if _numpy() is None:
+        return None
+    skills = tuple(skills)
+    path = path or embeddings_path()
+    embeddings = OntologyEmbeddings.load(path, skills, model_name)
+    if embeddings is None:
+        embeddings = OntologyEmbeddings.build(skills, embed, model_name)
+        try:
+            embeddings.save(path)
+        except OSError:
+            pass
+    return embeddings
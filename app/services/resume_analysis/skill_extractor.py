@@ -1,96 +1,178 @@
 import json
 import os
-from typing import List, Set
+import time
+from typing import List, Optional, Set
 
-nlp = None
-kw_model = None
-spacy_available = False
+from app.services.model_manager import model_manager
 
-try:
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+# Only noun chunks are used, which need the tagger and parser but not these
+SPACY_EXCLUDED_PIPES = ["ner", "lemmatizer"]
+
+WARM_UP_TEXT = "Experience: built REST APIs in Python and Flask, deployed with Docker."
+
+def _create_nlp():
     import spacy
-    spacy_available = True
-except Exception:
-    spacy_available = False
+    return spacy.load(SPACY_MODEL_NAME, exclude=SPACY_EXCLUDED_PIPES)
 
-try:
+def _create_keybert():
     from keybert import KeyBERT
-    keybert_available = True
-except Exception:
-    keybert_available = False
+    return KeyBERT(model=KEYBERT_MODEL_NAME)
+
+model_manager.register("spacy", _create_nlp, warm_up=lambda nlp: nlp(WARM_UP_TEXT))
+model_manager.register(
+    "keybert",
+    _create_keybert,
+    warm_up=lambda kw: kw.extract_keywords(WARM_UP_TEXT, keyphrase_ngram_range=(1, 2), top_n=5),
+)
 
 def _load_nlp():
-    global nlp
-    if nlp is None and spacy_available:
-        try:
-            nlp = spacy.load("en_core_web_sm")
-        except Exception:
-            nlp = None
-    return nlp
+    return model_manager.get("spacy")
 
 def _load_keybert():
-    global kw_model
-    if kw_model is None and keybert_available:
-        try:
-            kw_model = KeyBERT()
-        except Exception:
-            kw_model = None
-    return kw_model
+    return model_manager.get("keybert")
 
-from app.database import get_db_connection
+from app.services.reference_data import get_reference_data
+from app.services.resume_analysis.deadline import Deadline, stage_costs
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.profiles import get_profile, required_models
+from app.services.resume_analysis.ontology_matcher import (
+    OntologyHit,
+    OntologyMatcher,
+    SkillContainmentIndex,
+)
+from app.services.resume_analysis.semantic_matcher import (
+    KEYBERT_MODEL_NAME,
+    OntologyEmbeddings,
+    load_or_build_ontology_embeddings,
+)
 
 def _load_ontology() -> List[str]:
-    conn = get_db_connection()
-    ontology_skills = []
-    try:
-        rows = conn.execute('SELECT skill FROM ontology').fetchall()
-        ontology_skills = [row['skill'] for row in rows]
-    finally:
-        conn.close()
-    return ontology_skills
-
-def extract_skills(normalized_text: str, raw_text: str) -> List[str]:
-    skills_set: Set[str] = set()
+    return list(get_reference_data().ontology)
+
+def _get_matcher(ref=None) -> OntologyMatcher:
+    ref = ref or get_reference_data()
+    return ref.derived('ontology_matcher', lambda r: OntologyMatcher(r.ontology))
+
+def extract_skill_hits(document: ResumeDocument) -> List[OntologyHit]:
+    """Return every ontology skill occurrence with its offsets in ``document.lower``."""
+    return [
+        OntologyHit(hit.skill, *document.source_span(hit.start, hit.end))
+        for hit in _get_matcher().find_all(document.normalized)
+    ]
+
+def _get_ontology_embeddings(ref, kw_model) -> Optional[OntologyEmbeddings]:
+    return ref.derived(
+        'ontology_embeddings',
+        lambda r: load_or_build_ontology_embeddings(
+            [s.lower() for s in r.ontology], kw_model.model.embed, KEYBERT_MODEL_NAME
+        ),
+    )
+
+def _extract_keywords(kw_model, raw_texts: List[str], top_n: int) -> List[List[str]]:
+    keywords = kw_model.extract_keywords(
+        raw_texts if len(raw_texts) > 1 else raw_texts[0],
+        keyphrase_ngram_range=(1, 2),
+        stop_words='english',
+        top_n=top_n
+    )
+    # KeyBERT returns a flat list for a single document and one list per document otherwise
+    per_doc = keywords if len(raw_texts) > 1 else [keywords]
+    return [[keyword.lower().strip() for keyword, _ in doc_keywords] for doc_keywords in per_doc]
+
+def _fits_budget(deadline: Deadline, stage: str, estimate: float) -> bool:
+    if deadline.allows(estimate):
+        return True
+    deadline.skip(stage, f"estimated {estimate:.2f}s exceeds remaining {max(deadline.remaining(), 0.0):.2f}s")
+    return False
+
+def extract_skills(document: ResumeDocument, profile: Optional[str] = None,
+                   deadline: Optional[Deadline] = None) -> List[str]:
+    return extract_skills_batch([document], profile, deadline)[0]
+
+def extract_skills_batch(documents: List[ResumeDocument], profile: Optional[str] = None,
+                         deadline: Optional[Deadline] = None) -> List[List[str]]:
+    """Extract skills for several documents at once.
+
+    spaCy parses the documents with nlp.pipe and KeyBERT embeds them, and the
+    semantic match embeds every document's keywords, in single batched calls.
+    The NLP profile (see profiles.py) decides which of those stages run; a
+    deadline can drop KeyBERT, and then spaCy, when they would not fit.
+    """
+    if not documents:
+        return []
+    nlp_profile = get_profile(profile)
+    deadline = deadline or Deadline()
+    
+    ref = get_reference_data()
+    matcher = _get_matcher(ref)
+    containment = ref.derived(
+        'ontology_containment',
+        lambda r: SkillContainmentIndex(s.lower() for s in r.ontology),
+    )
+    raw_texts = [document.raw_text for document in documents]
+    chars = sum(len(text) for text in raw_texts)
     
-    ontology_skills = _load_ontology()
-    ontology_lower = [s.lower() for s in ontology_skills]
+    skill_sets: List[Set[str]] = [set(matcher.match(document.normalized).skills) for document in documents]
     
-    for skill in ontology_lower:
-        if skill in normalized_text:
-            skills_set.add(skill)
-        words = skill.split()
-        if len(words) > 1:
-            if all(word in normalized_text for word in words):
-                skills_set.add(skill)
+    # KeyBERT is the first optional stage to go, then spaCy
+    use_spacy = nlp_profile.use_spacy
+    use_keybert = nlp_profile.use_keybert
+    spacy_estimate = stage_costs.estimate('spacy', chars) if use_spacy else 0.0
+    if use_keybert:
+        use_keybert = _fits_budget(deadline, 'keybert', spacy_estimate + stage_costs.estimate('keybert', chars))
+    if use_spacy:
+        use_spacy = _fits_budget(deadline, 'spacy', spacy_estimate)
     
-    nlp_model = _load_nlp()
+    nlp_model = _load_nlp() if use_spacy else None
     if nlp_model is not None:
+        started = time.perf_counter()
         try:
-            doc = nlp_model(raw_text)
-            for chunk in doc.noun_chunks:
-                chunk_text = chunk.text.lower().strip()
-                if len(chunk_text) > 2 and len(chunk_text) < 50:
-                    for skill in ontology_lower:
-                        if skill in chunk_text or chunk_text in skill:
-                            skills_set.add(skill)
+            for skills_set, doc in zip(skill_sets, nlp_model.pipe(raw_texts)):
+                for chunk in doc.noun_chunks:
+                    chunk_text = chunk.text.lower().strip()
+                    if len(chunk_text) > 2 and len(chunk_text) < 50:
+                        skills_set.update(containment.related(chunk_text))
+            stage_costs.record('spacy', chars, time.perf_counter() - started)
         except Exception:
             pass
     
-    kw_model = _load_keybert()
+    # Re-check with the time spaCy actually took
+    if use_keybert:
+        use_keybert = _fits_budget(deadline, 'keybert', stage_costs.estimate('keybert', chars))
+    
+    kw_model = _load_keybert() if use_keybert else None
     if kw_model is not None:
+        started = time.perf_counter()
         try:
-            keywords = kw_model.extract_keywords(
-                raw_text,
-                keyphrase_ngram_range=(1, 2),
-                stop_words='english',
-                top_n=30
-            )
-            
-            for keyword, _ in keywords:
-                keyword_lower = keyword.lower().strip()
-                for skill in ontology_lower:
-                    if skill in keyword_lower or keyword_lower in skill:
-                        skills_set.add(skill)
+            keyword_lists = _extract_keywords(kw_model, raw_texts, nlp_profile.keybert_top_n)
+            for skills_set, keyword_list in zip(skill_sets, keyword_lists):
+                for keyword_lower in keyword_list:
+                    skills_set.update(containment.related(keyword_lower))
         except Exception:
-            pass
+            keyword_lists = []
+        
+        # Catch synonyms and abbreviations with one batched similarity matmul per document
+        all_keywords = [keyword for keyword_list in keyword_lists for keyword in keyword_list]
+        if all_keywords:
+            try:
+                embeddings = _get_ontology_embeddings(ref, kw_model)
+                if embeddings is not None:
+                    vectors = kw_model.model.embed(all_keywords)
+                    offset = 0
+                    for skills_set, keyword_list in zip(skill_sets, keyword_lists):
+                        if keyword_list:
+                            skills_set.update(embeddings.match(vectors[offset:offset + len(keyword_list)]))
+                        offset += len(keyword_list)
+            except Exception:
+                pass
+        stage_costs.record('keybert', chars, time.perf_counter() - started)
     
-    return list(skills_set)
+    return [list(skills_set) for skills_set in skill_sets]
+
+def warm_up_resume_pipeline(profile: Optional[str] = None) -> None:
+    """Load the profile's models and build the ontology structures before the first request."""
+    nlp_profile = get_profile(profile)
+    model_manager.preload(required_models(nlp_profile))
+    extract_skills(ResumeDocument(WARM_UP_TEXT), nlp_profile.name)
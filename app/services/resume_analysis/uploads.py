@@ -0,0 +1,80 @@
+"""Spool uploaded resumes to disk so the pipeline reads them by path.
+
+Reading an upload with ``file.read()`` keeps the whole file in the request
+thread, copies it again when it is pickled to a worker process and once more
+when the extractors wrap it in BytesIO. A spooled upload is copied to a
+temporary file in fixed-size chunks (hashing it on the way, for the result
+cache) and only its path crosses the process boundary; PDFium, pdfplumber and
+zipfile then read the pages and parts they need from disk.
+
+Configuration (environment):
+  - RESUME_SPOOL_DIR: directory for spooled uploads (default: the system temp dir)
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Union
+
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+
+class SpooledUpload:
+    """An upload copied to a named temporary file; removed by close()."""
+
+    def __init__(self, stream: BinaryIO, filename: str, directory: Optional[str] = None,
+                 chunk_size: int = SPOOL_CHUNK_SIZE):
+        self.filename = filename
+        self.size = 0
+        hasher = hashlib.sha256()
+        extension = os.path.splitext(filename or '')[1].lower()
+        fd, self.path = tempfile.mkstemp(prefix='resume-', suffix=extension,
+                                         dir=directory or os.getenv('RESUME_SPOOL_DIR') or None)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    out.write(chunk)
+                    self.size += len(chunk)
+        except BaseException:
+            self.close()
+            raise
+        self.sha256 = hasher.hexdigest()
+
+    @contextmanager
+    def mapped(self) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Read-only memory map of the file (bytes-like; b'' when empty)."""
+        if self.size == 0:
+            yield b''
+            return
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+    def close(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'SpooledUpload':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def spool_upload(file_storage, directory: Optional[str] = None) -> SpooledUpload:
+    """Spool a werkzeug FileStorage (``request.files[...]``) to disk."""
+    return SpooledUpload(file_storage.stream, file_storage.filename, directory)
+
+
+def file_sha256(path: str, chunk_size: int = SPOOL_CHUNK_SIZE) -> str:
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
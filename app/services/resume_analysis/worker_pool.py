@@ -0,0 +1,150 @@
+"""Process pool for the CPU-bound resume pipeline.
+
+spaCy parsing, KeyBERT embedding and pdfplumber extraction hold the GIL, so
+running them on a Flask request thread stalls every other endpoint served by
+the same worker. Jobs are instead sent to a small pool of child processes that
+preload the models once at start-up.
+
+Configuration (environment):
+  - RESUME_POOL_WORKERS: number of child processes (0 runs jobs inline)
+  - RESUME_POOL_MAX_PENDING: jobs allowed in flight before new ones are rejected
+  - RESUME_JOB_TIMEOUT_SECONDS: how long a request waits for its job
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+
+class PoolBusyError(Exception):
+    """Raised when the pool already has the maximum number of pending jobs."""
+
+
+class JobTimeoutError(Exception):
+    """Raised when a job does not finish within its timeout."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _init_worker() -> None:
+    """Runs once in each child: load and warm up the NLP models."""
+    from app.services.resume_analysis.skill_extractor import warm_up_resume_pipeline
+
+    warm_up_resume_pipeline()
+
+
+class ResumeWorkerPool:
+    def __init__(self, workers: int, max_pending: int, timeout: float,
+                 initializer: Optional[Callable[[], None]] = _init_worker):
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self._initializer = initializer
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 'spawn' avoids forking a multi-threaded Flask process.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=self._initializer,
+                )
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue a job, or raise PoolBusyError if max_pending jobs are in flight."""
+        if not self._slots.acquire(blocking=False):
+            raise PoolBusyError("Resume analysis queue is full")
+        with self._lock:
+            self.pending += 1
+
+        if self.workers == 0:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._release()
+            return future
+
+        try:
+            try:
+                future = self._get_executor().submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # A child died (e.g. OOM); start a fresh pool and retry once.
+                self._reset_executor()
+                future = self._get_executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        # A job that times out keeps its slot until the child actually finishes,
+        # so the bound reflects real load on the pool.
+        future.add_done_callback(self._release)
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Submit a job and wait for its result."""
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise JobTimeoutError("Resume analysis timed out")
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise
+
+    def shutdown(self) -> None:
+        self._reset_executor()
+
+
+_pool: Optional[ResumeWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_resume_pool() -> ResumeWorkerPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = _env_int('RESUME_POOL_WORKERS', 2)
+                _pool = ResumeWorkerPool(
+                    workers=workers,
+                    max_pending=_env_int('RESUME_POOL_MAX_PENDING', max(1, workers) * 4),
+                    timeout=_env_float('RESUME_JOB_TIMEOUT_SECONDS', 60.0),
+                )
+                atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,92 @@
+"""Exact-or-partial lookup of a skill name in a skill-keyed map.
+
+Readiness, pathways, gap analysis, course mapping and video recommendations
+all resolve a required skill against a map keyed by skill name the same way:
+the exact (case-insensitive) name, else any key that contains the skill or is
+contained in it ("sql" matches "postgresql", "react native" matches "react").
+SkillMatcher implements it once, memoizes recent answers in a bounded LRU
+(the same skill is looked up for many roles and phases, while module-level
+matchers also see arbitrary user input), and for large maps answers partial
+matches from a SkillContainmentIndex instead of scanning every key. Small
+per-request maps (a user's skills) are scanned: building the index costs more
+than the few hundred lookups a request makes.
+
+The loops it replaces returned whichever partial match came first in dict
+order, which depended on database row order. Here ties are broken
+deterministically: the key closest in length to the skill wins, then the
+alphabetically first.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Generic, Mapping, Optional, TypeVar, Union
+
+from app.services.resume_analysis.ontology_matcher import SkillContainmentIndex
+
+T = TypeVar('T')
+
+# Maps with at least this many keys get a containment index
+INDEX_MIN_KEYS = 256
+
+# Partial-match answers remembered per matcher (least recently used go first)
+MEMO_MAX_ENTRIES = 4096
+
+
+def _normalize(skill) -> str:
+    return str(skill or '').strip().lower()
+
+
+class SkillMatcher(Generic[T]):
+    """Resolves skill names against a fixed ``skill -> value`` map."""
+
+    def __init__(self, values: Mapping[str, T], indexed: Optional[bool] = None,
+                 memo_size: int = MEMO_MAX_ENTRIES):
+        self._values: Dict[str, T] = {}
+        for name, value in values.items():
+            key = _normalize(name)
+            # Blank keys would be "contained" in every skill
+            if key and key not in self._values:
+                self._values[key] = value
+        if indexed is None:
+            indexed = len(self._values) >= INDEX_MIN_KEYS
+        self._index = SkillContainmentIndex(self._values) if indexed else None
+        self._memo_size = max(0, memo_size)
+        self._resolved: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+        # Module-level matchers are shared by request threads
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, values: Union['SkillMatcher[T]', Mapping[str, T]]) -> 'SkillMatcher[T]':
+        """Reuse an existing matcher, or build one for a plain map."""
+        return values if isinstance(values, cls) else cls(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def match(self, skill) -> Optional[str]:
+        """The key ``skill`` resolves to, or None."""
+        query = _normalize(skill)
+        if not query:
+            return None
+        if query in self._values:
+            return query
+        with self._lock:
+            if query in self._resolved:
+                self._resolved.move_to_end(query)
+                return self._resolved[query]
+        if self._index is not None:
+            related = self._index.related(query)
+        else:
+            related = [k for k in self._values if k in query or query in k]
+        key = min(related, key=lambda k: (abs(len(k) - len(query)), k)) if related else None
+        if self._memo_size:
+            with self._lock:
+                self._resolved[query] = key
+                while len(self._resolved) > self._memo_size:
+                    self._resolved.popitem(last=False)
+        return key
+
+    def get(self, skill, default: Optional[T] = None) -> Optional[T]:
+        key = self.match(skill)
+        return self._values[key] if key is not None else default
@@ -0,0 +1,39 @@
+"""Run the suite against a migrated copy of skillgenome.db, never the tracked file.
+
+DATABASE_URI is read when app.config is first imported, so it is set here,
+before any test module (or app.main) is collected. Subprocesses started by
+tests inherit it.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_tmp_dir = None
+
+
+def pytest_configure(config):
+    global _tmp_dir
+    _tmp_dir = tempfile.mkdtemp(prefix='skillgenome-tests-')
+    path = os.path.join(_tmp_dir, 'skillgenome.db')
+    # The tracked file is in WAL mode, so even a read-only connection would
+    # leave -wal/-shm files next to it; immutable opens it without them
+    source = sqlite3.connect(f"file:{os.path.join(ROOT, 'skillgenome.db')}?mode=ro&immutable=1", uri=True)
+    target = sqlite3.connect(path)
+    source.backup(target)
+    source.close()
+    target.close()
+    os.environ['DATABASE_URI'] = f'sqlite:///{path}'
+
+    from app.migrations import run_migrations
+
+    conn = sqlite3.connect(path)
+    run_migrations(conn)
+    conn.close()
+
+
+def pytest_unconfigure(config):
+    if _tmp_dir is not None:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
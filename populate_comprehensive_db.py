@@ -6,6 +6,9 @@ import json
 import sqlite3
 import os
 
+from app.database import DB_PATH
+from app.migrations import ensure_reference_schema
+
 def create_tables(conn):
     cursor = conn.cursor()
 
@@ -429,8 +432,8 @@ def verify_data(conn):
     print(f"  • Course recommendations: {courses_count}")
 
 def main():
-    # Get the database path
-    db_path = 'skillgenome.db'
+    # Get the database path (Config.SQLALCHEMY_DATABASE_URI)
+    db_path = DB_PATH
     
     print("🚀 Starting comprehensive database population...")
     
@@ -448,6 +451,10 @@ def main():
     populate_comprehensive_roles(conn)
     populate_comprehensive_courses(conn)
     
+    # Dropping the tables dropped their index and change-tracking triggers
+    ensure_reference_schema(conn)
+    conn.commit()
+    
     # Verify
     verify_data(conn)
     
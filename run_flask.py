@@ -1,4 +1,6 @@
 from app.main import app
+from app.migrations import run_migrations
 
 if __name__ == '__main__':
+    run_migrations()
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -10,7 +10,24 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.main import app
+from app.database import DB_PATH
 from app.init_db import init_database
+from app.migrations import run_migrations
+
+
+def _should_preload_models() -> bool:
+    return os.getenv('PRELOAD_MODELS', '0').strip().lower() in ('1', 'true', 'yes')
+
+
+def preload_models():
+    """Load and warm up the resume NLP models before accepting traffic"""
+    from app.services.model_manager import model_manager
+    from app.services.resume_analysis.skill_extractor import warm_up_resume_pipeline
+
+    print("\nPreloading NLP models...")
+    warm_up_resume_pipeline()
+    for name, info in model_manager.status().items():
+        print(f"   * {name}: {info['state']} (load {info['load_seconds']}s, warm-up {info['warm_up_seconds']}s)")
 
 def start_server():
     """Initialize database and start server"""
@@ -20,24 +37,36 @@ def start_server():
     print("=" * 70)
     
     # Check if database exists, if not initialize it
-    db_path = os.path.join(os.path.dirname(__file__), 'skillgenome.db')
-    
-    if not os.path.exists(db_path):
+    if not os.path.exists(DB_PATH):
         print("\nDatabase not found. Initializing...")
         init_database()
     else:
-        print("\nDatabase found")
+        applied = run_migrations()
+        print(f"\nDatabase found (migrations applied: {applied or 'none'})")
+    
+    # With the debug reloader only the child process (WERKZEUG_RUN_MAIN) serves
+    # requests, so that is the one that needs the models.
+    if _should_preload_models() and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        preload_models()
+    
+    # Resume async analysis jobs that were queued or running at last shutdown.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        from app.services.resume_analysis.jobs import get_job_runner
+        get_job_runner()
     
     print("\nStarting Flask Server...")
     print("=" * 70)
     print("\nSERVER INFO:")
     print(f"   * Base URL: http://localhost:5000")
     print(f"   * Health Check: http://localhost:5000/health")
+    print(f"   * Readiness: http://localhost:5000/ready")
     print("\nAPI ENDPOINTS:")
     print("   * POST /api/profile - Create user profile")
     print("   * GET  /api/profile/<user_id> - Get user profile")
     print("   * POST /api/profile/<user_id>/skills - Add skill")
-    print("   * POST /api/resume/analyze - Analyze resume")
+    print("   * POST /api/resume/analyze - Analyze resume (async=true for a job id)")
+    print("   * GET  /api/resume/jobs/<job_id> - Async analysis status")
+    print("   * POST /api/resume/batch - Bulk resume analysis (NDJSON stream)")
     print("   * POST /api/gap-analysis/<user_id> - Analyze skill gaps")
     print("   * POST /api/import/linkedin - Import from LinkedIn")
     print("   * GET  /api/import/linkedin/preview - Preview import")
@@ -0,0 +1,116 @@
+import json
+import os
+import pathlib
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+from flask import Flask
+
+from app import database
+from app.api.user_profile import profile_bp
+from app.database import ConnectionPool
+from app.migrations import MIGRATIONS, SCHEMA_PATH, run_migrations
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'bulk.db')
+    conn = sqlite3.connect(path)
+    run_migrations(conn)
+    conn.execute("INSERT INTO users (user_id, username, email) VALUES ('u1', 'ada', 'ada@example.com')")
+    conn.commit()
+    conn.close()
+    pool = ConnectionPool(path, max_size=2)
+    monkeypatch.setattr(database, '_pool', pool)
+    yield path
+    pool.close()
+
+
+@pytest.fixture
+def client(db_path):
+    app = Flask(__name__)
+    database.init_app(app)
+    app.register_blueprint(profile_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def _skills(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('SELECT skill_name, sector_context, confidence, source FROM user_skills ORDER BY id').fetchall()
+    conn.close()
+    return rows
+
+
+def test_bulk_upsert_reports_inserted_and_updated(client, db_path):
+    first = client.post('/api/profile/u1/skills/bulk', json={'skills': [
+        {'skill_name': 'python', 'confidence': 0.4},
+        {'skill_name': 'python', 'sector_context': 'Healthcare', 'confidence': 0.6},
+    ]})
+    assert first.status_code == 201 and (first.json['inserted'], first.json['updated']) == (2, 0)
+
+    second = client.post('/api/profile/u1/skills/bulk', json={'skills': [
+        {'skill_name': 'python', 'confidence': 0.9, 'source': 'resume'},
+        {'skill_name': 'python', 'sector_context': 'Healthcare', 'confidence': 0.7},
+        {'skill_name': 'sql'},
+    ]})
+    assert (second.json['inserted'], second.json['updated']) == (1, 2)
+    assert _skills(db_path) == [
+        ('python', None, 0.9, 'resume'), ('python', 'Healthcare', 0.7, 'manual'), ('sql', None, 0.5, 'manual'),
+    ]
+
+
+def test_a_failing_batch_writes_nothing(client, db_path):
+    response = client.post('/api/profile/u1/skills/bulk', json={'skills': [
+        {'skill_name': 'python'}, {'skill_name': 'sql', 'confidence': 2.0},
+    ]})
+    assert response.status_code == 400
+    assert _skills(db_path) == []
+
+
+def test_migration_keeps_the_newest_skill_duplicated_under_a_null_sector():
+    conn = sqlite3.connect(':memory:')
+    run_migrations(conn, MIGRATIONS[:3])
+    conn.executemany(
+        'INSERT INTO user_skills (user_id, skill_name, sector_context, confidence) VALUES (?, ?, ?, ?)',
+        [('u1', 'python', None, 0.8), ('u1', 'python', None, 0.2), ('u1', 'python', 'Finance', 0.5),
+         ('u1', 'sql', None, 0.4), ('u1', 'sql', '', 0.6)],
+    )
+    assert run_migrations(conn, MIGRATIONS[:4]) == [4]
+    assert conn.execute('SELECT skill_name, sector_context, confidence FROM user_skills ORDER BY id').fetchall() == [
+        ('python', None, 0.2), ('python', 'Finance', 0.5), ('sql', '', 0.6),
+    ]
+
+
+def test_importing_the_app_leaves_an_unmigrated_database_alone(tmp_path):
+    # What the shipped database looked like: schema.sql applied directly
+    path = tmp_path / 'old.db'
+    conn = sqlite3.connect(path)
+    conn.executescript(pathlib.Path(SCHEMA_PATH).read_text(encoding='utf-8'))
+    conn.execute("INSERT INTO users (user_id, username, email) VALUES ('u1', 'ada', 'ada@example.com')")
+    conn.commit()
+    conn.close()
+
+    script = (
+        "import json\n"
+        "from app.main import app\n"
+        "client = app.test_client()\n"
+        "before = client.get('/ready')\n"
+        "migrated = app.test_cli_runner().invoke(args=['migrate'])\n"
+        "after = client.get('/ready')\n"
+        "added = client.post('/api/profile/u1/skills/bulk', json={'skills': [{'skill_name': 'python'}]})\n"
+        "print(json.dumps([before.status_code, before.json, migrated.output,\n"
+        "                  after.json['schema'], added.status_code, added.json]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=pathlib.Path(__file__).parent, capture_output=True, text=True,
+        env={**os.environ, 'DATABASE_URI': f'sqlite:///{path}'}, timeout=120,
+    )
+    status, ready, output, schema, added_status, added = json.loads(result.stdout.strip().splitlines()[-1])
+
+    versions = [m.version for m in MIGRATIONS]
+    assert (status, ready['status'], ready['schema']) == (503, 'unmigrated', {'version': 0, 'pending': versions}), result.stderr
+    assert 'Applied migrations: ' + str(versions) in output
+    assert schema == {'version': versions[-1], 'pending': []}
+    assert (added_status, added['inserted']) == (201, 1)
@@ -0,0 +1,38 @@
+from app.services.resume_analysis.course_mapper import CourseCatalog
+
+
+def _course(title, sector=None):
+    return {'platform': 'Coursera', 'title': title, 'url': f'https://example.com/{title}', 'sector': sector}
+
+
+COURSES = {
+    'SQL': (_course('SQL for Finance', 'Finance'), _course('SQL in Hospitals', 'Healthcare')),
+    'sql': (_course('SQL Basics', 'Technology'),),
+    'postgresql': (_course('PostgreSQL Internals'),),
+    'machine learning': (_course('ML for Clinicians', 'Healthcare'), _course('ML Crash Course')),
+}
+
+
+def test_exact_lookups_ignore_case_and_keep_table_order():
+    catalog = CourseCatalog(COURSES)
+    assert len(catalog) == 3
+    assert [c['title'] for c in catalog.courses_for('Sql')] == ['SQL for Finance', 'SQL in Hospitals', 'SQL Basics']
+    assert catalog.courses_for('sql', limit=1) == [
+        {'platform': 'Coursera', 'title': 'SQL for Finance', 'url': 'https://example.com/SQL for Finance'}
+    ]
+    assert catalog.courses_for('mysql') == []
+    assert catalog.courses_for('deep learning') == []
+
+
+def test_sector_matches_and_general_courses_come_first():
+    catalog = CourseCatalog(COURSES)
+    assert [c['title'] for c in catalog.courses_for('sql', 'healthcare')] == ['SQL in Hospitals', 'SQL Basics', 'SQL for Finance']
+    assert [c['title'] for c in catalog.courses_for('machine learning', 'Finance', limit=1)] == ['ML Crash Course']
+    assert [c['title'] for c in catalog.courses_for('machine learning', 'Healthcare')] == ['ML for Clinicians', 'ML Crash Course']
+
+
+def test_partial_matches_resolve_like_the_skill_matcher():
+    catalog = CourseCatalog(COURSES)
+    assert catalog.resolve('ms sql server', partial=True) == 'sql'
+    assert catalog.resolve('ms sql server') is None
+    assert [c['title'] for c in catalog.courses_for('machine learning ops', partial=True)] == ['ML for Clinicians', 'ML Crash Course']
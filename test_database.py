@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+from flask import Flask, jsonify
+
+from app import database
+from app.database import ConnectionPool, get_db_connection
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=2, timeout=0.2)
+    monkeypatch.setattr(database, '_pool', pool)
+    yield pool
+    pool.close()
+
+
+def test_connections_are_tuned_and_reused(pool, monkeypatch):
+    monkeypatch.setenv('DB_CACHE_SIZE_KB', '4096')
+    conn = pool.acquire()
+    assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    assert conn.execute('PRAGMA cache_size').fetchone()[0] == -4096
+    assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == 30000
+    conn.execute('CREATE TABLE t (x)')
+    conn.execute('INSERT INTO t VALUES (1)')
+    conn.close()
+
+    again = get_db_connection()
+    assert again is conn
+    # Uncommitted work is rolled back on check-in
+    assert again.execute('SELECT count(*) FROM t').fetchone()[0] == 0
+    again.close()
+    again.close()
+    stats = pool.stats()
+    assert (stats['open'], stats['idle'], stats['checkouts'], stats['waits']) == (1, 1, 2, 0)
+
+
+def test_an_exhausted_pool_waits_then_times_out(pool):
+    held = [pool.acquire(), pool.acquire()]
+    threading.Timer(0.05, held[0].close).start()
+    assert pool.acquire() is held[0]
+    with pytest.raises(sqlite3.OperationalError):
+        pool.acquire()
+    assert pool.stats()['waits'] == 2
+
+
+def test_a_request_shares_one_connection(pool):
+    app = Flask(__name__)
+    database.init_app(app)
+
+    @app.route('/twice')
+    def twice():
+        first = get_db_connection()
+        first.close()
+        second = get_db_connection()
+        second.close()
+        return jsonify(same=first is second, idle=pool.stats()['idle'])
+
+    response = app.test_client().get('/twice')
+    assert response.get_json() == {'same': True, 'idle': 0}
+    assert 'db-calls;desc="2"' in response.headers['Server-Timing']
+    assert pool.stats()['idle'] == 1 and pool.stats()['checkouts'] == 1
+
+
+def test_the_database_path_comes_from_the_uri():
+    assert database.database_path('sqlite:///skillgenome.db') == os.path.join(database.PROJECT_ROOT, 'skillgenome.db')
+    assert database.database_path('sqlite:////var/data/sg.db') == '/var/data/sg.db'
+    for uri in ('sqlite://', 'sqlite:///:memory:', 'postgresql://localhost/sg'):
+        with pytest.raises(ValueError):
+            database.database_path(uri)
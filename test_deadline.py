@@ -0,0 +1,65 @@
+import time
+from io import BytesIO
+
+import pytest
+
+from app.services.resume_analysis import skill_extractor
+from app.services.resume_analysis.deadline import Deadline, StageCosts
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.extractor import extract_pdf
+from app.services.resume_analysis.result_cache import ResumeResultCache
+
+
+def _pdf(pages):
+    # reportlab is only needed to build PDF fixtures; skip just those tests without it
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for number in range(pages):
+        pdf.drawString(100, 750, f"Page {number} Python")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_unlimited_deadline_never_skips():
+    deadline = Deadline.after(None)
+    assert deadline.unlimited and deadline.allows(1e9) and deadline.share_used() == 0.0
+
+
+def test_expired_deadline_skips_keybert_then_spacy(monkeypatch):
+    def fail():
+        raise AssertionError('skipped stages must not load their model')
+
+    monkeypatch.setattr(skill_extractor, '_load_nlp', fail)
+    monkeypatch.setattr(skill_extractor, '_load_keybert', fail)
+    deadline = Deadline(expires_at=time.time() - 1, budget=1.0)
+
+    skills = skill_extractor.extract_skills(ResumeDocument('Python and Docker'), 'accurate', deadline)
+    assert {'python', 'docker'} <= set(skills)
+    assert [s['stage'] for s in deadline.skipped] == ['keybert', 'spacy']
+
+
+def test_keybert_goes_first_when_only_spacy_fits(monkeypatch):
+    monkeypatch.setattr(skill_extractor, 'stage_costs', StageCosts({'spacy': 0.0, 'keybert': 1e6}))
+    monkeypatch.setattr(skill_extractor, '_load_nlp', lambda: None)
+    deadline = Deadline.after(30)
+
+    skill_extractor.extract_skills(ResumeDocument('Python'), 'accurate', deadline)
+    assert [s['stage'] for s in deadline.skipped] == ['keybert']
+
+
+def test_pdf_pages_are_capped_when_budget_is_spent():
+    deadline = Deadline(expires_at=time.time() + 1, budget=10.0)
+    text = extract_pdf(_pdf(3), deadline)
+
+    assert 'Page 0' in text and 'Page 1' not in text
+    assert deadline.skipped == [{'stage': 'pdf_pages', 'reason': 'extracted 1 of 3 pages'}]
+    assert extract_pdf(_pdf(3)).count('Python') == 3
+
+
+def test_degraded_results_are_not_cached():
+    cache = ResumeResultCache(max_entries=4)
+    cache.get_or_compute('k', lambda: {'skills': [], 'degraded': True})
+    assert cache.get_or_compute('k', lambda: {'skills': ['full'], 'degraded': False}) == {'skills': ['full'], 'degraded': False}
+    assert cache.get_or_compute('k', lambda: {'skills': ['recomputed']})['skills'] == ['full']
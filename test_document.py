@@ -0,0 +1,26 @@
+import random
+
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.normalizer import normalize_text
+from app.services.resume_analysis.skill_extractor import extract_skill_hits
+
+ALPHABET = ['a', 'B', 'c+', '#', '.', ' ', '\n', '\t', '-', '/', ',', '(', ')', 'é', '_', '1', '  ', ' ', 'İ']
+
+
+def test_normalized_matches_normalize_text():
+    rng = random.Random(11)
+    for _ in range(500):
+        text = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+        document = ResumeDocument(text)
+        assert document.normalized == normalize_text(text), repr(text)
+
+
+def test_hits_point_back_into_source():
+    document = ResumeDocument("Skills:\n  C++, Node.js / REST-APIs\n\nExperience: Machine Learning")
+
+    assert document.normalized == 'skills c++ node.js restapis experience machine learning'
+    start, end = document.source_span(document.normalized.index('restapis'), document.normalized.index(' experience'))
+    assert document.lower[start:end] == 'rest-apis'
+
+    hits = {hit.skill: document.lower[hit.start:hit.end] for hit in extract_skill_hits(document)}
+    assert hits.get('machine learning') == 'machine learning'
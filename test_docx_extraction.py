@@ -0,0 +1,57 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+from docx import Document
+
+from app.services.resume_analysis.extractor import extract_docx
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+MC = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+
+
+def _docx(body, headers=()):
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as package:
+        package.writestr('word/document.xml', f'<w:document xmlns:w="{W}" xmlns:mc="{MC}"><w:body>{body}</w:body></w:document>')
+        for number, header in enumerate(headers, 1):
+            package.writestr(f'word/header{number}.xml', f'<w:hdr xmlns:w="{W}">{header}</w:hdr>')
+    return buffer.getvalue()
+
+
+def _p(text):
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def test_matches_python_docx_on_plain_paragraphs():
+    document = Document()
+    document.add_paragraph('Python developer')
+    document.add_paragraph('')
+    paragraph = document.add_paragraph('Skills:')
+    paragraph.add_run().add_tab()
+    paragraph.add_run('SQL, Docker')
+    buffer = BytesIO()
+    document.save(buffer)
+
+    expected = '\n'.join(p.text for p in Document(BytesIO(buffer.getvalue())).paragraphs if p.text.strip())
+    assert extract_docx(buffer.getvalue()) == expected == 'Python developer\nSkills:\tSQL, Docker'
+
+
+def test_reads_tables_text_boxes_and_headers_in_order():
+    table = f'<w:tbl><w:tr><w:tc>{_p("Languages")}</w:tc><w:tc>{_p("Python")}{_p("Go")}</w:tc></w:tr></w:tbl>'
+    text_box = (
+        '<w:p><w:r><mc:AlternateContent>'
+        f'<mc:Choice><w:drawing><w:txbxContent>{_p("Kubernetes")}</w:txbxContent></w:drawing></mc:Choice>'
+        f'<mc:Fallback><w:pict><w:txbxContent>{_p("Kubernetes")}</w:txbxContent></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r><w:r><w:t>Tools</w:t></w:r></w:p>'
+    )
+    content = _docx(_p('Summary') + table + text_box, headers=[_p('Jane Doe'), _p('Jane Doe')])
+
+    assert extract_docx(content).split('\n') == ['Jane Doe', 'Summary', 'Languages', 'Python', 'Go', 'Kubernetes', 'Tools']
+
+
+def test_rejects_files_that_are_not_docx():
+    with pytest.raises(ValueError):
+        extract_docx(b'not a zip')
+    with pytest.raises(ValueError):
+        extract_docx(_docx('<w:p>'))
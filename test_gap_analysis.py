@@ -0,0 +1,44 @@
+import sqlite3
+
+from app.routes.gap_analysis import generate_recommendations
+from app.services.resume_analysis.course_mapper import CourseCatalog
+
+ROWS = [
+    ('sql', 'Coursera', 'SQL for Finance', 'https://example.com/1', 'Finance'),
+    ('SQL', 'Udemy', 'SQL Basics', 'https://example.com/2', 'Technology'),
+    ('python', 'edX', 'Python in Healthcare', 'https://example.com/3', 'Healthcare'),
+    ('python', 'edX', 'Python 101', 'https://example.com/4', None),
+    ('tableau', 'Coursera', 'Tableau for Banks', 'https://example.com/5', 'Finance'),
+]
+
+
+def _sql_course(conn, skill, sector):
+    """The two queries generate_recommendations used to run per skill."""
+    course = conn.execute("""
+        SELECT platform, title, url FROM courses
+        WHERE LOWER(skill) = LOWER(?) AND (LOWER(sector) = LOWER(?) OR sector IS NULL OR sector = 'Technology')
+        LIMIT 1
+    """, (skill, sector)).fetchone()
+    if not course:
+        course = conn.execute(
+            "SELECT platform, title, url FROM courses WHERE LOWER(skill) = LOWER(?) LIMIT 1", (skill,)
+        ).fetchone()
+    return [dict(zip(('platform', 'title', 'url'), course))] if course else []
+
+
+def test_recommended_courses_match_the_per_skill_queries():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE courses (skill TEXT, platform TEXT, title TEXT, url TEXT, sector TEXT)')
+    conn.executemany('INSERT INTO courses VALUES (?, ?, ?, ?, ?)', ROWS)
+    courses = {}
+    for skill, platform, title, url, sector in ROWS:
+        courses.setdefault(skill, []).append({'platform': platform, 'title': title, 'url': url, 'sector': sector})
+    catalog = CourseCatalog(courses)
+
+    missing = [{'skill': s} for s in ('SQL', 'python', 'tableau', 'rust')]
+    for sector in ('Healthcare', 'Finance', 'technology'):
+        recommendations = generate_recommendations(missing[:3], missing[3:] + missing[:1], [], sector, 'analyst', catalog)
+        found = {(r['priority'], r['skill']): r['courses'] for r in recommendations}
+        expected = {('high', m['skill']): _sql_course(conn, m['skill'], sector) for m in missing[:3]}
+        expected[('low', 'SQL')] = _sql_course(conn, 'SQL', sector)
+        assert found == {key: value for key, value in expected.items() if value}
@@ -0,0 +1,38 @@
+"""Importing the API must stay cheap: no NLP/PDF/DOCX libraries until first use."""
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ('spacy', 'keybert', 'sentence_transformers', 'torch', 'pdfplumber', 'docx', 'numpy')
+
+# Generous enough for slow CI machines; importing app.main takes about one second locally.
+IMPORT_BUDGET_SECONDS = float(os.getenv('IMPORT_BUDGET_SECONDS', '2.5'))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_app_main():
+    root = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        cwd=root, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_app_main_does_not_import_heavy_libraries():
+    result = _import_app_main()
+    loaded = {name.split('.')[0] for name in result['modules']}
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_app_main_import_time_budget():
+    result = _import_app_main()
+    assert result['seconds'] < IMPORT_BUDGET_SECONDS, f"import app.main took {result['seconds']:.2f}s"
@@ -0,0 +1,69 @@
+import ast
+import pathlib
+import sqlite3
+
+import pytest
+
+from app.migrations import MIGRATIONS, applied_versions, run_migrations
+
+ROOT = pathlib.Path(__file__).parent
+QUERY_DIRS = (ROOT / 'app' / 'api', ROOT / 'app' / 'routes')
+
+# Queries built at runtime, with representative SQL for the EXPLAIN check
+DYNAMIC_QUERIES = {
+    ('user_profile.py', 'update_profile'): 'UPDATE users SET name = ?, target_role = ?, last_updated = ? WHERE user_id = ?',
+    ('user_profile.py', 'update_skill'): 'UPDATE user_skills SET confidence = ?, sector_context = ?, evidence = ? WHERE id = ? AND user_id = ?',
+}
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(':memory:')
+    run_migrations(connection)
+    yield connection
+    connection.close()
+
+
+def _queries():
+    """Every SQL statement the blueprints execute, as (location, sql)."""
+    for directory in QUERY_DIRS:
+        for path in sorted(directory.glob('*.py')):
+            for function in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+                if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                for node in ast.walk(function):
+                    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                            and node.func.attr in ('execute', 'executemany') and node.args):
+                        continue
+                    location = (path.name, function.name)
+                    sql = node.args[0]
+                    if isinstance(sql, ast.Constant) and isinstance(sql.value, str):
+                        yield location, sql.value
+                    else:
+                        assert location in DYNAMIC_QUERIES, f'{location}: add a representative query to DYNAMIC_QUERIES'
+                        yield location, DYNAMIC_QUERIES[location]
+
+
+def test_migrations_are_applied_once(conn):
+    assert applied_versions(conn) == [m.version for m in MIGRATIONS]
+    assert run_migrations(conn) == []
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert 'idx_user_skills_user_confidence' in indexes and 'idx_user_skills_user' not in indexes
+
+
+def test_reference_indexes_survive_a_repopulate(conn):
+    # populate_comprehensive_db.py drops and recreates the reference tables
+    conn.execute('DROP TABLE roles')
+    conn.execute('CREATE TABLE roles (id INTEGER PRIMARY KEY, role_name TEXT, category TEXT, skill TEXT, sector TEXT)')
+    assert run_migrations(conn) == []
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_roles_role_name'").fetchone()
+
+
+def test_blueprint_queries_use_indexes(conn):
+    queries = list(_queries())
+    assert len(queries) > 30
+    for location, sql in queries:
+        plan = conn.execute(f'EXPLAIN QUERY PLAN {sql}', (None,) * sql.count('?')).fetchall()
+        for detail in (row[-1] for row in plan):
+            full_scan = detail.startswith('SCAN ') and 'INDEX' not in detail and 'INTEGER PRIMARY KEY' not in detail
+            assert not full_scan and 'USE TEMP B-TREE' not in detail, f'{location}: {detail}\n{sql}'
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from app.services.model_manager import FAILED, READY, UNAVAILABLE, ModelManager
+
+
+def test_concurrent_first_use_loads_once():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    manager = ModelManager()
+    manager.register('slow', loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(manager.get('slow'))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+    assert manager.status()['slow']['state'] == READY
+
+
+def test_preload_warms_up_and_reports_failures():
+    warmed = []
+
+    def missing():
+        raise ImportError('not installed')
+
+    def broken():
+        raise RuntimeError('boom')
+
+    manager = ModelManager()
+    manager.register('ok', lambda: 'model', warm_up=warmed.append)
+    manager.register('missing', missing)
+    manager.register('broken', broken)
+    assert manager.is_ready()
+
+    status = manager.preload()
+    assert warmed == ['model']
+    assert status['ok']['warm_up_seconds'] is not None
+    assert status['missing']['state'] == UNAVAILABLE
+    assert status['broken']['state'] == FAILED
+    assert manager.get('broken') is None
+    assert manager.is_ready()
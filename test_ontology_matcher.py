@@ -0,0 +1,54 @@
+import random
+
+from app.services.resume_analysis.ontology_matcher import (
+    OntologyHit,
+    OntologyMatcher,
+    SkillContainmentIndex,
+    substring_occurrences,
+)
+
+
+def test_finds_hits_with_offsets():
+    matcher = OntologyMatcher(["python", "machine learning", "learning"])
+    text = "built machine learning models in python"
+    hits = matcher.find_all(text)
+    assert OntologyHit("machine learning", 6, 22) in hits
+    assert OntologyHit("learning", 14, 22) in hits
+    assert OntologyHit("python", 33, 39) in hits
+    for hit in hits:
+        assert text[hit.start:hit.end] == hit.skill
+
+
+def test_respects_word_boundaries():
+    matcher = OntologyMatcher(["c", "c++", "r", "go", "node.js"])
+    skills = matcher.match("expert in c++ and node.js. good at cargo").skills
+    assert skills == {"c++", "node.js"}
+
+
+def test_multi_word_skill_from_scattered_words():
+    matcher = OntologyMatcher(["data analysis"])
+    assert matcher.match("analysis of large data sets").skills == {"data analysis"}
+    assert matcher.match("analysis only").skills == set()
+
+
+def test_containment_index_matches_bidirectional_substring_scan():
+    skills = ["java", "javascript", "c", "c++", "r", "machine learning", "sql", "mysql", "node.js", "go"]
+    index = SkillContainmentIndex(skills)
+    phrases = [
+        "javascript developer", "java", "script", "ml", "learning", "sq", "my",
+        "c", "node", "a", "xyz", "postgresql database", "machine learning engineer", "",
+    ]
+    for phrase in phrases:
+        expected = {s for s in skills if s in phrase or phrase in s}
+        assert index.related(phrase) == expected, phrase
+
+
+def test_substring_occurrences_match_str_count_and_find():
+    rng = random.Random(5)
+    needles = ['a', 'aa', 'aba', 'java', 'javascript', 'c++', 'b a']
+    for _ in range(300):
+        text = ''.join(rng.choice(['a', 'b', ' ', 'java', 'script', 'c++', 'c']) for _ in range(rng.randint(0, 30)))
+        occurrences = substring_occurrences(needles, text)
+        for needle in needles:
+            positions = [i for i in range(len(text)) if text.startswith(needle, i)]
+            assert occurrences[needle] == (text.count(needle), positions), (needle, text)
@@ -0,0 +1,70 @@
+from io import BytesIO
+
+import pytest
+
+from app.services.resume_analysis.deadline import Deadline
+from app.services.resume_analysis import extractor
+from app.services.resume_analysis.extractor import (
+    LAYOUT_MODE,
+    TEXT_MODE,
+    _iter_pages_parallel,
+    extract_pdf,
+)
+from app.services.resume_analysis.worker_pool import ResumeWorkerPool
+
+# reportlab builds the PDF fixtures; it is not an app requirement
+canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+
+
+def _pdf(pages):
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for number in range(pages):
+        pdf.drawString(100, 750, f"Page {number} Python developer")
+        pdf.drawString(100, 730, "Skills: SQL, Docker")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_text_mode_reads_the_same_words_as_layout_mode():
+    content = _pdf(3)
+    layout = extract_pdf(content, mode=LAYOUT_MODE, max_pages=0, max_chars=0)
+    text = extract_pdf(content, mode=TEXT_MODE, max_pages=0, max_chars=0)
+    assert layout.split() == text.split()
+    assert layout.count('Python') == 3
+
+
+def test_page_and_character_caps_stop_early():
+    content = _pdf(5)
+    deadline = Deadline()
+    text = extract_pdf(content, deadline, mode=TEXT_MODE, max_pages=2, max_chars=0)
+    assert 'Page 1' in text and 'Page 2' not in text
+    assert deadline.skipped == [{'stage': 'pdf_pages', 'reason': 'page cap: read 2 of 5 pages'}]
+    assert not deadline.degraded
+
+    text = extract_pdf(content, mode=TEXT_MODE, max_pages=0, max_chars=10)
+    assert text == 'Page 0 Pyt'
+
+
+def test_parallel_ranges_are_yielded_in_page_order():
+    pool = ResumeWorkerPool(workers=0, max_pending=1, timeout=5, initializer=None)
+    pages = list(_iter_pages_parallel(_pdf(5), TEXT_MODE, 5, 2, pool))
+    assert [page.split()[1] for page in pages] == ['0', '1', '2', '3', '4']
+
+
+def _has_page_pool():
+    return extractor._get_page_pool() is not None
+
+
+def test_resume_workers_read_pdfs_without_a_page_pool(monkeypatch):
+    # A page pool created in a worker would keep it from ever exiting
+    monkeypatch.setenv('PDF_PAGE_WORKERS', '2')
+    monkeypatch.setattr(extractor, '_page_pool', None)
+    pool = ResumeWorkerPool(workers=1, max_pending=1, timeout=30, initializer=None)
+    try:
+        assert pool.run(_has_page_pool) is False
+    finally:
+        pool.shutdown()
+    assert _has_page_pool()
+    extractor._page_pool.shutdown()
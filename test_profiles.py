@@ -0,0 +1,41 @@
+import pytest
+
+from app.services.resume_analysis import skill_extractor
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.profiles import (
+    DEFAULT_PROFILE,
+    UnknownProfileError,
+    benchmark_profiles,
+    get_profile,
+    load_fixtures,
+)
+
+
+def test_profile_resolution(monkeypatch):
+    monkeypatch.delenv('NLP_PROFILE', raising=False)
+    assert get_profile().name == DEFAULT_PROFILE
+    monkeypatch.setenv('NLP_PROFILE', 'balanced')
+    assert get_profile().name == 'balanced'
+    assert get_profile(' FAST ').name == 'fast'
+    with pytest.raises(UnknownProfileError):
+        get_profile('turbo')
+
+
+def test_fast_profile_never_loads_models(monkeypatch):
+    def fail():
+        raise AssertionError('fast profile must not load NLP models')
+
+    monkeypatch.setattr(skill_extractor, '_load_nlp', fail)
+    monkeypatch.setattr(skill_extractor, '_load_keybert', fail)
+    skills = skill_extractor.extract_skills(ResumeDocument('Python and Docker on AWS'), 'fast')
+    assert {'python', 'docker', 'aws'} <= set(skills)
+
+
+def test_benchmark_reports_latency_and_recall():
+    fixtures = load_fixtures()
+    assert fixtures and all(f['skills'] for f in fixtures)
+
+    report = benchmark_profiles(fixtures, names=['fast'], repeat=1)
+    assert 0.0 < report['fast']['recall'] <= 1.0
+    assert report['fast']['latency_ms'] >= 0.0
+    assert report['fast']['models'] == {}
@@ -0,0 +1,33 @@
+import random
+
+from app.services.readiness import RoleSkillMatrix, compute_core_fit, compute_role_readiness
+from app.services.skill_matcher import SkillMatcher
+
+ROLES = {
+    'backend developer': {'sector': 'Technology', 'foundation': ('python', 'sql'), 'core': ('django', 'docker', 'sql'),
+                          'advanced': ('kubernetes',), 'projects': ('rest api',)},
+    'data scientist': {'sector': 'Technology', 'foundation': ('Python', 'statistics'), 'core': ('pandas', 'numpy'),
+                       'advanced': ('deep learning',)},
+    'frontend developer': {'sector': 'Technology', 'foundation': ('html', 'css', 'javascript'), 'core': ('react',)},
+    'portfolio reviewer': {'sector': 'Design', 'projects': ('portfolio',)},
+}
+
+
+def test_scores_match_the_per_role_functions():
+    matrix = RoleSkillMatrix(ROLES)
+    vocabulary = sorted({s.lower() for r in ROLES.values() for k, v in r.items() if k != 'sector' for s in v})
+    rng = random.Random(3)
+    for _ in range(100):
+        user = {s: round(rng.random(), 2) for s in rng.sample(vocabulary + ['postgresql', 'reactjs'], rng.randint(0, 10))}
+        scores = matrix.score(SkillMatcher(user))
+        for role, reqs in ROLES.items():
+            assert scores[role] == {**compute_core_fit(reqs, user), **compute_role_readiness(reqs, user)}
+
+
+def test_top_roles_skip_roles_without_core_skills_and_keep_ties_in_order():
+    matrix = RoleSkillMatrix(ROLES)
+    scores = matrix.score({'python': 0.9, 'html': 0.9, 'portfolio': 1.0})
+    top = [role for role, _ in RoleSkillMatrix.top_roles(scores, 5)]
+    assert top == ['data scientist', 'frontend developer', 'backend developer']
+    assert scores['backend developer']['total_required'] == 5
+    assert [role for role, _ in RoleSkillMatrix.top_roles(scores, 1)] == ['data scientist']
@@ -0,0 +1,120 @@
+import sqlite3
+
+import pytest
+
+from app.migrations import ensure_reference_schema
+from app.services import reference_data
+from app.services.reference_data import ReferenceDataCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'ref.db')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE ontology (id INTEGER PRIMARY KEY, skill TEXT NOT NULL UNIQUE);
+        CREATE TABLE roles (id INTEGER PRIMARY KEY, role_name TEXT, category TEXT, skill TEXT, sector TEXT);
+        CREATE TABLE courses (id INTEGER PRIMARY KEY, skill TEXT, platform TEXT, title TEXT, url TEXT, sector TEXT);
+        CREATE TABLE user_skills (id INTEGER PRIMARY KEY, skill_name TEXT);
+        INSERT INTO ontology (skill) VALUES ('python'), ('sql');
+        INSERT INTO roles (role_name, category, skill, sector) VALUES
+            ('data analyst', 'foundation', 'sql', 'Technology'),
+            ('data analyst', 'core', 'python', 'Technology');
+        INSERT INTO courses (skill, platform, title, url, sector) VALUES
+            ('sql', 'Coursera', 'SQL Basics', 'https://example.com/sql', 'Technology');
+    """)
+    ensure_reference_schema(conn)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _cache(path):
+    def connect():
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+    return ReferenceDataCache(connect)
+
+
+def test_snapshot_is_built_once(db_path):
+    cache = _cache(db_path)
+    first = cache.get()
+    assert first.ontology == ('python', 'sql')
+    assert first.roles['data analyst']['foundation'] == ('sql',)
+    assert first.courses['sql'][0]['title'] == 'SQL Basics'
+    assert cache.get() is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_unrelated_writes_keep_snapshot(db_path):
+    cache = _cache(db_path)
+    first = cache.get()
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO user_skills (skill_name) VALUES ('python')")
+    conn.commit()
+    conn.close()
+    assert cache.get() is first
+    assert cache.misses == 1
+
+
+def test_reference_writes_refresh_snapshot(db_path):
+    cache = _cache(db_path)
+    first = cache.get()
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO ontology (skill) VALUES ('docker')")
+    conn.commit()
+    conn.close()
+    second = cache.get()
+    assert second is not first
+    assert 'docker' in second.ontology
+    assert cache.misses == 2
+
+
+def test_a_write_racing_the_snapshot_is_picked_up(db_path, monkeypatch):
+    # As in production (app.database), so a writer can commit while the snapshot is read
+    sqlite3.connect(db_path).execute('PRAGMA journal_mode=WAL').connection.close()
+    read_snapshot = reference_data._read_snapshot
+
+    def read_then_write(conn, version):
+        snapshot = read_snapshot(conn, version)
+        # Another process commits after the snapshot was read
+        writer = sqlite3.connect(db_path)
+        writer.execute("INSERT INTO ontology (skill) VALUES ('docker')")
+        writer.commit()
+        writer.close()
+        return snapshot
+
+    cache = _cache(db_path)
+    monkeypatch.setattr(reference_data, '_read_snapshot', read_then_write)
+    assert cache.get().ontology == ('python', 'sql')
+    monkeypatch.setattr(reference_data, '_read_snapshot', read_snapshot)
+    assert 'docker' in cache.get().ontology
+
+
+def _schema(path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute('SELECT type, name FROM sqlite_master ORDER BY name').fetchall()
+    conn.close()
+    return rows
+
+
+def test_reading_never_changes_the_schema(db_path):
+    # An unmigrated database: no version row, no triggers
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+        DROP TRIGGER trg_ontology_INSERT_refversion;
+        DROP TABLE reference_data_version;
+    ''')
+    conn.close()
+    before = _schema(db_path)
+
+    cache = _cache(db_path)
+    first = cache.get()
+    assert _schema(db_path) == before
+    # Without the triggers any commit forces a rebuild, so changes still show
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO ontology (skill) VALUES ('docker')")
+    conn.commit()
+    conn.close()
+    assert 'docker' in cache.get().ontology and cache.misses == 2
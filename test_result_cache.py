@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app.migrations import run_migrations
+from app.services.resume_analysis.result_cache import ResumeResultCache
+
+
+def test_lru_hits_and_eviction():
+    cache = ResumeResultCache(max_entries=2)
+    calls = []
+
+    def compute(value):
+        def run():
+            calls.append(value)
+            return {'value': value}
+        return run
+
+    assert cache.get_or_compute('a', compute('a')) == {'value': 'a'}
+    assert cache.get_or_compute('a', compute('a')) == {'value': 'a'}
+    cache.get_or_compute('b', compute('b'))
+    cache.get_or_compute('c', compute('c'))
+    cache.get_or_compute('a', compute('a'))
+    assert calls == ['a', 'b', 'c', 'a']
+    assert cache.stats()['hits'] == 1
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    cache = ResumeResultCache(max_entries=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {'skills': []}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert cache.coalesced + cache.hits == 4
+
+
+def test_failures_are_not_cached():
+    cache = ResumeResultCache(max_entries=4)
+
+    def boom():
+        raise RuntimeError('pipeline failed')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('k', boom)
+    assert cache.get_or_compute('k', lambda: {'ok': True}) == {'ok': True}
+
+
+def test_sqlite_tier_survives_new_cache_instance(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    run_migrations(sqlite3.connect(path))
+    connect = lambda: sqlite3.connect(path)
+    first = ResumeResultCache(max_entries=0, use_sqlite=True, connect=connect)
+    first.get_or_compute('k', lambda: {'skills': [{'name': 'python', 'confidence': 1.0}]})
+
+    second = ResumeResultCache(max_entries=4, use_sqlite=True, connect=connect)
+    result = second.get_or_compute('k', lambda: pytest.fail('should be served from SQLite'))
+    assert result['skills'][0]['name'] == 'python'
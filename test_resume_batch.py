@@ -0,0 +1,171 @@
+import io
+import json
+import pathlib
+import threading
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+from docx import Document
+from flask import Flask
+
+from app.api import resume
+from app.services.resume_analysis import batch
+from app.services.resume_analysis.pipeline import analyze_resume_batch
+from app.services.resume_analysis.result_cache import ResumeResultCache
+from app.services.resume_analysis.uploads import SpooledUpload
+from app.services.resume_analysis.worker_pool import ResumeWorkerPool
+
+
+def _docx(text):
+    buffer = io.BytesIO()
+    document = Document()
+    document.add_paragraph(text)
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _spooled(filename, content, directory):
+    return SpooledUpload(io.BytesIO(content), filename, str(directory))
+
+
+def test_collect_unpacks_zip_and_flags_unsupported_files(tmp_path):
+    member = _docx('Python')
+    archive = _zip({
+        'a.docx': member,
+        'notes.txt': b'hello',
+        '__MACOSX/._a.docx': b'',
+        'big.pdf': b'x' * 200_000,
+    })
+    uploads = [_spooled('cvs.zip', archive, tmp_path), _spooled('b.docx', _docx('SQL'), tmp_path)]
+    entries = batch.collect_batch_files(uploads, max_file_bytes=100_000)
+
+    assert [(name, error) for name, _, error in entries] == [
+        ('a.docx', None),
+        ('notes.txt', 'Unsupported file format'),
+        ('big.pdf', 'File too large'),
+        ('b.docx', None),
+    ]
+    # The member was streamed out to a spooled file of its own
+    unpacked = entries[0][1]
+    with open(unpacked.path, 'rb') as f:
+        assert f.read() == member
+    assert entries[3][1] is uploads[1]
+
+
+def test_collect_caps_the_uncompressed_total_and_removes_members(tmp_path):
+    # Compresses to a few KB, unpacks to 3 x 400 KB
+    archive = _zip({f'{i}.pdf': b'x' * 400_000 for i in range(3)})
+    uploads = [_spooled('cvs.zip', archive, tmp_path)]
+
+    with pytest.raises(batch.BatchUploadError, match='Batch too large'):
+        batch.collect_batch_files(uploads, max_file_bytes=500_000, max_total_bytes=1_000_000)
+    # Only the spooled ZIP itself is left for its owner to close
+    assert sorted(p.name for p in tmp_path.iterdir()) == [pathlib.Path(uploads[0].path).name]
+
+
+def test_analyze_resume_batch_keeps_order_and_isolates_failures():
+    results = analyze_resume_batch([
+        (_docx('Skills: Python, Docker'), 'a.docx'),
+        (b'not a document', 'broken.docx'),
+        (_docx('Experience with SQL'), 'c.docx'),
+    ])
+
+    assert 'python' in {s['name'] for s in results[0]['skills']}
+    assert 'error' in results[1]
+    assert 'sql' in {s['name'] for s in results[2]['skills']}
+    assert set(results[0]['timings']) == {'extract_text', 'normalize_text', 'extract_skills', 'score_skills'}
+
+
+def test_stream_yields_every_file_once_and_reuses_cache(monkeypatch, tmp_path):
+    pool = ResumeWorkerPool(workers=0, max_pending=1, timeout=5, initializer=None)
+    monkeypatch.setattr(batch, 'get_resume_pool', lambda: pool)
+    monkeypatch.setattr(batch, 'get_resume_cache', lambda cache=ResumeResultCache(max_entries=16): cache)
+
+    entries = [(f'{i}.docx', _spooled(f'{i}.docx', _docx(f'Python project {i}'), tmp_path), None) for i in range(5)]
+    entries.append(('x.txt', None, 'Unsupported file format'))
+
+    lines = list(batch.stream_batch_results(entries, chunk_size=2))
+    assert sorted(line['index'] for line in lines) == list(range(6))
+    assert [line['status'] for line in lines if line['index'] == 5] == ['error']
+
+    def recompute(files):
+        pytest.fail('cached results should not be recomputed')
+
+    monkeypatch.setattr(batch, 'analyze_resume_batch', recompute)
+    again = list(batch.stream_batch_results(entries[:5], chunk_size=2))
+    assert all(line['status'] == 'ok' for line in again)
+
+
+class _ScriptedPool:
+    """Hands out futures that are started and finished on a timer: (start, finish or None)."""
+
+    def __init__(self, timeout, script):
+        self.timeout = timeout
+        self.script = list(script)
+        self.timers = []
+
+    def submit(self, fn, files, profile=None):
+        future = Future()
+        start, finish = self.script.pop(0)
+        self.timers.append(threading.Timer(start, future.set_running_or_notify_cancel))
+        if finish is not None:
+            results = [{'skills': [], 'filename': name} for _, name in files]
+            self.timers.append(threading.Timer(finish, future.set_result, [results]))
+        for timer in self.timers[-2:]:
+            timer.start()
+        return future
+
+
+def test_stream_times_out_each_chunk_from_when_it_starts(monkeypatch, tmp_path):
+    # a.docx hangs; b.docx waits 0.5s behind it, then takes 0.75s, which is
+    # past a.docx's deadline but within its own
+    pool = _ScriptedPool(timeout=1.0, script=[(0, None), (0.5, 1.25)])
+    monkeypatch.setattr(batch, 'get_resume_pool', lambda: pool)
+    monkeypatch.setattr(batch, 'get_resume_cache', lambda cache=ResumeResultCache(max_entries=16): cache)
+
+    entries = [(name, _spooled(name, _docx(name), tmp_path), None) for name in ('a.docx', 'b.docx')]
+    lines = {line['filename']: line for line in batch.stream_batch_results(entries, chunk_size=1)}
+
+    assert lines['a.docx']['status'] == 'error' and 'timed out' in lines['a.docx']['error']
+    assert lines['b.docx']['status'] == 'ok'
+
+
+def test_batch_route_spools_uploads_and_removes_them_when_done(monkeypatch, tmp_path):
+    monkeypatch.setenv('RESUME_SPOOL_DIR', str(tmp_path))
+    seen = []
+
+    def fake_stream(entries, profile):
+        for index, (filename, upload, error) in enumerate(entries):
+            seen.append(sorted(p.name for p in tmp_path.iterdir()))
+            yield {'index': index, 'filename': filename, 'status': 'ok' if upload else 'error'}
+
+    monkeypatch.setattr(resume, 'stream_batch_results', fake_stream)
+    app = Flask(__name__)
+    app.register_blueprint(resume.bp, url_prefix='/api/resume')
+    client = app.test_client()
+
+    archive = _zip({'a.docx': _docx('Python'), 'b.docx': _docx('SQL')})
+    response = client.post('/api/resume/batch', data={'files': [
+        (io.BytesIO(archive), 'cvs.zip'), (io.BytesIO(_docx('Go')), 'c.docx'),
+    ]})
+    # Not closed: finishing the stream alone removes the files
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [line['filename'] for line in lines] == ['a.docx', 'b.docx', 'c.docx']
+    # Two uploads plus two unpacked members while streaming; nothing afterwards
+    assert len(seen[0]) == 4
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setenv('RESUME_BATCH_MAX_TOTAL_MB', '0')
+    response = client.post('/api/resume/batch', data={'files': [(io.BytesIO(archive), 'cvs.zip')]})
+    assert response.status_code == 413 and 'Batch too large' in response.json['error']
+    assert list(tmp_path.iterdir()) == []
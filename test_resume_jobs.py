@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+import time
+
+from app.migrations import run_migrations
+from app.services.resume_analysis.jobs import COMPLETED, FAILED, QUEUED, RUNNING, ResumeJobRunner
+
+
+def _wait_for(runner, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = runner.get(job_id)
+        if job['status'] in (COMPLETED, FAILED):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f'job {job_id} did not finish')
+
+
+def _runner(tmp_path, analyze):
+    path = str(tmp_path / 'jobs.db')
+    run_migrations(sqlite3.connect(path))
+    return ResumeJobRunner(
+        analyze=analyze,
+        build_payload=lambda skills, role: [{'phase': role, 'skills': [{'name': s['name'], 'courses': []} for s in skills]}],
+        connect=lambda: sqlite3.connect(path),
+        max_workers=1,
+    )
+
+
+def test_job_completes_with_timings_and_result(tmp_path):
+    runner = _runner(tmp_path, lambda content, filename, profile: {
+        'skills': [{'name': 'python', 'confidence': 0.9}],
+        'timings': {'extract_text': 0.01},
+    })
+    job_id = runner.submit(b'resume', 'cv.pdf', 'data scientist')
+    job = _wait_for(runner, job_id)
+
+    assert job['status'] == COMPLETED
+    assert job['skills'] == [{'name': 'python', 'confidence': 0.9}]
+    assert job['roadmap'][0]['phase'] == 'data scientist'
+    assert {'queue_wait', 'extract_text', 'roadmap'} <= set(job['timings'])
+    assert runner.get('missing') is None
+
+
+def test_failed_job_records_error(tmp_path):
+    def boom(content, filename, profile):
+        raise RuntimeError('bad file')
+
+    runner = _runner(tmp_path, boom)
+    job = _wait_for(runner, runner.submit(b'x', 'cv.pdf', 'general'))
+    assert job['status'] == FAILED
+    assert job['error'] == 'bad file'
+
+
+def test_unfinished_jobs_are_recovered(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    _runner(tmp_path, lambda c, f, p: {'skills': []})
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO resume_jobs (job_id, status, filename, target_role, content) VALUES (?, ?, 'cv.pdf', 'general', ?)",
+        [('a', RUNNING, b'x'), ('b', QUEUED, b'y'), ('c', COMPLETED, None)],
+    )
+    conn.commit()
+    conn.close()
+
+    seen = []
+    runner = _runner(tmp_path, lambda content, filename, profile: seen.append(content) or {'skills': []})
+    assert runner.recover() == 2
+    assert _wait_for(runner, 'a')['status'] == COMPLETED
+    assert _wait_for(runner, 'b')['status'] == COMPLETED
+    assert sorted(seen) == [b'x', b'y']
+
+
+def test_only_expired_leases_are_recovered(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    _runner(tmp_path, lambda c, f, p: {'skills': []})
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO resume_jobs (job_id, status, owner, heartbeat, content) VALUES (?, ?, 'other', ?, x'00')",
+        [('live', RUNNING, time.time()), ('dead', RUNNING, time.time() - 3600)],
+    )
+    conn.commit()
+    conn.close()
+
+    seen = []
+    runner = _runner(tmp_path, lambda content, filename, profile: seen.append(filename) or {'skills': []})
+    assert runner.recover() == 1
+    assert _wait_for(runner, 'dead')['status'] == COMPLETED
+    assert runner.get('live')['status'] == RUNNING
+
+
+def test_a_job_recovered_by_two_runners_runs_once(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    _runner(tmp_path, lambda c, f, p: {'skills': []})
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO resume_jobs (job_id, status, filename, content) VALUES ('a', ?, 'cv.pdf', x'00')", (QUEUED,))
+    conn.commit()
+    conn.close()
+
+    runs = []
+    runners = [_runner(tmp_path, lambda content, filename, profile: runs.append(1) or {'skills': []}) for _ in range(2)]
+    # Both runners pick the job up at the same time; only one claim succeeds
+    threads = [threading.Thread(target=runner._run, args=('a', time.time())) for runner in runners]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert runs == [1]
+    assert runners[1].get('a')['status'] == COMPLETED
@@ -0,0 +1,76 @@
+import random
+import re
+
+from app.services.resume_analysis.document import ResumeDocument
+from app.services.resume_analysis.scorer import (
+    SECTION_WINDOW,
+    ResumeSections,
+    _has_action_verb_nearby,
+    score_skills,
+)
+
+FRAGMENTS = [
+    'experience', 'work', 'project', 'skills', 'built', 'developed', ':', ' :', ' ', '\n', 'ed',
+    'python', 'sql', 'x', 'Work', 'PROJECTS', 'İ', 'homework', 'experienced', '-', 'created',
+]
+
+
+def _detect_section(text, section_name):
+    patterns = [
+        rf"\b{section_name}\b",
+        rf"{section_name}:",
+        rf"{section_name}\s*:",
+    ]
+    return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+
+
+def _get_section_weight(text, skill_pos):
+    """The per-window regex scan ResumeSections.section_weight replaced, as an oracle."""
+    start_pos = max(0, skill_pos - SECTION_WINDOW)
+    end_pos = min(len(text), skill_pos + SECTION_WINDOW)
+    context = text.lower()[start_pos:end_pos]
+
+    if _detect_section(context, "experience") or _detect_section(context, "work"):
+        return 3.0
+    if _detect_section(context, "project"):
+        return 2.0
+    return 1.0
+
+
+def _random_text(rng, length):
+    return ''.join(rng.choice(FRAGMENTS) for _ in range(length))
+
+
+def test_section_index_matches_window_scans():
+    rng = random.Random(7)
+    for _ in range(300):
+        text = _random_text(rng, rng.randint(0, 120))
+        sections = ResumeSections(text)
+        for pos in range(0, len(text.lower()), 3):
+            assert sections.section_weight(pos) == _get_section_weight(text, pos), (text, pos)
+            assert sections.has_action_verb_nearby(pos) == _has_action_verb_nearby(text, '', pos), (text, pos)
+
+
+def test_score_skills_unchanged_on_resume_text():
+    text = (
+        "SKILLS: Python, SQL, Docker\n" + "filler " * 60 +
+        "\nEXPERIENCE\nBuilt data pipelines in Python and SQL at Acme.\n" + "filler " * 60 +
+        "\nProjects\nDeveloped a Docker based deploy tool; python scripting."
+    )
+    scores = {s.name: s.confidence for s in score_skills(['python', 'sql', 'docker', 'rust'], ResumeDocument(text))}
+
+    # Reference values from the per-window implementation
+    assert scores == {'python': 1.0, 'sql': 0.5263157894736842, 'docker': 0.31578947368421056}
+
+
+def test_scores_count_substring_occurrences():
+    # "java" also occurs inside "javascript" and "sql" inside "postgresql",
+    # as they always have for str.count
+    text = (
+        "Experience\nBuilt JavaScript and Java services on PostgreSQL.\n" + "filler " * 40 +
+        "\nSkills: java, sql, react native"
+    )
+    scores = {s.name: s.confidence for s in score_skills(['java', 'javascript', 'sql', 'react', 'go'], ResumeDocument(text))}
+
+    # Reference values from the per-skill str.count/str.find implementation
+    assert scores == {'java': 1.0, 'sql': 0.4, 'javascript': 0.2, 'react': 0.04}
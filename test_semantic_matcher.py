@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.services.resume_analysis.semantic_matcher import (
+    OntologyEmbeddings,
+    load_or_build_ontology_embeddings,
+)
+
+VECTORS = {
+    "python": [1.0, 0.0, 0.0],
+    "machine learning": [0.0, 1.0, 0.0],
+    "ml": [0.0, 0.95, 0.1],
+    "cooking": [0.0, 0.0, 1.0],
+}
+
+
+def fake_embed(phrases):
+    return np.array([VECTORS[p] for p in phrases])
+
+
+def test_match_uses_cosine_threshold():
+    embeddings = OntologyEmbeddings.build(["python", "machine learning"], fake_embed)
+    assert embeddings.match(fake_embed(["ml"]), threshold=0.9) == {"machine learning"}
+    assert embeddings.match(fake_embed(["cooking"]), threshold=0.9) == set()
+
+
+def test_embeddings_are_cached_on_disk(tmp_path):
+    path = str(tmp_path / "ontology.npz")
+    calls = []
+
+    def counting_embed(phrases):
+        calls.append(list(phrases))
+        return fake_embed(phrases)
+
+    skills = ["python", "machine learning"]
+    first = load_or_build_ontology_embeddings(skills, counting_embed, path=path)
+    second = load_or_build_ontology_embeddings(skills, counting_embed, path=path)
+    assert len(calls) == 1
+    assert second.skills == first.skills
+    assert np.allclose(second.matrix, first.matrix)
+
+    load_or_build_ontology_embeddings(skills + ["cooking"], counting_embed, path=path)
+    assert len(calls) == 2
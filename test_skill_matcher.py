@@ -0,0 +1,63 @@
+import random
+
+from app.services.readiness import compute_core_fit, compute_role_readiness
+from app.services.skill_matcher import SkillMatcher
+
+
+def _linear_candidates(required, user_skills):
+    """What the replaced loops accepted: the exact key, else any partial match."""
+    required = required.strip().lower()
+    if required in user_skills:
+        return {required}
+    return {k for k in user_skills if required in k or k in required}
+
+
+def test_agrees_with_the_linear_scan():
+    rng = random.Random(7)
+    vocabulary = ['python', 'sql', 'postgresql', 'react', 'react native', 'java', 'javascript',
+                  'c', 'c++', 'c#', 'go', 'docker', 'aws', 'machine learning', 'ml', 'git', 'github']
+    for _ in range(200):
+        user_skills = {s: rng.random() for s in rng.sample(vocabulary, rng.randint(0, 8))}
+        scanned, indexed = SkillMatcher(user_skills, indexed=False), SkillMatcher(user_skills, indexed=True)
+        for required in vocabulary + ['Python ', 'ms sql server', 'rust', 'node.js']:
+            candidates = _linear_candidates(required, user_skills)
+            key = scanned.match(required)
+            assert indexed.match(required) == key
+            if candidates:
+                assert key in candidates
+                assert scanned.get(required) == user_skills[key]
+            else:
+                assert key is None and scanned.get(required) is None
+
+
+def test_ties_are_broken_independently_of_insertion_order():
+    skills = ['javascript', 'java', 'typescript', 'postgresql', 'mysql']
+    winners = set()
+    for seed in range(10):
+        random.Random(seed).shuffle(skills)
+        for indexed in (False, True):
+            matcher = SkillMatcher({s: 0.9 for s in skills}, indexed=indexed)
+            winners.add((matcher.match('sql'), matcher.match('java script'), matcher.match('script')))
+    assert winners == {('mysql', 'java', 'javascript')}
+
+
+def test_readiness_accepts_a_shared_matcher():
+    role = {'foundation': ['Python', 'SQL'], 'core': ['Docker', 'Kubernetes'], 'advanced': ['AWS']}
+    user = {'python': 0.9, 'postgresql': 0.4, 'docker': 0.7}
+    matcher = SkillMatcher(user)
+    assert compute_role_readiness(role, user) == compute_role_readiness(role, matcher) == {
+        'skills_total': 5, 'skills_complete': 2, 'skills_weak': 1, 'skills_missing': 2, 'readiness_score': 40.0,
+    }
+    assert compute_core_fit(role, matcher)['matched_required'] == 2
+    assert SkillMatcher({' ': 1.0}).get('python') is None
+
+
+def test_memo_keeps_only_recent_lookups():
+    matcher = SkillMatcher({'postgresql': 1, 'react native': 2}, memo_size=2)
+    assert matcher.match('sql') == 'postgresql'
+    assert matcher.match('react') == 'react native'
+    assert matcher.match('sql') == 'postgresql'
+    assert matcher.match('rust') is None
+    # 'react' was least recently used; exact matches are never memoized
+    assert list(matcher._resolved) == ['sql', 'rust']
+    assert matcher.match('postgresql') == 'postgresql' and len(matcher._resolved) == 2
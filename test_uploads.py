@@ -0,0 +1,64 @@
+import hashlib
+import os
+import sqlite3
+from io import BytesIO
+
+import pytest
+from docx import Document
+
+from app.services.resume_analysis.extractor import extract_text
+from app.services.resume_analysis.result_cache import resume_cache_key
+from app.services.resume_analysis.uploads import SpooledUpload
+
+
+def _docx():
+    document = Document()
+    document.add_paragraph('Python developer with SQL and Docker')
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf():
+    # reportlab is only needed to build PDF fixtures; skip just those tests without it
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.drawString(100, 750, 'Python developer with SQL and Docker')
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_spooled_upload_is_hashed_in_chunks_and_removed(tmp_path):
+    content = os.urandom(200_000)
+    with SpooledUpload(BytesIO(content), 'resume.pdf', str(tmp_path), chunk_size=4096) as upload:
+        assert upload.size == len(content)
+        assert upload.sha256 == hashlib.sha256(content).hexdigest()
+        assert upload.path.endswith('.pdf')
+        with open(upload.path, 'rb') as f:
+            assert f.read() == content
+        with upload.mapped() as view:
+            assert view[:10] == content[:10]
+    assert not os.path.exists(upload.path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_extractors_read_a_spooled_path_like_bytes(tmp_path):
+    for filename, content in (('resume.docx', _docx()), ('resume.pdf', _pdf())):
+        with SpooledUpload(BytesIO(content), filename, str(tmp_path)) as upload:
+            assert extract_text(upload.path, filename) == extract_text(content, filename)
+            assert resume_cache_key(upload.path, filename, 'fast') == resume_cache_key(content, filename, 'fast')
+            assert resume_cache_key(upload.path, filename, 'fast', upload.sha256) == resume_cache_key(content, filename, 'fast')
+
+
+def test_mapped_upload_binds_as_a_blob(tmp_path):
+    with SpooledUpload(BytesIO(b'%PDF-1.4 resume'), 'resume.pdf', str(tmp_path)) as upload:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE jobs (content BLOB)')
+        with upload.mapped() as content:
+            conn.execute('INSERT INTO jobs (content) VALUES (?)', (content,))
+        assert conn.execute('SELECT content FROM jobs').fetchone()[0] == b'%PDF-1.4 resume'
+
+    with SpooledUpload(BytesIO(b''), 'empty.pdf', str(tmp_path)) as upload:
+        with upload.mapped() as content:
+            assert content == b''
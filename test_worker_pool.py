@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from app.services.resume_analysis.worker_pool import JobTimeoutError, PoolBusyError, ResumeWorkerPool
+
+
+def test_runs_jobs_in_child_process():
+    pool = ResumeWorkerPool(workers=1, max_pending=2, timeout=30, initializer=None)
+    try:
+        assert pool.run(pow, 2, 10) == 1024
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()
+
+
+def test_rejects_jobs_beyond_queue_depth_and_times_out():
+    pool = ResumeWorkerPool(workers=1, max_pending=1, timeout=30, initializer=None)
+    try:
+        with pytest.raises(JobTimeoutError):
+            pool.run(time.sleep, 1.0, timeout=0.05)
+        # The timed-out job still occupies the only slot until it finishes.
+        with pytest.raises(PoolBusyError):
+            pool.submit(pow, 2, 2)
+        time.sleep(1.5)
+        assert pool.run(pow, 2, 2) == 4
+    finally:
+        pool.shutdown()
+
+
+def test_inline_mode_runs_on_calling_thread():
+    pool = ResumeWorkerPool(workers=0, max_pending=1, timeout=1, initializer=None)
+    assert pool.run(pow, 3, 2) == 9
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 1, 0)
+    assert pool.pending == 0